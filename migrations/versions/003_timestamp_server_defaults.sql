@@ -0,0 +1,117 @@
+-- Migration: 003_timestamp_server_defaults
+-- Date: 2026-10-18
+-- Description: Let the database stamp created_at / updated_at
+--
+-- The models now declare server_default=func.now() on every created_at /
+-- updated_at column and on the other "stamped at insert" timestamps, so rows inserted through Core or COPY (bypassing the
+-- ORM-side default) still get their timestamps. create_all() emits the
+-- default for fresh databases; this script adds it to existing tables.
+--
+-- updated_at is still refreshed by the ORM (onupdate=func.now()); no
+-- trigger is installed.
+
+ALTER TABLE device_groups ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE device_groups ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE hypervisors ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE hypervisors ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE ldap_configs ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE ldap_configs ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE permissions ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE permissions ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE roles ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE roles ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE storage_backends ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE storage_backends ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE system_settings ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE user_groups ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE user_groups ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE workflows ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE workflows ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE approval_rules ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE approval_rules ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE nodes ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE nodes ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE sync_jobs ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE sync_jobs ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE templates ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE templates ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE users ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE users ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE api_keys ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE approvals ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE clone_sessions ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE health_alerts ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE iscsi_luns ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE iscsi_luns ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE node_events ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE node_state_logs ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE refresh_tokens ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE template_versions ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE user_group_members ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE workflow_executions ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE approval_votes ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE migration_claims ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE partition_operations ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE node_health_snapshots ALTER COLUMN timestamp SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE file_checksums ALTER COLUMN computed_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE sync_job_runs ALTER COLUMN started_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE step_results ALTER COLUMN started_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE sync_states ALTER COLUMN last_modified SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE sync_conflicts ALTER COLUMN detected_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE audit_logs ALTER COLUMN timestamp SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE disk_info ALTER COLUMN scanned_at SET DEFAULT CURRENT_TIMESTAMP;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- ALTER TABLE device_groups ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE device_groups ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE hypervisors ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE hypervisors ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE ldap_configs ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE ldap_configs ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE permissions ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE permissions ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE roles ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE roles ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE storage_backends ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE storage_backends ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE system_settings ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE user_groups ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE user_groups ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE workflows ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE workflows ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE approval_rules ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE approval_rules ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE nodes ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE nodes ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE sync_jobs ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE sync_jobs ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE templates ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE templates ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE users ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE users ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE api_keys ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE approvals ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE clone_sessions ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE health_alerts ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE iscsi_luns ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE iscsi_luns ALTER COLUMN updated_at DROP DEFAULT;
+-- ALTER TABLE node_events ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE node_state_logs ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE refresh_tokens ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE template_versions ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE user_group_members ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE workflow_executions ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE approval_votes ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE migration_claims ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE partition_operations ALTER COLUMN created_at DROP DEFAULT;
+-- ALTER TABLE node_health_snapshots ALTER COLUMN timestamp DROP DEFAULT;
+-- ALTER TABLE file_checksums ALTER COLUMN computed_at DROP DEFAULT;
+-- ALTER TABLE sync_job_runs ALTER COLUMN started_at DROP DEFAULT;
+-- ALTER TABLE step_results ALTER COLUMN started_at DROP DEFAULT;
+-- ALTER TABLE sync_states ALTER COLUMN last_modified DROP DEFAULT;
+-- ALTER TABLE sync_conflicts ALTER COLUMN detected_at DROP DEFAULT;
+-- ALTER TABLE audit_logs ALTER COLUMN timestamp DROP DEFAULT;
+-- ALTER TABLE disk_info ALTER COLUMN scanned_at DROP DEFAULT;
@@ -0,0 +1,42 @@
+-- Migration: 004_jsonb_payload_columns
+-- Date: 2026-10-18
+-- Description: Store structured payload columns as native JSONB
+--
+-- This migration converts:
+-- 1. node_state_logs.metadata_json
+-- 2. node_events.metadata_json (plus a GIN index for key predicates)
+-- 3. storage_backends.config_json
+-- 4. approvals.action_data_json and approvals.metadata_json
+--
+-- The columns previously held JSON-encoded TEXT, so the cast is lossless.
+-- SQLite databases need no change: the JSON column type reads the existing
+-- text values as-is.
+
+ALTER TABLE node_state_logs
+    ALTER COLUMN metadata_json TYPE JSONB USING metadata_json::jsonb;
+
+ALTER TABLE node_events
+    ALTER COLUMN metadata_json TYPE JSONB USING metadata_json::jsonb;
+
+CREATE INDEX IF NOT EXISTS ix_node_events_metadata_gin
+    ON node_events USING gin (metadata_json);
+
+ALTER TABLE storage_backends
+    ALTER COLUMN config_json TYPE JSONB USING config_json::jsonb;
+
+ALTER TABLE approvals
+    ALTER COLUMN action_data_json TYPE JSONB USING action_data_json::jsonb;
+
+ALTER TABLE approvals
+    ALTER COLUMN metadata_json TYPE JSONB USING metadata_json::jsonb;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- DROP INDEX IF EXISTS ix_node_events_metadata_gin;
+-- ALTER TABLE approvals ALTER COLUMN metadata_json TYPE TEXT USING metadata_json::text;
+-- ALTER TABLE approvals ALTER COLUMN action_data_json TYPE TEXT USING action_data_json::text;
+-- ALTER TABLE storage_backends ALTER COLUMN config_json TYPE TEXT USING config_json::text;
+-- ALTER TABLE node_events ALTER COLUMN metadata_json TYPE TEXT USING metadata_json::text;
+-- ALTER TABLE node_state_logs ALTER COLUMN metadata_json TYPE TEXT USING metadata_json::text;
@@ -0,0 +1,195 @@
+-- Migration: 005_partition_event_logs
+-- Date: 2026-10-18
+-- Description: Range-partition node_events and node_state_logs by month
+--
+-- This migration (PostgreSQL only):
+-- 1. Rebuilds node_events and node_state_logs as tables partitioned by
+--    RANGE (created_at), copying existing rows across
+-- 2. Adds a DEFAULT partition so inserts never fail if maintenance lags
+-- 3. Adds pureboot_ensure_log_partitions() to pre-create monthly partitions
+-- 4. Adds pureboot_drop_log_partitions() so retention is a DROP TABLE per
+--    month instead of a DELETE over the whole history
+--
+-- Partitioned tables must include the partition key in their primary key,
+-- so the physical PK becomes (id, created_at). The ORM keeps mapping `id`
+-- alone as the identity, which stays unique because ids are UUIDs.
+--
+-- The application calls pureboot_ensure_log_partitions() at startup and
+-- monthly from its scheduler (src/core/partition_job.py). Re-running this
+-- file's function definitions is safe on an already partitioned database.
+
+BEGIN;
+
+-- ============================================
+-- Partition maintenance functions
+-- ============================================
+
+-- A month that was missed has its rows in the DEFAULT partition, and
+-- CREATE TABLE ... PARTITION OF fails while the default holds rows for the
+-- new range. Missing months are therefore built as plain tables, the rows
+-- are moved out of the default partition, and the table is then attached.
+CREATE OR REPLACE FUNCTION pureboot_ensure_log_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS VOID AS $$
+DECLARE
+    parent TEXT;
+    month_start DATE;
+    month_end DATE;
+    partition_name TEXT;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY['node_events', 'node_state_logs'] LOOP
+        FOR i IN 0..months_ahead LOOP
+            month_start := (date_trunc('month', now()) + make_interval(months => i))::date;
+            month_end := (month_start + INTERVAL '1 month')::date;
+            partition_name := format('%s_%s', parent, to_char(month_start, 'YYYY_MM'));
+            CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                partition_name, parent
+            );
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM %I WHERE created_at >= %L AND created_at < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                parent || '_default', month_start, month_end, partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                parent, partition_name, month_start, month_end
+            );
+        END LOOP;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION pureboot_drop_log_partitions(retention_months INTEGER DEFAULT 6)
+RETURNS VOID AS $$
+DECLARE
+    parent TEXT;
+    child RECORD;
+    cutoff TEXT;
+BEGIN
+    cutoff := to_char(date_trunc('month', now()) - make_interval(months => retention_months), 'YYYY_MM');
+    FOREACH parent IN ARRAY ARRAY['node_events', 'node_state_logs'] LOOP
+        FOR child IN
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = parent
+              AND c.relname ~ ('^' || parent || '_[0-9]{4}_[0-9]{2}$')
+              AND right(c.relname, 7) < cutoff
+        LOOP
+            EXECUTE format('DROP TABLE IF EXISTS %I', child.relname);
+        END LOOP;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================
+-- node_events
+-- ============================================
+
+ALTER TABLE node_events RENAME TO node_events_unpartitioned;
+ALTER INDEX IF EXISTS ix_node_events_node_id RENAME TO ix_node_events_unpartitioned_node_id;
+ALTER INDEX IF EXISTS ix_node_events_event_type RENAME TO ix_node_events_unpartitioned_event_type;
+ALTER INDEX IF EXISTS ix_node_events_metadata_gin RENAME TO ix_node_events_unpartitioned_metadata_gin;
+
+CREATE TABLE node_events (
+    id VARCHAR(36) NOT NULL,
+    node_id VARCHAR(36) NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+    event_type VARCHAR(30) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    message TEXT,
+    progress INTEGER,
+    metadata_json JSONB,
+    ip_address VARCHAR(45),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE node_events_default PARTITION OF node_events DEFAULT;
+
+CREATE INDEX ix_node_events_node_id ON node_events (node_id);
+CREATE INDEX ix_node_events_event_type ON node_events (event_type);
+CREATE INDEX ix_node_events_metadata_gin ON node_events USING gin (metadata_json);
+
+-- ============================================
+-- node_state_logs
+-- ============================================
+
+ALTER TABLE node_state_logs RENAME TO node_state_logs_unpartitioned;
+ALTER INDEX IF EXISTS ix_node_state_logs_node_id RENAME TO ix_node_state_logs_unpartitioned_node_id;
+
+CREATE TABLE node_state_logs (
+    id VARCHAR(36) NOT NULL,
+    node_id VARCHAR(36) NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+    from_state VARCHAR(20) NOT NULL,
+    to_state VARCHAR(20) NOT NULL,
+    triggered_by VARCHAR(20) NOT NULL,
+    user_id VARCHAR(36),
+    comment TEXT,
+    metadata_json JSONB,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE node_state_logs_default PARTITION OF node_state_logs DEFAULT;
+
+CREATE INDEX ix_node_state_logs_node_id ON node_state_logs (node_id);
+
+-- ============================================
+-- Create monthly partitions and copy history
+-- ============================================
+
+-- Partitions covering existing history
+DO $$
+DECLARE
+    parent TEXT;
+    oldest DATE;
+    month_start DATE;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY['node_events', 'node_state_logs'] LOOP
+        EXECUTE format('SELECT date_trunc(''month'', min(created_at))::date FROM %I',
+                       parent || '_unpartitioned') INTO oldest;
+        month_start := COALESCE(oldest, date_trunc('month', now())::date);
+        WHILE month_start <= date_trunc('month', now())::date LOOP
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                format('%s_%s', parent, to_char(month_start, 'YYYY_MM')), parent,
+                month_start, (month_start + INTERVAL '1 month')::date
+            );
+            month_start := (month_start + INTERVAL '1 month')::date;
+        END LOOP;
+    END LOOP;
+END $$;
+
+SELECT pureboot_ensure_log_partitions(3);
+
+INSERT INTO node_events
+    SELECT id, node_id, event_type, status, message, progress,
+           metadata_json, ip_address, created_at
+    FROM node_events_unpartitioned;
+
+INSERT INTO node_state_logs
+    SELECT id, node_id, from_state, to_state, triggered_by, user_id,
+           comment, metadata_json, created_at
+    FROM node_state_logs_unpartitioned;
+
+DROP TABLE node_events_unpartitioned;
+DROP TABLE node_state_logs_unpartitioned;
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- Recreate plain tables from the partitioned ones, e.g.:
+-- CREATE TABLE node_events_plain (LIKE node_events INCLUDING DEFAULTS);
+-- INSERT INTO node_events_plain SELECT * FROM node_events;
+-- DROP TABLE node_events;  -- drops all partitions
+-- ALTER TABLE node_events_plain RENAME TO node_events;
+-- ALTER TABLE node_events ADD PRIMARY KEY (id);
+-- (repeat for node_state_logs, then recreate the indexes)
+-- DROP FUNCTION IF EXISTS pureboot_ensure_log_partitions(INTEGER);
+-- DROP FUNCTION IF EXISTS pureboot_drop_log_partitions(INTEGER);
@@ -0,0 +1,83 @@
+-- Migration: 006_native_enum_columns
+-- Date: 2026-10-18
+-- Description: Store small fixed-vocabulary columns as native ENUM types
+--
+-- Converts node state/arch/boot_mode and the status/vote columns of
+-- storage_backends, iscsi_luns, sync_jobs, sync_job_runs, approval_votes
+-- and hypervisors from VARCHAR to PostgreSQL ENUM types (4 bytes per value).
+-- The stored values are unchanged. SQLite keeps VARCHAR columns.
+--
+-- Any row holding a value outside the vocabulary makes the cast fail;
+-- check with e.g. SELECT DISTINCT state FROM nodes; before applying.
+
+BEGIN;
+
+-- ============================================
+-- Enum types
+-- ============================================
+
+CREATE TYPE hypervisor_status AS ENUM ('online', 'offline', 'error', 'unknown');
+CREATE TYPE backend_status AS ENUM ('online', 'offline', 'error', 'unknown');
+CREATE TYPE node_state AS ENUM ('discovered', 'pending', 'installing', 'install_failed', 'installed', 'active', 'reprovision', 'deprovisioning', 'migrating', 'serving_source', 'cloning_target', 'retired');
+CREATE TYPE node_arch AS ENUM ('x86_64', 'arm64', 'aarch64');
+CREATE TYPE boot_mode AS ENUM ('bios', 'uefi', 'pi');
+CREATE TYPE sync_job_status AS ENUM ('idle', 'running', 'synced', 'failed');
+CREATE TYPE lun_status AS ENUM ('creating', 'ready', 'active', 'error', 'deleting');
+CREATE TYPE sync_run_status AS ENUM ('running', 'success', 'failed');
+CREATE TYPE vote_choice AS ENUM ('approve', 'reject');
+
+-- ============================================
+-- Column conversions
+-- ============================================
+
+ALTER TABLE hypervisors
+    ALTER COLUMN status TYPE hypervisor_status USING status::hypervisor_status;
+
+ALTER TABLE storage_backends
+    ALTER COLUMN status TYPE backend_status USING status::backend_status;
+
+ALTER TABLE nodes
+    ALTER COLUMN state TYPE node_state USING state::node_state;
+
+ALTER TABLE nodes
+    ALTER COLUMN arch TYPE node_arch USING arch::node_arch;
+
+ALTER TABLE nodes
+    ALTER COLUMN boot_mode TYPE boot_mode USING boot_mode::boot_mode;
+
+ALTER TABLE sync_jobs
+    ALTER COLUMN status TYPE sync_job_status USING status::sync_job_status;
+
+ALTER TABLE iscsi_luns
+    ALTER COLUMN status TYPE lun_status USING status::lun_status;
+
+ALTER TABLE sync_job_runs
+    ALTER COLUMN status TYPE sync_run_status USING status::sync_run_status;
+
+ALTER TABLE approval_votes
+    ALTER COLUMN vote TYPE vote_choice USING vote::vote_choice;
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- ALTER TABLE hypervisors ALTER COLUMN status TYPE VARCHAR(20) USING status::text;
+-- ALTER TABLE storage_backends ALTER COLUMN status TYPE VARCHAR(20) USING status::text;
+-- ALTER TABLE nodes ALTER COLUMN state TYPE VARCHAR(20) USING state::text;
+-- ALTER TABLE nodes ALTER COLUMN arch TYPE VARCHAR(20) USING arch::text;
+-- ALTER TABLE nodes ALTER COLUMN boot_mode TYPE VARCHAR(20) USING boot_mode::text;
+-- ALTER TABLE sync_jobs ALTER COLUMN status TYPE VARCHAR(20) USING status::text;
+-- ALTER TABLE iscsi_luns ALTER COLUMN status TYPE VARCHAR(20) USING status::text;
+-- ALTER TABLE sync_job_runs ALTER COLUMN status TYPE VARCHAR(20) USING status::text;
+-- ALTER TABLE approval_votes ALTER COLUMN vote TYPE VARCHAR(20) USING vote::text;
+-- DROP TYPE IF EXISTS hypervisor_status;
+-- DROP TYPE IF EXISTS backend_status;
+-- DROP TYPE IF EXISTS node_state;
+-- DROP TYPE IF EXISTS node_arch;
+-- DROP TYPE IF EXISTS boot_mode;
+-- DROP TYPE IF EXISTS sync_job_status;
+-- DROP TYPE IF EXISTS lun_status;
+-- DROP TYPE IF EXISTS sync_run_status;
+-- DROP TYPE IF EXISTS vote_choice;
@@ -0,0 +1,28 @@
+-- Migration: 007_inet_ip_columns
+-- Date: 2026-10-18
+-- Description: Store node / event IP addresses as native INET
+--
+-- Converts nodes.ip_address, nodes.previous_ip_address and
+-- node_events.ip_address from VARCHAR(45) to INET (7 bytes for IPv4,
+-- 19 for IPv6) with correct ordering and subnet operators (<<, >>=).
+-- SQLite keeps VARCHAR(45).
+--
+-- Rows holding something other than an IP literal make the cast fail;
+-- NULL them out first if needed.
+
+ALTER TABLE nodes
+    ALTER COLUMN ip_address TYPE INET USING ip_address::inet;
+
+ALTER TABLE nodes
+    ALTER COLUMN previous_ip_address TYPE INET USING previous_ip_address::inet;
+
+ALTER TABLE node_events
+    ALTER COLUMN ip_address TYPE INET USING ip_address::inet;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- ALTER TABLE node_events ALTER COLUMN ip_address TYPE VARCHAR(45) USING host(ip_address);
+-- ALTER TABLE nodes ALTER COLUMN previous_ip_address TYPE VARCHAR(45) USING host(previous_ip_address);
+-- ALTER TABLE nodes ALTER COLUMN ip_address TYPE VARCHAR(45) USING host(ip_address);
@@ -0,0 +1,33 @@
+-- Migration: 008_binary_mac_address
+-- Date: 2026-10-18
+-- Description: Store nodes.mac_address as raw bytes
+--
+-- Converts nodes.mac_address from VARCHAR(17) to BYTEA. Real MAC addresses
+-- become their 6 raw bytes (vs 17 characters of text), shrinking the column
+-- and its unique index. Raspberry Pi placeholder identifiers ("pi-<serial>")
+-- are kept as their ASCII bytes. The ORM's MacAddress type converts back to
+-- the colon-separated form on read. SQLite databases are converted at
+-- startup by src/db/migrations.py.
+
+BEGIN;
+
+ALTER TABLE nodes
+    ALTER COLUMN mac_address TYPE BYTEA USING
+        CASE
+            WHEN lower(mac_address) ~ '^([0-9a-f]{2}:){5}[0-9a-f]{2}$'
+                THEN decode(replace(lower(mac_address), ':', ''), 'hex')
+            ELSE convert_to(mac_address, 'UTF8')
+        END;
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- ALTER TABLE nodes ALTER COLUMN mac_address TYPE VARCHAR(17) USING
+--     CASE
+--         WHEN length(mac_address) = 6
+--             THEN regexp_replace(encode(mac_address, 'hex'), '(..)(?!$)', '\1:', 'g')
+--         ELSE convert_from(mac_address, 'UTF8')
+--     END;
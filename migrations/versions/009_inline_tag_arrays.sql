@@ -0,0 +1,61 @@
+-- Migration: 009_inline_tag_arrays
+-- Date: 2026-10-18
+-- Description: Fold node_tags / user_group_tags into TEXT[] columns
+--
+-- This migration:
+-- 1. Adds nodes.tags and user_groups.tags as TEXT[] with GIN indexes, so
+--    "nodes tagged X" is a single index scan (tags @> ARRAY['x']) with no
+--    join
+-- 2. Copies existing tag rows into the new columns
+-- 3. Drops the one-row-per-tag tables
+--
+-- SQLite databases are converted at startup by src/db/migrations.py.
+
+BEGIN;
+
+ALTER TABLE nodes ADD COLUMN tags TEXT[] NOT NULL DEFAULT '{}';
+ALTER TABLE user_groups ADD COLUMN tags TEXT[] NOT NULL DEFAULT '{}';
+
+UPDATE nodes n
+SET tags = t.tags
+FROM (
+    SELECT node_id, array_agg(tag ORDER BY tag) AS tags
+    FROM node_tags
+    GROUP BY node_id
+) t
+WHERE t.node_id = n.id;
+
+UPDATE user_groups g
+SET tags = t.tags
+FROM (
+    SELECT user_group_id, array_agg(tag ORDER BY tag) AS tags
+    FROM user_group_tags
+    GROUP BY user_group_id
+) t
+WHERE t.user_group_id = g.id;
+
+CREATE INDEX ix_nodes_tags_gin ON nodes USING gin (tags);
+CREATE INDEX ix_user_groups_tags_gin ON user_groups USING gin (tags);
+
+DROP TABLE node_tags;
+DROP TABLE user_group_tags;
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- CREATE TABLE node_tags (
+--     id VARCHAR(36) PRIMARY KEY,
+--     node_id VARCHAR(36) NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+--     tag VARCHAR(50) NOT NULL,
+--     CONSTRAINT uq_node_tag UNIQUE (node_id, tag)
+-- );
+-- INSERT INTO node_tags (id, node_id, tag)
+--     SELECT gen_random_uuid()::text, id, unnest(tags) FROM nodes;
+-- (same for user_group_tags / user_groups)
+-- DROP INDEX IF EXISTS ix_nodes_tags_gin;
+-- DROP INDEX IF EXISTS ix_user_groups_tags_gin;
+-- ALTER TABLE nodes DROP COLUMN tags;
+-- ALTER TABLE user_groups DROP COLUMN tags;
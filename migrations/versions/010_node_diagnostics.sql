@@ -0,0 +1,35 @@
+-- Migration: 010_node_diagnostics
+-- Date: 2026-10-18
+-- Description: Move nodes.last_install_error into node_diagnostics
+--
+-- Splits the large, rarely read install error text off the nodes row into
+-- a 1:1 node_diagnostics table, so node list / dashboard / boot lookups no
+-- longer read it. install_attempts, state_changed_at and last_seen_at stay
+-- on nodes: they are written on every boot and used in filters and health
+-- scoring.
+--
+-- SQLite databases are converted at startup by src/db/migrations.py.
+
+BEGIN;
+
+CREATE TABLE node_diagnostics (
+    node_id VARCHAR(36) PRIMARY KEY REFERENCES nodes(id) ON DELETE CASCADE,
+    last_install_error TEXT
+);
+
+INSERT INTO node_diagnostics (node_id, last_install_error)
+    SELECT id, last_install_error FROM nodes
+    WHERE last_install_error IS NOT NULL;
+
+ALTER TABLE nodes DROP COLUMN last_install_error;
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- ALTER TABLE nodes ADD COLUMN last_install_error TEXT;
+-- UPDATE nodes n SET last_install_error = d.last_install_error
+--     FROM node_diagnostics d WHERE d.node_id = n.id;
+-- DROP TABLE node_diagnostics;
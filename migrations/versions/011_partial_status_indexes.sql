@@ -0,0 +1,38 @@
+-- Migration: 011_partial_status_indexes
+-- Date: 2026-10-18
+-- Description: Replace full status indexes with partial indexes on live rows
+--
+-- The status columns of approvals, storage_backends, iscsi_luns, sync_jobs
+-- and hypervisors were indexed over every value. The config tables are
+-- small and only filtered from admin list views, and resolved approvals
+-- pile up but are never filtered by status, so those indexes mostly held
+-- dead history. The one status query that runs repeatedly is covered by a
+-- partial index:
+--   - ix_approvals_pending: pending approvals by expires_at (expiry job,
+--     vote queue)
+--
+-- SQLite databases are converted at startup by src/db/migrations.py.
+
+BEGIN;
+
+DROP INDEX IF EXISTS ix_approvals_status;
+DROP INDEX IF EXISTS ix_storage_backends_status;
+DROP INDEX IF EXISTS ix_iscsi_luns_status;
+DROP INDEX IF EXISTS ix_sync_jobs_status;
+DROP INDEX IF EXISTS ix_hypervisors_status;
+
+CREATE INDEX IF NOT EXISTS ix_approvals_pending
+    ON approvals (expires_at) WHERE status = 'pending';
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- DROP INDEX IF EXISTS ix_approvals_pending;
+-- CREATE INDEX ix_approvals_status ON approvals (status);
+-- CREATE INDEX ix_storage_backends_status ON storage_backends (status);
+-- CREATE INDEX ix_iscsi_luns_status ON iscsi_luns (status);
+-- CREATE INDEX ix_sync_jobs_status ON sync_jobs (status);
+-- CREATE INDEX ix_hypervisors_status ON hypervisors (status);
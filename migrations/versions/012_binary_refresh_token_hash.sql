@@ -0,0 +1,26 @@
+-- Migration: 012_binary_refresh_token_hash
+-- Date: 2026-10-18
+-- Description: Store refresh_tokens.token_hash as a raw SHA-256 digest
+--
+-- token_hash is the unique lookup key on every token refresh. It held the
+-- 64-char hex form in a VARCHAR(255); as BYTEA it is the 32-byte digest,
+-- halving the column and its unique index. SQLite databases are converted
+-- at startup by src/db/migrations.py.
+--
+-- users.password_hash stays variable-length text: it holds bcrypt hashes,
+-- the SHA-256 hex fallback used when bcrypt is unavailable, and the
+-- LDAP_AUTH placeholder.
+
+BEGIN;
+
+ALTER TABLE refresh_tokens
+    ALTER COLUMN token_hash TYPE BYTEA USING decode(token_hash, 'hex');
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- ALTER TABLE refresh_tokens
+--     ALTER COLUMN token_hash TYPE VARCHAR(255) USING encode(token_hash, 'hex');
@@ -0,0 +1,31 @@
+-- Migration: 013_lun_node_fk_set_null
+-- Date: 2026-10-18
+-- Description: Clear LUN assignments when their node is deleted
+--
+-- Node child collections (events, state logs, ...) now use
+-- passive_deletes=True, so the ORM issues a single DELETE for the node and
+-- relies on ON DELETE CASCADE for the children. iscsi_luns.assigned_node_id
+-- was the only nullable reference to nodes without an ON DELETE action;
+-- a LUN outlives the node it was assigned to, so it is set to NULL.
+--
+-- SQLite databases are rebuilt at startup by src/db/migrations.py.
+
+BEGIN;
+
+ALTER TABLE iscsi_luns
+    DROP CONSTRAINT IF EXISTS iscsi_luns_assigned_node_id_fkey;
+ALTER TABLE iscsi_luns
+    ADD CONSTRAINT iscsi_luns_assigned_node_id_fkey
+    FOREIGN KEY (assigned_node_id) REFERENCES nodes (id) ON DELETE SET NULL;
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- ALTER TABLE iscsi_luns
+--     DROP CONSTRAINT IF EXISTS iscsi_luns_assigned_node_id_fkey;
+-- ALTER TABLE iscsi_luns
+--     ADD CONSTRAINT iscsi_luns_assigned_node_id_fkey
+--     FOREIGN KEY (assigned_node_id) REFERENCES nodes (id);
@@ -0,0 +1,38 @@
+-- Migration: 014_association_reverse_indexes
+-- Date: 2026-10-18
+-- Description: Index the non-leading key column of association tables
+--
+-- The association tables have composite primary keys, and a B-tree on
+-- (a, b) only serves lookups on a. The primary keys already lead with the
+-- hot direction: user_group_nodes is (user_group_id, node_id) for
+-- UserGroup.nodes, and user_group_members stays (user_id, user_group_id)
+-- for the per-login group lookups. This adds an index on the second column
+-- of each table. It serves the reverse relationships (Node.user_groups,
+-- UserGroup.members, ...) and ON DELETE CASCADE from that parent.
+--
+-- SQLite databases get these indexes at startup from src/db/migrations.py.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_role_permissions_permission_id
+    ON role_permissions (permission_id);
+CREATE INDEX IF NOT EXISTS ix_user_group_members_user_group_id
+    ON user_group_members (user_group_id);
+CREATE INDEX IF NOT EXISTS ix_user_group_roles_role_id
+    ON user_group_roles (role_id);
+CREATE INDEX IF NOT EXISTS ix_user_group_device_groups_device_group_id
+    ON user_group_device_groups (device_group_id);
+CREATE INDEX IF NOT EXISTS ix_user_group_nodes_node_id
+    ON user_group_nodes (node_id);
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- DROP INDEX IF EXISTS ix_role_permissions_permission_id;
+-- DROP INDEX IF EXISTS ix_user_group_members_user_group_id;
+-- DROP INDEX IF EXISTS ix_user_group_roles_role_id;
+-- DROP INDEX IF EXISTS ix_user_group_device_groups_device_group_id;
+-- DROP INDEX IF EXISTS ix_user_group_nodes_node_id;
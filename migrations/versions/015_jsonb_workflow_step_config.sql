@@ -0,0 +1,23 @@
+-- Migration: 015_jsonb_workflow_step_config
+-- Date: 2026-10-18
+-- Description: Store workflow step config as native JSONB
+--
+-- workflow_steps.config_json held JSON-encoded TEXT that
+-- the API decoded for every step it returned. It now uses the same
+-- JSONDocument type as storage_backends.config_json (migration 004).
+-- The cast is lossless. SQLite databases need no change: the JSON column
+-- type reads the existing text values as-is.
+
+BEGIN;
+
+ALTER TABLE workflow_steps
+    ALTER COLUMN config_json TYPE JSONB USING config_json::jsonb;
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- ALTER TABLE workflow_steps
+--     ALTER COLUMN config_json TYPE TEXT USING config_json::text;
@@ -0,0 +1,25 @@
+-- Migration: 016_node_state_group_indexes
+-- Date: 2026-10-18
+-- Description: Index nodes.state and nodes.group_id
+--
+-- nodes.state had no index. The node list filter, stalled-install scan and
+-- dashboard counts all filter on state = $1 and scanned nodes.
+--
+-- nodes.group_id had no index at all. DeviceGroup.nodes loads, per-group
+-- node counts and the device_groups FK check all scanned nodes.
+--
+-- SQLite databases are converted at startup by src/db/migrations.py.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_nodes_state ON nodes (state);
+CREATE INDEX IF NOT EXISTS ix_nodes_group_id ON nodes (group_id);
+
+COMMIT;
+
+-- ============================================
+-- Rollback script (for reference)
+-- ============================================
+--
+-- DROP INDEX IF EXISTS ix_nodes_group_id;
+-- DROP INDEX IF EXISTS ix_nodes_state;
@@ -13,10 +13,12 @@ from src.db.models import ApiKey, User
 from src.utils.api_keys import parse_api_key, verify_api_key
 
 
-# Paths that don't require authentication
-PUBLIC_PATHS = {
-    "/",
-    "/health",
+# Only the API requires authentication; everything else (the SPA, its
+# assets and /health) is public
+API_PREFIX = "/api/"
+
+# API paths that don't require authentication
+PUBLIC_PATHS = frozenset({
     "/api/docs",
     "/api/redoc",
     "/api/openapi.json",
@@ -25,11 +27,10 @@ PUBLIC_PATHS = {
     "/api/v1/boot",
     "/api/v1/ipxe",
     "/api/v1/report",
-}
+})
 
-# Path prefixes that don't require authentication
+# API path prefixes that don't require authentication
 PUBLIC_PREFIXES = (
-    "/assets",
     "/api/v1/boot/",
     "/api/v1/ipxe/",
 )
@@ -53,16 +54,15 @@ PUBLIC_EXTENSIONS = (
 
 def is_public_path(path: str) -> bool:
     """Check if path is public (no auth required)."""
-    if path in PUBLIC_PATHS:
+    # Static files and SPA client routes skip every other check
+    if not path.startswith(API_PREFIX):
         return True
-    for prefix in PUBLIC_PREFIXES:
-        if path.startswith(prefix):
-            return True
-    # Allow static assets by extension
-    for ext in PUBLIC_EXTENSIONS:
-        if path.endswith(ext):
-            return True
-    return False
+    # str.startswith/endswith take the whole tuple in one C-level call
+    return (
+        path in PUBLIC_PATHS
+        or path.startswith(PUBLIC_PREFIXES)
+        or path.endswith(PUBLIC_EXTENSIONS)
+    )
 
 
 async def authenticate_api_key(
@@ -97,13 +97,6 @@ async def get_activity(
                 node_names[n.id] = n.hostname or n.mac_address
 
         for log in state_logs:
-            metadata = None
-            if log.metadata_json:
-                try:
-                    metadata = json.loads(log.metadata_json)
-                except json.JSONDecodeError:
-                    pass
-
             entries.append(ActivityEntry(
                 id=f"state_{log.id}",
                 timestamp=log.created_at,
@@ -112,7 +105,7 @@ async def get_activity(
                 node_id=log.node_id,
                 node_name=node_names.get(log.node_id),
                 message=log.comment or f"State changed from {log.from_state} to {log.to_state}",
-                details=metadata,
+                details=log.metadata_json,
                 triggered_by=log.triggered_by,
             ))
 
@@ -151,13 +144,6 @@ async def get_activity(
                     node_names[n.id] = n.hostname or n.mac_address
 
         for event in events:
-            metadata = None
-            if event.metadata_json:
-                try:
-                    metadata = json.loads(event.metadata_json)
-                except json.JSONDecodeError:
-                    pass
-
             # Build message
             msg = event.message
             if not msg:
@@ -174,6 +160,7 @@ async def get_activity(
             if event.status:
                 extra["status"] = event.status
 
+            metadata = event.metadata_json
             if extra:
                 metadata = {**(metadata or {}), **extra}
 
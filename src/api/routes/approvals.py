@@ -1,15 +1,14 @@
 """Approvals API endpoints for four-eye principle."""
-import json
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from src.db.database import get_db
 from src.db.models import Approval, ApprovalVote
+from src.db.queries import approvals_with_votes
 from src.services.approvals import (
     ApprovalNotFoundError,
     UserCannotVoteError,
@@ -97,7 +96,7 @@ class ApprovalResponse(BaseModel):
         return cls(
             id=approval.id,
             action_type=approval.action_type,
-            action_data=json.loads(approval.action_data_json),
+            action_data=approval.action_data_json,
             requester_id=approval.requester_id,
             requester_name=approval.requester_name,
             status=approval.status,
@@ -156,10 +155,7 @@ class ApprovalDetailResponse(BaseModel):
         ]
 
         # Parse action_data for target info
-        try:
-            action_data = json.loads(approval.action_data_json)
-        except (json.JSONDecodeError, TypeError):
-            action_data = {}
+        action_data = approval.action_data_json or {}
 
         return cls(
             id=approval.id,
@@ -262,7 +258,7 @@ async def list_approvals(
             total=total,
         )
 
-    query = select(Approval).options(selectinload(Approval.votes))
+    query = approvals_with_votes()
 
     if status:
         query = query.where(Approval.status == status)
@@ -297,8 +293,7 @@ async def get_approval_history(
 ):
     """Get completed/expired/rejected approvals."""
     query = (
-        select(Approval)
-        .options(selectinload(Approval.votes))
+        approvals_with_votes()
         .where(Approval.status.in_(["approved", "rejected", "expired", "cancelled"]))
         .order_by(Approval.resolved_at.desc())
         .offset(offset)
@@ -327,8 +322,7 @@ async def get_approval(
 ):
     """Get approval details."""
     result = await db.execute(
-        select(Approval)
-        .options(selectinload(Approval.votes))
+        approvals_with_votes()
         .where(Approval.id == approval_id)
     )
     approval = result.scalar_one_or_none()
@@ -362,7 +356,7 @@ async def create_approval(
     approval = Approval(
         action_type=data.action_type,
         operation_type=data.action_type,  # Use action_type as operation_type for legacy compatibility
-        action_data_json=json.dumps(data.action_data),
+        action_data_json=data.action_data,
         requester_id=data.requester_id,
         requester_name=data.requester_name,
         required_approvers=data.required_approvers,
@@ -510,8 +504,7 @@ async def cancel_approval_delete(
 ):
     """Cancel an approval request (legacy endpoint - use POST /cancel instead)."""
     result = await db.execute(
-        select(Approval)
-        .options(selectinload(Approval.votes))
+        approvals_with_votes()
         .where(Approval.id == approval_id)
     )
     approval = result.scalar_one_or_none()
@@ -544,8 +537,7 @@ async def _cast_vote(
 ) -> ApiResponse:
     """Internal function to cast a vote (legacy implementation)."""
     result = await db.execute(
-        select(Approval)
-        .options(selectinload(Approval.votes))
+        approvals_with_votes()
         .where(Approval.id == approval_id)
     )
     approval = result.scalar_one_or_none()
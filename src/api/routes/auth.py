@@ -137,9 +137,9 @@ def create_refresh_token() -> str:
     return secrets.token_urlsafe(32)
 
 
-def hash_refresh_token(token: str) -> str:
-    """Hash a refresh token for storage."""
-    return hashlib.sha256(token.encode()).hexdigest()
+def hash_refresh_token(token: str) -> bytes:
+    """Hash a refresh token for storage (raw SHA-256 digest)."""
+    return hashlib.sha256(token.encode()).digest()
 
 
 # --- Dependency ---
@@ -12,7 +12,7 @@ from src.core.state_service import StateTransitionService
 from src.core.workflow_service import Workflow, WorkflowNotFoundError, WorkflowService
 from src.db.database import get_db
 from src.db.models import Node
-from src.utils.network import get_server_url
+from src.utils.network import get_server_url, normalize_ip
 
 router = APIRouter()
 
@@ -429,7 +429,7 @@ async def get_boot_script(
         iPXE script as plain text
     """
     mac = validate_mac(mac)
-    client_ip = request.client.host if request.client else None
+    client_ip = normalize_ip(request.client.host) if request.client else None
     server = get_server_url()
 
     # Look up node by MAC
@@ -680,8 +680,9 @@ async def get_boot_status(
 
     # Update last seen
     node.last_seen_at = datetime.now(timezone.utc)
-    if request.client:
-        node.ip_address = request.client.host
+    client_ip = normalize_ip(request.client.host) if request.client else None
+    if client_ip:
+        node.ip_address = client_ip
 
     # Check for pending commands (poweroff, reboot)
     if node.pending_command:
@@ -1,5 +1,4 @@
 """Boot files serving endpoint with checksums and throttling."""
-import json
 import logging
 import time
 
@@ -39,7 +38,7 @@ async def get_default_backend(db: AsyncSession) -> tuple[StorageBackend, object]
             detail=f"Default boot backend '{backend_id}' not found.",
         )
 
-    config = json.loads(backend.config_json)
+    config = backend.config_json
     service = get_backend_service(backend.id, backend.type, config)
 
     return backend, service
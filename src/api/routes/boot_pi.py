@@ -9,7 +9,6 @@ from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from src.api.schemas import (
     MAC_PATTERN,
@@ -25,7 +24,7 @@ from src.db.database import get_db
 from src.db.models import Node
 from src.pxe import PiManager
 from src.pxe.pi_manager import validate_serial
-from src.utils.network import get_server_url, get_primary_ip
+from src.utils.network import get_server_url, get_primary_ip, normalize_ip
 
 logger = logging.getLogger(__name__)
 
@@ -111,13 +110,12 @@ async def get_pi_boot_instructions(
         mac = normalize_mac(mac)
 
     # Get client IP
-    client_ip = request.client.host if request and request.client else None
+    client_ip = normalize_ip(request.client.host) if request and request.client else None
     server = get_server_url()
 
     # Look up node by serial number
     result = await db.execute(
         select(Node)
-        .options(selectinload(Node.tags))
         .where(Node.serial_number == serial)
     )
     node = result.scalar_one_or_none()
@@ -319,7 +317,7 @@ async def register_pi_node(
     mac = registration.mac
     pi_model = registration.model
     ip_address = registration.ip_address or (
-        request.client.host if request.client else None
+        normalize_ip(request.client.host) if request.client else None
     )
 
     server = get_server_url()
@@ -327,7 +325,6 @@ async def register_pi_node(
     # Look up existing node by serial number
     result = await db.execute(
         select(Node)
-        .options(selectinload(Node.tags))
         .where(Node.serial_number == serial)
     )
     node = result.scalar_one_or_none()
@@ -358,7 +355,7 @@ async def register_pi_node(
             logger.error(f"Failed to update TFTP config for {serial}: {e}")
 
         await db.flush()
-        await db.refresh(node, ["tags"])
+        node = await Node.get_with_diagnostics(db, node.id)
 
         return ApiResponse(
             success=True,
@@ -391,7 +388,7 @@ async def register_pi_node(
         except Exception as e:
             logger.error(f"Failed to create TFTP directory for {serial}: {e}")
 
-        await db.refresh(node, ["tags"])
+        node = await Node.get_with_diagnostics(db, node.id)
 
         return ApiResponse(
             success=True,
@@ -957,7 +957,7 @@ async def get_staging_info(
         )
 
     backend = session.staging_backend
-    config = json.loads(backend.config_json)
+    config = backend.config_json
 
     # Build staging info based on backend type
     if backend.type == "nfs":
@@ -1,6 +1,5 @@
 """File browser API endpoints."""
 import hashlib
-import json
 
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Header
 from fastapi.responses import StreamingResponse
@@ -32,7 +31,7 @@ async def get_backend_and_service(backend_id: str, db: AsyncSession):
     if not backend:
         raise HTTPException(status_code=404, detail="Backend not found")
 
-    config = json.loads(backend.config_json)
+    config = backend.config_json
     service = get_backend_service(backend.id, backend.type, config)
 
     return backend, service
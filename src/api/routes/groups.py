@@ -466,13 +466,13 @@ async def list_group_nodes(
 
         query = (
             select(Node)
-            .options(selectinload(Node.tags))
+            .options(selectinload(Node.diagnostics))
             .where(Node.group_id.in_(all_group_ids))
         )
     else:
         query = (
             select(Node)
-            .options(selectinload(Node.tags))
+            .options(selectinload(Node.diagnostics))
             .where(Node.group_id == group_id)
         )
 
@@ -2,11 +2,11 @@
 from typing import Literal
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 from src.pxe.ipxe_builder import IPXEBuilder
-from src.pxe.ipxe_scripts import IPXEScriptGenerator
+from src.pxe.ipxe_scripts import boot_script_bytes
 
 router = APIRouter()
 
@@ -48,7 +48,7 @@ async def build_ipxe(request: BuildRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/ipxe/boot.ipxe", response_class=StreamingResponse)
+@router.get("/ipxe/boot.ipxe", response_class=Response)
 async def get_boot_script(server: str | None = None):
     """
     Get the main iPXE boot script.
@@ -66,15 +66,10 @@ async def get_boot_script(server: str | None = None):
     else:
         server_address = f"{settings.host}:{settings.port}"
 
-    generator = IPXEScriptGenerator(
-        server_address=server_address,
-        timeout=settings.boot_menu.timeout,
-        logo_url=settings.boot_menu.logo_url
+    script = boot_script_bytes(
+        server_address,
+        settings.boot_menu.timeout,
+        settings.boot_menu.logo_url,
     )
 
-    script = generator.generate_boot_script()
-
-    return StreamingResponse(
-        iter([script.encode()]),
-        media_type="text/plain"
-    )
+    return Response(content=script, media_type="text/plain")
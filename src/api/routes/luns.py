@@ -1,10 +1,10 @@
 """iSCSI LUN API endpoints."""
 import asyncio
-import json
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.api.schemas import (
     ApiResponse,
@@ -22,7 +22,7 @@ from src.core.iscsi import (
     generate_initiator_iqn,
 )
 from src.db.database import get_db
-from src.db.models import IscsiLun, StorageBackend, Node
+from src.db.models import IscsiLun, LunStatus, StorageBackend, Node
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -59,7 +59,7 @@ async def _create_lun_background(lun_id: str, db_url: str):
                 await db.commit()
                 return
 
-            config = json.loads(backend.config_json)
+            config = backend.config_json
             service = IscsiLunService(config)
 
             # Ensure target exists
@@ -140,7 +140,7 @@ async def _delete_lun_background(lun_id: str, db_url: str):
                 await db.commit()
                 return
 
-            config = json.loads(backend.config_json)
+            config = backend.config_json
             service = IscsiLunService(config)
 
             # Delete LUN
@@ -175,12 +175,14 @@ async def _delete_lun_background(lun_id: str, db_url: str):
 @router.get("/storage/luns", response_model=ApiResponse[list[IscsiLunResponse]])
 async def list_luns(
     backend_id: str | None = Query(default=None, description="Filter by backend ID"),
-    status: str | None = Query(default=None, description="Filter by status"),
+    status: LunStatus | None = Query(default=None, description="Filter by status"),
     purpose: str | None = Query(default=None, description="Filter by purpose"),
     db: AsyncSession = Depends(get_db),
 ):
     """List all iSCSI LUNs."""
-    query = select(IscsiLun)
+    query = select(IscsiLun).options(
+        selectinload(IscsiLun.backend), selectinload(IscsiLun.assigned_node)
+    )
 
     if backend_id:
         query = query.where(IscsiLun.backend_id == backend_id)
@@ -201,7 +203,11 @@ async def get_lun(
     db: AsyncSession = Depends(get_db),
 ):
     """Get an iSCSI LUN by ID."""
-    result = await db.execute(select(IscsiLun).where(IscsiLun.id == lun_id))
+    result = await db.execute(
+        select(IscsiLun)
+        .options(selectinload(IscsiLun.backend), selectinload(IscsiLun.assigned_node))
+        .where(IscsiLun.id == lun_id)
+    )
     lun = result.scalar_one_or_none()
 
     if not lun:
@@ -268,6 +274,7 @@ async def create_lun(
     db.add(lun)
     await db.commit()
     await db.refresh(lun)
+    await db.refresh(lun, ["backend", "assigned_node"])
 
     # Start background task
     from src.config import settings
@@ -317,6 +324,7 @@ async def update_lun(
 
     await db.commit()
     await db.refresh(lun)
+    await db.refresh(lun, ["backend", "assigned_node"])
 
     return ApiResponse(data=IscsiLunResponse.from_lun(lun))
 
@@ -385,7 +393,7 @@ async def assign_lun(
     backend = result.scalar_one_or_none()
     if not backend:
         raise HTTPException(status_code=500, detail="Backend not found for LUN")
-    config = json.loads(backend.config_json)
+    config = backend.config_json
     service = IscsiLunService(config)
 
     # Create ACL for node
@@ -410,6 +418,7 @@ async def assign_lun(
     lun.status = "active"
     await db.commit()
     await db.refresh(lun)
+    await db.refresh(lun, ["backend", "assigned_node"])
 
     return ApiResponse(
         data=IscsiLunResponse.from_lun(lun),
@@ -443,7 +452,7 @@ async def unassign_lun(
         )
         backend = result.scalar_one_or_none()
         if backend:
-            config = json.loads(backend.config_json)
+            config = backend.config_json
             service = IscsiLunService(config)
 
             # Remove ACL
@@ -456,6 +465,7 @@ async def unassign_lun(
     lun.status = "ready"
     await db.commit()
     await db.refresh(lun)
+    await db.refresh(lun, ["backend", "assigned_node"])
 
     return ApiResponse(
         data=IscsiLunResponse.from_lun(lun),
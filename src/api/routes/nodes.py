@@ -3,7 +3,7 @@ from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -36,31 +36,42 @@ from src.core.health_service import HealthService
 from src.core.state_machine import InvalidStateTransition, NodeStateMachine
 from src.core.state_service import StateTransitionService
 from src.core.websocket import global_ws_manager
+from src.db.bulk import bulk_copy
 from src.db.database import get_db
-from src.db.models import DeviceGroup, Node, NodeEvent, NodeStateLog, NodeTag
+from src.db.models import (
+    DeviceGroup,
+    Node,
+    NodeEvent,
+    NodeState,
+    NodeStateLog,
+    has_tag,
+    tag_append,
+    tag_remove,
+)
+from src.utils.network import normalize_ip
 
 router = APIRouter()
 
 
 @router.get("/nodes", response_model=ApiListResponse[NodeResponse])
 async def list_nodes(
-    state: str | None = Query(None, description="Filter by state"),
+    state: NodeState | None = Query(None, description="Filter by state"),
     group_id: str | None = Query(None, description="Filter by group ID"),
     tag: str | None = Query(None, description="Filter by tag"),
     db: AsyncSession = Depends(get_db),
 ):
     """List all nodes with optional filtering."""
-    query = select(Node).options(selectinload(Node.tags))
+    query = select(Node).options(selectinload(Node.diagnostics))
 
     if state:
         query = query.where(Node.state == state)
     if group_id:
         query = query.where(Node.group_id == group_id)
     if tag:
-        query = query.join(Node.tags).where(NodeTag.tag == tag.lower())
+        query = query.where(has_tag(Node.tags, tag.lower()))
 
     result = await db.execute(query)
-    nodes = result.scalars().unique().all()
+    nodes = result.scalars().all()
 
     return ApiListResponse(
         data=[NodeResponse.from_node(n) for n in nodes],
@@ -170,31 +181,19 @@ async def bulk_add_tag(
     """Add a tag to multiple nodes."""
     tag_lower = request.tag  # Already normalized by validator
 
-    # Get existing tags to avoid duplicates
-    existing = await db.execute(
-        select(NodeTag.node_id)
-        .where(NodeTag.node_id.in_(request.node_ids))
-        .where(NodeTag.tag == tag_lower)
-    )
-    existing_node_ids = {row[0] for row in existing.all()}
-
-    # Verify which nodes exist
-    nodes_result = await db.execute(
-        select(Node.id).where(Node.id.in_(request.node_ids))
+    # Append in the UPDATE itself so concurrent tag changes are not lost
+    result = await db.execute(
+        update(Node)
+        .where(Node.id.in_(request.node_ids))
+        .where(~has_tag(Node.tags, tag_lower))
+        .values(tags=tag_append(Node.tags, tag_lower))
+        .execution_options(synchronize_session=False)
     )
-    valid_node_ids = {row[0] for row in nodes_result.all()}
-
-    # Add tags only to nodes that don't have it and exist
-    nodes_to_tag = valid_node_ids - existing_node_ids
-
-    for node_id in nodes_to_tag:
-        db.add(NodeTag(node_id=node_id, tag=tag_lower))
-
-    await db.flush()
+    updated = result.rowcount
 
     return ApiResponse(
-        data=BulkOperationResult(updated=len(nodes_to_tag)),
-        message=f"Added tag '{tag_lower}' to {len(nodes_to_tag)} node(s)",
+        data=BulkOperationResult(updated=updated),
+        message=f"Added tag '{tag_lower}' to {updated} node(s)",
     )
 
 
@@ -206,13 +205,14 @@ async def bulk_remove_tag(
     """Remove a tag from multiple nodes."""
     tag_lower = request.tag  # Already normalized by validator
 
-    # Delete matching tags
+    # Strip the tag from nodes that have it, atomically per row
     result = await db.execute(
-        delete(NodeTag)
-        .where(NodeTag.node_id.in_(request.node_ids))
-        .where(NodeTag.tag == tag_lower)
+        update(Node)
+        .where(Node.id.in_(request.node_ids))
+        .where(has_tag(Node.tags, tag_lower))
+        .values(tags=tag_remove(Node.tags, tag_lower))
+        .execution_options(synchronize_session=False)
     )
-
     deleted = result.rowcount
 
     return ApiResponse(
@@ -230,13 +230,13 @@ async def bulk_change_state(
     # Get all nodes
     result = await db.execute(
         select(Node)
-        .options(selectinload(Node.tags))
         .where(Node.id.in_(request.node_ids))
     )
     nodes = result.scalars().all()
 
     updated = 0
     errors: list[BulkChangeStateError] = []
+    state_logs: list[dict] = []
 
     for node in nodes:
         try:
@@ -245,6 +245,7 @@ async def bulk_change_state(
                 node=node,
                 to_state=request.new_state,
                 triggered_by="bulk_operation",
+                state_logs=state_logs,
             )
             updated += 1
         except (InvalidStateTransition, ValueError) as e:
@@ -254,6 +255,8 @@ async def bulk_change_state(
             ))
 
     await db.flush()
+    # One executemany (or COPY for large batches) instead of a log row per node
+    await bulk_copy(db, NodeStateLog, state_logs)
 
     return ApiResponse(
         data=BulkChangeStateResult(
@@ -294,7 +297,7 @@ async def create_node(
     )
     db.add(node)
     await db.flush()
-    await db.refresh(node, ["tags"])
+    node = await Node.get_with_diagnostics(db, node.id)
 
     return ApiResponse(
         data=NodeResponse.from_node(node),
@@ -320,7 +323,7 @@ async def get_stalled_nodes(
 
     result = await db.execute(
         select(Node)
-        .options(selectinload(Node.tags))
+        .options(selectinload(Node.diagnostics))
         .where(Node.state == "installing")
         .where(Node.state_changed_at < timeout_threshold)
         .order_by(Node.state_changed_at.asc())
@@ -339,10 +342,7 @@ async def get_node(
     db: AsyncSession = Depends(get_db),
 ):
     """Get node details by ID."""
-    result = await db.execute(
-        select(Node).options(selectinload(Node.tags)).where(Node.id == node_id)
-    )
-    node = result.scalar_one_or_none()
+    node = await Node.get_with_diagnostics(db, node_id)
 
     if not node:
         raise HTTPException(status_code=404, detail="Node not found")
@@ -358,7 +358,7 @@ async def update_node(
 ):
     """Update node metadata."""
     result = await db.execute(
-        select(Node).options(selectinload(Node.tags)).where(Node.id == node_id)
+        select(Node).where(Node.id == node_id)
     )
     node = result.scalar_one_or_none()
 
@@ -370,8 +370,7 @@ async def update_node(
         setattr(node, field, value)
 
     await db.flush()
-    await db.refresh(node)
-    await db.refresh(node, ["tags"])
+    node = await Node.get_with_diagnostics(db, node.id)
 
     return ApiResponse(
         data=NodeResponse.from_node(node),
@@ -387,7 +386,7 @@ async def transition_node_state(
 ):
     """Transition node to a new state."""
     result = await db.execute(
-        select(Node).options(selectinload(Node.tags)).where(Node.id == node_id)
+        select(Node).where(Node.id == node_id)
     )
     node = result.scalar_one_or_none()
 
@@ -404,8 +403,7 @@ async def transition_node_state(
             force=transition.force,
         )
         await db.flush()
-        await db.refresh(node)
-        await db.refresh(node, ["tags"])
+        node = await Node.get_with_diagnostics(db, node.id)
 
         return ApiResponse(
             data=NodeResponse.from_node(node),
@@ -463,7 +461,7 @@ async def retire_node(
 ):
     """Retire a node (sets state to retired)."""
     result = await db.execute(
-        select(Node).options(selectinload(Node.tags)).where(Node.id == node_id)
+        select(Node).where(Node.id == node_id)
     )
     node = result.scalar_one_or_none()
 
@@ -478,7 +476,7 @@ async def retire_node(
             triggered_by="admin",
         )
         await db.flush()
-        await db.refresh(node, ["tags"])
+        node = await Node.get_with_diagnostics(db, node.id)
 
         # Clean up Pi TFTP directory if this is a Pi node
         if node.boot_mode == "pi" and node.serial_number:
@@ -513,25 +511,23 @@ async def add_node_tag(
 ):
     """Add a tag to a node."""
     result = await db.execute(
-        select(Node).options(selectinload(Node.tags)).where(Node.id == node_id)
+        update(Node)
+        .where(Node.id == node_id)
+        .where(~has_tag(Node.tags, tag_data.tag))
+        .values(tags=tag_append(Node.tags, tag_data.tag))
+        .execution_options(synchronize_session=False)
     )
-    node = result.scalar_one_or_none()
+    node = await Node.get_with_diagnostics(db, node_id)
 
     if not node:
         raise HTTPException(status_code=404, detail="Node not found")
 
-    existing_tags = [t.tag for t in node.tags]
-    if tag_data.tag in existing_tags:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=409,
             detail=f"Tag '{tag_data.tag}' already exists on node",
         )
 
-    tag = NodeTag(node_id=node_id, tag=tag_data.tag)
-    db.add(tag)
-    await db.flush()
-    await db.refresh(node, ["tags"])
-
     return ApiResponse(
         data=NodeResponse.from_node(node),
         message=f"Tag '{tag_data.tag}' added",
@@ -545,31 +541,25 @@ async def remove_node_tag(
     db: AsyncSession = Depends(get_db),
 ):
     """Remove a tag from a node."""
+    tag_lower = tag.lower()
     result = await db.execute(
-        select(Node).options(selectinload(Node.tags)).where(Node.id == node_id)
+        update(Node)
+        .where(Node.id == node_id)
+        .where(has_tag(Node.tags, tag_lower))
+        .values(tags=tag_remove(Node.tags, tag_lower))
+        .execution_options(synchronize_session=False)
     )
-    node = result.scalar_one_or_none()
+    node = await Node.get_with_diagnostics(db, node_id)
 
     if not node:
         raise HTTPException(status_code=404, detail="Node not found")
 
-    tag_lower = tag.lower()
-    tag_to_delete = None
-    for t in node.tags:
-        if t.tag == tag_lower:
-            tag_to_delete = t
-            break
-
-    if not tag_to_delete:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=404,
             detail=f"Tag '{tag}' not found on node",
         )
 
-    await db.delete(tag_to_delete)
-    await db.flush()
-    await db.refresh(node, ["tags"])
-
     return ApiResponse(
         data=NodeResponse.from_node(node),
         message=f"Tag '{tag}' removed",
@@ -594,7 +584,6 @@ async def report_node_status(
     # Look up node by MAC
     result = await db.execute(
         select(Node)
-        .options(selectinload(Node.tags))
         .where(Node.mac_address == report.mac_address)
     )
     node = result.scalar_one_or_none()
@@ -606,7 +595,9 @@ async def report_node_status(
         )
 
     # Get client IP
-    client_ip = request.client.host if request.client else report.ip_address
+    client_ip = (
+        normalize_ip(request.client.host) if request.client else None
+    ) or report.ip_address
 
     # Update node information
     node.last_seen_at = datetime.now(timezone.utc)
@@ -661,7 +652,7 @@ async def report_node_status(
         )
 
     await db.flush()
-    await db.refresh(node)
+    node = await Node.get_with_diagnostics(db, node.id)
 
     return ApiResponse(
         data=NodeResponse.from_node(node),
@@ -862,7 +853,7 @@ async def clone_source_ready(
 ):
     """Called by clone source node when it's ready to serve disk."""
     result = await db.execute(
-        select(Node).options(selectinload(Node.tags)).where(Node.id == node_id)
+        select(Node).where(Node.id == node_id)
     )
     node = result.scalar_one_or_none()
     if not node:
@@ -914,7 +905,7 @@ async def node_installed_callback(
 ):
     """Callback when node deployment/clone is complete."""
     result = await db.execute(
-        select(Node).options(selectinload(Node.tags)).where(Node.id == node_id)
+        select(Node).where(Node.id == node_id)
     )
     node = result.scalar_one_or_none()
     if not node:
@@ -941,11 +932,11 @@ async def node_installed_callback(
             event_type="deploy_complete",
             status="success",
             message="Image deployment completed",
-            ip_address=request.client.host if request.client else None,
+            ip_address=normalize_ip(request.client.host) if request.client else None,
         )
 
         await db.flush()
-        await db.refresh(node)
+        node = await Node.get_with_diagnostics(db, node.id)
 
         return ApiResponse(
             success=True,
@@ -964,7 +955,7 @@ async def node_install_failed_callback(
 ):
     """Callback when node deployment/clone fails."""
     result = await db.execute(
-        select(Node).options(selectinload(Node.tags)).where(Node.id == node_id)
+        select(Node).where(Node.id == node_id)
     )
     node = result.scalar_one_or_none()
     if not node:
@@ -985,7 +976,8 @@ async def node_install_failed_callback(
         )
 
         await db.flush()
-        await db.refresh(node)
+
+    node = await Node.get_with_diagnostics(db, node.id)
 
     return ApiResponse(
         success=True,
@@ -1,12 +1,12 @@
 """Roles management API routes."""
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.db.database import get_db
-from src.db.models import Role, Permission, RolePermission, User
+from src.db.models import Role, Permission, User, role_permissions
 from src.api.dependencies.auth import require_permission
 
 
@@ -118,8 +118,11 @@ async def create_role(
     await db.flush()
 
     # Add permissions
-    for perm_id in data.permission_ids:
-        db.add(RolePermission(role_id=role.id, permission_id=perm_id))
+    if data.permission_ids:
+        await db.execute(
+            insert(role_permissions),
+            [{"role_id": role.id, "permission_id": pid} for pid in data.permission_ids],
+        )
 
     await db.commit()
 
@@ -221,13 +224,14 @@ async def update_role(
     if data.permission_ids is not None:
         # Remove existing permissions
         await db.execute(
-            RolePermission.__table__.delete().where(
-                RolePermission.role_id == role_id
-            )
+            delete(role_permissions).where(role_permissions.c.role_id == role_id)
         )
         # Add new permissions
-        for perm_id in data.permission_ids:
-            db.add(RolePermission(role_id=role_id, permission_id=perm_id))
+        if data.permission_ids:
+            await db.execute(
+                insert(role_permissions),
+                [{"role_id": role_id, "permission_id": pid} for pid in data.permission_ids],
+            )
 
     await db.commit()
 
@@ -276,6 +280,15 @@ async def delete_role(
     if role.is_system_role:
         raise HTTPException(status_code=400, detail="Cannot delete system roles")
 
+    user_count = await db.scalar(
+        select(func.count()).select_from(User).where(User.role_id == role_id)
+    )
+    if user_count:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Role is assigned to {user_count} user(s). Reassign them first.",
+        )
+
     await db.delete(role)
     await db.commit()
 
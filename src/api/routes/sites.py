@@ -9,7 +9,7 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -25,7 +25,7 @@ from src.api.schemas import (
     SiteSyncResponse,
 )
 from src.db.database import get_db
-from src.db.models import DeviceGroup, Node, SyncState, SyncConflict
+from src.db.models import DeviceGroup, MigrationClaim, Node, SyncState, SyncConflict
 
 router = APIRouter()
 
@@ -376,7 +376,8 @@ async def delete_site(
 ):
     """Delete a site.
 
-    Cannot delete if site has child sites or assigned nodes.
+    Cannot delete if site has child sites, assigned nodes or node
+    migrations. The site's sync state and conflicts are deleted with it.
     """
     result = await db.execute(
         select(DeviceGroup).where(
@@ -403,8 +404,10 @@ async def delete_site(
             detail=f"Cannot delete site with {children_count} child site(s). Remove children first.",
         )
 
-    # Check for nodes with home_site_id pointing to this site
-    count_query = select(func.count(Node.id)).where(Node.home_site_id == site_id)
+    # Check for nodes homed at or grouped under this site
+    count_query = select(func.count(Node.id)).where(
+        or_(Node.home_site_id == site_id, Node.group_id == site_id)
+    )
     count_result = await db.execute(count_query)
     node_count = count_result.scalar() or 0
 
@@ -414,6 +417,23 @@ async def delete_site(
             detail=f"Cannot delete site with {node_count} assigned node(s). Reassign nodes first.",
         )
 
+    # Check for migrations into or out of this site
+    claim_count = await db.scalar(
+        select(func.count(MigrationClaim.id)).where(
+            or_(
+                MigrationClaim.source_site_id == site_id,
+                MigrationClaim.target_site_id == site_id,
+            )
+        )
+    )
+    if claim_count:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot delete site with {claim_count} node migration(s).",
+        )
+
+    await db.execute(delete(SyncConflict).where(SyncConflict.site_id == site_id))
+    await db.execute(delete(SyncState).where(SyncState.site_id == site_id))
     await db.delete(site)
     await db.flush()
 
@@ -455,13 +475,13 @@ async def list_site_nodes(
 
         query = (
             select(Node)
-            .options(selectinload(Node.tags))
+            .options(selectinload(Node.diagnostics))
             .where(Node.home_site_id.in_(all_site_ids))
         )
     else:
         query = (
             select(Node)
-            .options(selectinload(Node.tags))
+            .options(selectinload(Node.diagnostics))
             .where(Node.home_site_id == site_id)
         )
 
@@ -1,7 +1,6 @@
 """Storage backend management API endpoints."""
-import json
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.schemas import (
@@ -18,10 +17,19 @@ from src.api.schemas import (
 )
 from src.core.storage import get_backend_service
 from src.db.database import get_db
-from src.db.models import StorageBackend
+from src.db.models import CloneSession, IscsiLun, StorageBackend, SyncJob, Template
 
 router = APIRouter()
 
+# Columns referencing a backend with no ON DELETE action, checked before
+# a delete so it fails with a 409 instead of an integrity error
+BACKEND_REFERENCES = (
+    ("iSCSI LUN(s)", IscsiLun.backend_id),
+    ("sync job(s)", SyncJob.destination_backend_id),
+    ("template(s)", Template.storage_backend_id),
+    ("clone session(s)", CloneSession.staging_backend_id),
+)
+
 
 def validate_config(backend_type: str, config: dict) -> dict:
     """Validate config based on backend type."""
@@ -78,7 +86,7 @@ async def create_backend(
     backend = StorageBackend(
         name=backend_data.name,
         type=backend_data.type,
-        config_json=json.dumps(validated_config),
+        config_json=validated_config,
         status="offline",
     )
     db.add(backend)
@@ -135,7 +143,7 @@ async def update_backend(
 
     if backend_data.config:
         validated_config = validate_config(backend.type, backend_data.config)
-        backend.config_json = json.dumps(validated_config)
+        backend.config_json = validated_config
 
     await db.flush()
 
@@ -159,9 +167,17 @@ async def delete_backend(
     if not backend:
         raise HTTPException(status_code=404, detail="Backend not found")
 
+    for label, column in BACKEND_REFERENCES:
+        count = await db.scalar(select(func.count()).where(column == backend_id))
+        if count:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Backend is used by {count} {label}. Remove them first.",
+            )
+
     # Unmount if NFS
     if backend.type == "nfs" and backend.mount_point:
-        config = json.loads(backend.config_json)
+        config = backend.config_json
         service = get_backend_service(backend.id, backend.type, config)
         await service.unmount()
 
@@ -188,7 +204,7 @@ async def test_backend(
     if not backend:
         raise HTTPException(status_code=404, detail="Backend not found")
 
-    config = json.loads(backend.config_json)
+    config = backend.config_json
     service = get_backend_service(backend.id, backend.type, config)
 
     success, message = await service.test_connection()
@@ -21,7 +21,7 @@ from src.core.scheduler import sync_scheduler
 from src.core.sync import sync_service
 from src.core.websocket import ws_manager
 from src.db.database import get_db, get_database_url
-from src.db.models import StorageBackend, SyncJob, SyncJobRun
+from src.db.models import StorageBackend, SyncJob, SyncJobRun, SyncJobStatus
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -32,7 +32,7 @@ _manual_run_times: dict[str, float] = {}
 
 @router.get("/storage/sync-jobs", response_model=ApiListResponse[SyncJobResponse])
 async def list_sync_jobs(
-    status: Optional[str] = Query(None, description="Filter by status"),
+    status: Optional[SyncJobStatus] = Query(None, description="Filter by status"),
     backend_id: Optional[str] = Query(None, description="Filter by backend"),
     db: AsyncSession = Depends(get_db),
 ):
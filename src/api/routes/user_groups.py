@@ -1,15 +1,16 @@
 """User groups management API routes."""
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.db.database import get_db
 from src.db.models import (
-    UserGroup, UserGroupMember, UserGroupRole, UserGroupDeviceGroup,
-    UserGroupTag, UserGroupNode, User, Role, DeviceGroup, Node
+    UserGroup, User, Role, DeviceGroup, Node,
+    user_group_members, user_group_roles, user_group_device_groups, user_group_nodes,
 )
+from src.db.queries import user_groups_with_members
 from src.api.dependencies.auth import require_permission
 
 
@@ -68,11 +69,7 @@ async def list_user_groups(
 ) -> list[UserGroupResponse]:
     """List all user groups."""
     result = await db.execute(
-        select(UserGroup)
-        .options(
-            selectinload(UserGroup.members),
-            selectinload(UserGroup.roles),
-        )
+        user_groups_with_members()
         .order_by(UserGroup.name)
     )
     groups = result.scalars().all()
@@ -133,12 +130,8 @@ async def get_user_group(
 ) -> dict:
     """Get user group details with members, roles, and access mappings."""
     result = await db.execute(
-        select(UserGroup)
-        .options(
-            selectinload(UserGroup.members),
-            selectinload(UserGroup.roles),
-            selectinload(UserGroup.device_groups),
-        )
+        user_groups_with_members()
+        .options(selectinload(UserGroup.device_groups))
         .where(UserGroup.id == group_id)
     )
     group = result.scalar_one_or_none()
@@ -146,17 +139,13 @@ async def get_user_group(
     if not group:
         raise HTTPException(status_code=404, detail="User group not found")
 
-    # Get tags
-    tag_result = await db.execute(
-        select(UserGroupTag).where(UserGroupTag.user_group_id == group_id)
-    )
-    tags = [t.tag for t in tag_result.scalars().all()]
-
     # Get explicit nodes
     node_result = await db.execute(
-        select(UserGroupNode).where(UserGroupNode.user_group_id == group_id)
+        select(user_group_nodes.c.node_id).where(
+            user_group_nodes.c.user_group_id == group_id
+        )
     )
-    node_ids = [n.node_id for n in node_result.scalars().all()]
+    node_ids = list(node_result.scalars().all())
 
     return {
         "id": group.id,
@@ -179,7 +168,7 @@ async def get_user_group(
                 {"id": dg.id, "name": dg.name}
                 for dg in group.device_groups
             ],
-            "tags": tags,
+            "tags": group.tags,
             "node_ids": node_ids,
         },
     }
@@ -194,8 +183,7 @@ async def update_user_group(
 ) -> UserGroupResponse:
     """Update a user group."""
     result = await db.execute(
-        select(UserGroup)
-        .options(selectinload(UserGroup.members), selectinload(UserGroup.roles))
+        user_groups_with_members()
         .where(UserGroup.id == group_id)
     )
     group = result.scalar_one_or_none()
@@ -272,14 +260,17 @@ async def assign_members(
 
     # Remove existing members
     await db.execute(
-        UserGroupMember.__table__.delete().where(
-            UserGroupMember.user_group_id == group_id
+        delete(user_group_members).where(
+            user_group_members.c.user_group_id == group_id
         )
     )
 
     # Add new members
-    for user_id in data.user_ids:
-        db.add(UserGroupMember(user_id=user_id, user_group_id=group_id))
+    if data.user_ids:
+        await db.execute(
+            insert(user_group_members),
+            [{"user_id": uid, "user_group_id": group_id} for uid in data.user_ids],
+        )
 
     await db.commit()
     return {"success": True, "message": f"Assigned {len(data.user_ids)} members"}
@@ -301,14 +292,17 @@ async def assign_roles(
 
     # Remove existing roles
     await db.execute(
-        UserGroupRole.__table__.delete().where(
-            UserGroupRole.user_group_id == group_id
+        delete(user_group_roles).where(
+            user_group_roles.c.user_group_id == group_id
         )
     )
 
     # Add new roles
-    for role_id in data.role_ids:
-        db.add(UserGroupRole(user_group_id=group_id, role_id=role_id))
+    if data.role_ids:
+        await db.execute(
+            insert(user_group_roles),
+            [{"user_group_id": group_id, "role_id": rid} for rid in data.role_ids],
+        )
 
     await db.commit()
     return {"success": True, "message": f"Assigned {len(data.role_ids)} roles"}
@@ -330,14 +324,20 @@ async def assign_device_groups(
 
     # Remove existing
     await db.execute(
-        UserGroupDeviceGroup.__table__.delete().where(
-            UserGroupDeviceGroup.user_group_id == group_id
+        delete(user_group_device_groups).where(
+            user_group_device_groups.c.user_group_id == group_id
         )
     )
 
     # Add new
-    for dg_id in data.device_group_ids:
-        db.add(UserGroupDeviceGroup(user_group_id=group_id, device_group_id=dg_id))
+    if data.device_group_ids:
+        await db.execute(
+            insert(user_group_device_groups),
+            [
+                {"user_group_id": group_id, "device_group_id": dg_id}
+                for dg_id in data.device_group_ids
+            ],
+        )
 
     await db.commit()
     return {"success": True, "message": f"Assigned {len(data.device_group_ids)} device groups"}
@@ -354,22 +354,15 @@ async def assign_tags(
     result = await db.execute(
         select(UserGroup).where(UserGroup.id == group_id)
     )
-    if not result.scalar_one_or_none():
+    group = result.scalar_one_or_none()
+    if not group:
         raise HTTPException(status_code=404, detail="User group not found")
 
-    # Remove existing
-    await db.execute(
-        UserGroupTag.__table__.delete().where(
-            UserGroupTag.user_group_id == group_id
-        )
-    )
-
-    # Add new
-    for tag in data.tags:
-        db.add(UserGroupTag(user_group_id=group_id, tag=tag))
+    # Replace existing, dropping duplicates
+    group.tags = list(dict.fromkeys(data.tags))
 
     await db.commit()
-    return {"success": True, "message": f"Assigned {len(data.tags)} tags"}
+    return {"success": True, "message": f"Assigned {len(group.tags)} tags"}
 
 
 @router.post("/{group_id}/access/nodes")
@@ -388,14 +381,17 @@ async def assign_nodes(
 
     # Remove existing
     await db.execute(
-        UserGroupNode.__table__.delete().where(
-            UserGroupNode.user_group_id == group_id
+        delete(user_group_nodes).where(
+            user_group_nodes.c.user_group_id == group_id
         )
     )
 
     # Add new
-    for node_id in data.node_ids:
-        db.add(UserGroupNode(user_group_id=group_id, node_id=node_id))
+    if data.node_ids:
+        await db.execute(
+            insert(user_group_nodes),
+            [{"user_group_id": group_id, "node_id": nid} for nid in data.node_ids],
+        )
 
     await db.commit()
     return {"success": True, "message": f"Assigned {len(data.node_ids)} nodes"}
@@ -7,7 +7,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.database import get_db
-from src.db.models import User, RefreshToken
+from src.db.models import ApiKey, User, RefreshToken
 from src.api.routes.auth import hash_password, get_current_user
 from src.services.audit import audit_action
 
@@ -375,6 +375,16 @@ async def delete_user(
         if admin_count <= 1:
             raise HTTPException(status_code=400, detail="Cannot delete last admin")
 
+    # API keys keep a reference to the user who created them
+    key_count = await db.scalar(
+        select(func.count()).select_from(ApiKey).where(ApiKey.created_by_id == user_id)
+    )
+    if key_count:
+        raise HTTPException(
+            status_code=409,
+            detail=f"User created {key_count} API key(s). Revoke them first.",
+        )
+
     # Store username before deletion for audit
     deleted_username = user.username
 
@@ -1,5 +1,4 @@
 """Workflow management API endpoints."""
-import json
 from typing import Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -54,19 +53,12 @@ class WorkflowStepResponse(BaseModel):
     @classmethod
     def from_step(cls, step: WorkflowStep) -> "WorkflowStepResponse":
         """Create response from WorkflowStep model."""
-        config = {}
-        if step.config_json:
-            try:
-                config = json.loads(step.config_json)
-            except json.JSONDecodeError:
-                config = {}
-
         return cls(
             id=step.id,
             sequence=step.sequence,
             name=step.name,
             type=step.type,
-            config=config,
+            config=step.config_json or {},
             timeout_seconds=step.timeout_seconds,
             on_failure=step.on_failure,
             max_retries=step.max_retries,
@@ -184,7 +176,7 @@ def create_workflow(data: WorkflowCreate, db: Session = Depends(get_db)):
             sequence=step_data.sequence,
             name=step_data.name,
             type=step_data.type,
-            config_json=json.dumps(step_data.config or {}),
+            config_json=step_data.config or {},
             timeout_seconds=step_data.timeout_seconds,
             on_failure=step_data.on_failure,
             max_retries=step_data.max_retries,
@@ -300,7 +292,7 @@ def update_workflow(workflow_id: str, data: WorkflowUpdate, db: Session = Depend
             sequence=step_data.sequence,
             name=step_data.name,
             type=step_data.type,
-            config_json=json.dumps(step_data.config or {}),
+            config_json=step_data.config or {},
             timeout_seconds=step_data.timeout_seconds,
             on_failure=step_data.on_failure,
             max_retries=step_data.max_retries,
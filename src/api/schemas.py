@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, Generic, Literal, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator, model_validator
 
+from src.utils.network import normalize_ip
+
 if TYPE_CHECKING:
     from src.db.models import NodeStateLog
 
@@ -195,7 +197,13 @@ class NodeResponse(BaseModel):
 
     @classmethod
     def from_node(cls, node) -> "NodeResponse":
-        """Create response from Node model."""
+        """Create response from Node model.
+
+        Node.diagnostics must be loaded (selectinload or
+        Node.get_with_diagnostics); it is lazy="raise", so a route that
+        forgets fails instead of reporting no install error.
+        """
+        diagnostics = node.diagnostics
         return cls(
             id=node.id,
             mac_address=node.mac_address,
@@ -211,9 +219,9 @@ class NodeResponse(BaseModel):
             boot_mode=node.boot_mode,
             pi_model=getattr(node, 'pi_model', None),  # Handle nodes without pi_model
             group_id=node.group_id,
-            tags=[t.tag for t in node.tags],
+            tags=list(node.tags or []),
             install_attempts=node.install_attempts,
-            last_install_error=node.last_install_error,
+            last_install_error=diagnostics.last_install_error if diagnostics else None,
             state_changed_at=node.state_changed_at,
             created_at=node.created_at,
             updated_at=node.updated_at,
@@ -237,13 +245,6 @@ class NodeStateLogResponse(BaseModel):
 
     @classmethod
     def from_log(cls, log: "NodeStateLog") -> "NodeStateLogResponse":
-        metadata = None
-        if log.metadata_json:
-            try:
-                metadata = json.loads(log.metadata_json)
-            except json.JSONDecodeError:
-                metadata = None
-
         return cls(
             id=log.id,
             from_state=log.from_state,
@@ -251,7 +252,7 @@ class NodeStateLogResponse(BaseModel):
             triggered_by=log.triggered_by,
             user_id=log.user_id,
             comment=log.comment,
-            metadata=metadata,
+            metadata=log.metadata_json,
             created_at=log.created_at,
         )
 
@@ -328,6 +329,12 @@ class PiRegisterRequest(BaseModel):
             raise ValueError(f"Invalid MAC address format: {v}")
         return normalize_mac(v)
 
+    @field_validator("ip_address")
+    @classmethod
+    def validate_ip_address(cls, v: str | None) -> str | None:
+        """Canonicalize IP address; unknown or unparsable values become None."""
+        return normalize_ip(v)
+
     @field_validator("model")
     @classmethod
     def validate_model(cls, v: str) -> str:
@@ -925,6 +932,12 @@ class NodeReport(BaseModel):
             raise ValueError(f"Invalid MAC address format: {v}")
         return normalize_mac(v)
 
+    @field_validator("ip_address")
+    @classmethod
+    def validate_ip_address(cls, v: str | None) -> str | None:
+        """Canonicalize IP address; unknown or unparsable values become None."""
+        return normalize_ip(v)
+
     @field_validator("installation_progress")
     @classmethod
     def validate_progress(cls, v: int | None) -> int | None:
@@ -949,13 +962,6 @@ class NodeEventResponse(BaseModel):
     @classmethod
     def from_event(cls, event) -> "NodeEventResponse":
         """Create response from NodeEvent model."""
-        import json
-        metadata = None
-        if event.metadata_json:
-            try:
-                metadata = json.loads(event.metadata_json)
-            except json.JSONDecodeError:
-                pass
         return cls(
             id=event.id,
             node_id=event.node_id,
@@ -963,7 +969,7 @@ class NodeEventResponse(BaseModel):
             status=event.status,
             message=event.message,
             progress=event.progress,
-            metadata=metadata,
+            metadata=event.metadata_json,
             ip_address=event.ip_address,
             created_at=event.created_at,
         )
@@ -1130,7 +1136,7 @@ class StorageBackendResponse(BaseModel):
     @classmethod
     def from_backend(cls, backend) -> "StorageBackendResponse":
         """Create response from StorageBackend model."""
-        config = json.loads(backend.config_json)
+        config = dict(backend.config_json)
         # Remove sensitive fields from config
         config.pop("password", None)
         config.pop("secret_access_key", None)
@@ -38,6 +38,14 @@ class DatabaseSettings(BaseSettings):
     """Database settings."""
     url: str = "sqlite+aiosqlite:///./data/pureboot.db"
     echo: bool = False  # Log SQL statements
+    insertmanyvalues_page_size: int = 1000  # Rows per batched INSERT statement
+    query_cache_size: int = 1200  # Compiled SQL statements kept per engine
+    # Connection pool (server databases only; SQLite keeps its default pool)
+    pool_size: int = 20  # Connections kept open and pre-opened at startup
+    max_overflow: int = 10  # Extra connections allowed under burst load
+    pool_timeout: int = 30  # Seconds to wait for a free connection
+    pool_pre_ping: bool = True  # Check connections before handing them out
+    pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
 
 
 class RegistrationSettings(BaseSettings):
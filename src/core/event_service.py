@@ -1,5 +1,4 @@
 """Service for logging node lifecycle events."""
-import json
 import logging
 from datetime import datetime, timezone
 
@@ -46,7 +45,7 @@ class EventService:
             status=status,
             message=message,
             progress=progress,
-            metadata_json=json.dumps(metadata) if metadata else None,
+            metadata_json=metadata or None,
             ip_address=ip_address,
         )
         db.add(event)
@@ -0,0 +1,52 @@
+"""Monthly job to pre-create node_events / node_state_logs partitions.
+
+Migration 005 partitions both audit tables by month on PostgreSQL. This job
+calls pureboot_ensure_log_partitions() so upcoming months always exist and
+rows for a month that was missed get moved out of the DEFAULT partition.
+"""
+import logging
+
+from sqlalchemy import text
+
+from src.db.database import async_session_factory
+
+logger = logging.getLogger(__name__)
+
+# Months to create ahead of the current one
+MONTHS_AHEAD = 3
+
+
+async def ensure_log_partitions() -> None:
+    """Create upcoming monthly log partitions on a partitioned PostgreSQL database.
+
+    Does nothing on SQLite, or on PostgreSQL databases built by create_all()
+    that never had migration 005 applied.
+    """
+    if not async_session_factory:
+        logger.warning("Database not initialized, skipping partition maintenance")
+        return
+
+    async with async_session_factory() as db:
+        conn = await db.connection()
+        if conn.dialect.name != "postgresql":
+            return
+
+        try:
+            installed = await db.scalar(text(
+                "SELECT to_regprocedure('pureboot_ensure_log_partitions(integer)') IS NOT NULL"
+            ))
+            if not installed:
+                logger.info(
+                    "Log partitioning not installed (migration 005), skipping"
+                )
+                return
+
+            await db.execute(
+                text("SELECT pureboot_ensure_log_partitions(:months)"),
+                {"months": MONTHS_AHEAD},
+            )
+            await db.commit()
+            logger.info(f"Ensured log partitions {MONTHS_AHEAD} months ahead")
+        except Exception as e:
+            logger.error(f"Error ensuring log partitions: {e}")
+            await db.rollback()
@@ -1,12 +1,12 @@
 """Service for managing node state transitions with audit logging."""
-import json
 import logging
 from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.core.state_machine import InvalidStateTransition, NodeStateMachine
-from src.db.models import Node, NodeStateLog
+from src.db.models import Node, NodeDiagnostics, NodeStateLog
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,7 @@ class StateTransitionService:
         comment: str | None = None,
         metadata: dict | None = None,
         force: bool = False,
+        state_logs: list[dict] | None = None,
     ) -> Node:
         """
         Transition a node to a new state with audit logging.
@@ -39,6 +40,9 @@ class StateTransitionService:
             comment: Optional comment
             metadata: Optional metadata dict
             force: Bypass retry limits and reset counters
+            state_logs: If given, the audit log row is appended here for the
+                caller to write in one batch instead of being added to the
+                session
 
         Returns:
             Updated node
@@ -72,19 +76,22 @@ class StateTransitionService:
         # Reset counters if force or successful install
         if force or to_state == "installed":
             node.install_attempts = 0
-            node.last_install_error = None
+            await StateTransitionService.set_install_error(db, node, None)
 
         # Create audit log
-        log_entry = NodeStateLog(
-            node_id=node.id,
-            from_state=from_state,
-            to_state=to_state,
-            triggered_by=triggered_by,
-            user_id=user_id,
-            comment=comment,
-            metadata_json=json.dumps(metadata) if metadata else None,
-        )
-        db.add(log_entry)
+        log_row = {
+            "node_id": node.id,
+            "from_state": from_state,
+            "to_state": to_state,
+            "triggered_by": triggered_by,
+            "user_id": user_id,
+            "comment": comment,
+            "metadata_json": metadata or None,
+        }
+        if state_logs is not None:
+            state_logs.append(log_row)
+        else:
+            db.add(NodeStateLog(**log_row))
 
         # Application logging
         logger.info(
@@ -94,6 +101,34 @@ class StateTransitionService:
 
         return node
 
+    @staticmethod
+    async def set_install_error(
+        db: AsyncSession,
+        node: Node,
+        error: str | None,
+    ) -> None:
+        """
+        Record or clear a node's last install error.
+
+        The error text lives in NodeDiagnostics, off the hot nodes row, so
+        the row is created on first write.
+
+        Args:
+            db: Database session
+            node: Node to update
+            error: Error message, or None to clear it
+        """
+        if node.id is None:
+            await db.flush()
+        diagnostics = await db.get(NodeDiagnostics, node.id)
+        if diagnostics is None:
+            if error is None:
+                return
+            diagnostics = NodeDiagnostics(node_id=node.id)
+            db.add(diagnostics)
+        diagnostics.last_install_error = error
+        set_committed_value(node, "diagnostics", diagnostics)
+
     @staticmethod
     async def handle_install_failure(
         db: AsyncSession,
@@ -112,7 +147,7 @@ class StateTransitionService:
             Updated node (either still installing or install_failed)
         """
         node.install_attempts += 1
-        node.last_install_error = error
+        await StateTransitionService.set_install_error(db, node, error)
 
         if node.install_attempts >= MAX_INSTALL_ATTEMPTS:
             # Max retries exceeded - transition to install_failed
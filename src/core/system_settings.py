@@ -7,6 +7,7 @@ from src.db.models import SystemSetting
 # Known setting keys
 SETTING_DEFAULT_BOOT_BACKEND_ID = "default_boot_backend_id"
 SETTING_FILE_SERVING_BANDWIDTH_MBPS = "file_serving_bandwidth_mbps"
+SETTING_SEED_VERSION = "seed_version"
 
 # Defaults
 DEFAULT_BANDWIDTH_MBPS = 1000
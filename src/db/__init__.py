@@ -1,5 +1,5 @@
 """Database module."""
 from src.db.database import close_db, get_db, init_db
-from src.db.models import Base, DeviceGroup, Node, NodeTag
+from src.db.models import Base, DeviceGroup, Node
 
-__all__ = ["get_db", "init_db", "close_db", "Base", "Node", "DeviceGroup", "NodeTag"]
+__all__ = ["get_db", "init_db", "close_db", "Base", "Node", "DeviceGroup"]
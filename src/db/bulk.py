@@ -0,0 +1,91 @@
+"""Bulk ingest helpers for append-only tables.
+
+Small batches go through the ORM's insertmanyvalues path
+(BulkInsertMixin.bulk_insert). Large batches on PostgreSQL with asyncpg
+use COPY, which checks permissions and types once per batch instead of
+once per row.
+"""
+import json
+import logging
+from typing import Any
+
+from sqlalchemy import JSON
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import BulkInsertMixin
+
+logger = logging.getLogger(__name__)
+
+# Below this many rows COPY setup costs more than it saves
+COPY_THRESHOLD = 100
+
+
+def _copy_records(
+    model: type[BulkInsertMixin], rows: list[dict[str, Any]]
+) -> tuple[list[str], list[tuple]]:
+    """Build COPY column names and records for rows of a model.
+
+    COPY skips Python-side column defaults, so scalar and callable defaults
+    (ids, statuses, counters) are filled in here. SQL-expression defaults
+    such as func.now() are left out unless a row sets them; every bulk
+    model mirrors those with a server default, so PostgreSQL fills them in.
+    """
+    table = model.__table__
+    provided = set().union(*rows)
+
+    columns = []
+    for column in table.columns:
+        default = column.default
+        if column.name in provided:
+            columns.append(column)
+        elif default is not None and not default.is_clause_element:
+            columns.append(column)
+
+    records = []
+    for row in rows:
+        record = []
+        for column in columns:
+            if column.name in row:
+                value = row[column.name]
+            elif column.default is not None and column.default.is_callable:
+                value = column.default.arg(None)
+            elif column.default is not None:
+                value = column.default.arg
+            else:
+                value = None
+            if value is not None and isinstance(column.type, JSON):
+                value = json.dumps(value)
+            record.append(value)
+        records.append(tuple(record))
+
+    return [column.name for column in columns], records
+
+
+async def bulk_copy(
+    db: AsyncSession, model: type[BulkInsertMixin], rows: list[dict[str, Any]]
+) -> int:
+    """Insert rows, using COPY for large batches on PostgreSQL.
+
+    Args:
+        db: Database session
+        model: Model class to insert into (NodeEvent, SyncJobRun, ...)
+        rows: Rows keyed by column name
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    conn = await db.connection()
+    if len(rows) < COPY_THRESHOLD or conn.dialect.driver != "asyncpg":
+        await model.bulk_insert(db, rows)
+        return len(rows)
+
+    columns, records = _copy_records(model, rows)
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        model.__tablename__, records=records, columns=columns
+    )
+    logger.debug(f"Copied {len(records)} rows into {model.__tablename__}")
+    return len(records)
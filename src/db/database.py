@@ -1,6 +1,9 @@
 """Database connection and session management."""
+import asyncio
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -9,11 +12,44 @@ from sqlalchemy.ext.asyncio import (
 
 from src.config import settings
 
+
+def _pool_options(url: str) -> dict[str, Any]:
+    """Pool sizing for server databases; SQLite keeps SQLAlchemy's default."""
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": settings.database.pool_size,
+        "max_overflow": settings.database.max_overflow,
+        "pool_timeout": settings.database.pool_timeout,
+        "pool_pre_ping": settings.database.pool_pre_ping,
+        "pool_recycle": settings.database.pool_recycle,
+    }
+
+
 engine = create_async_engine(
     settings.database.url,
     echo=settings.database.echo,
+    insertmanyvalues_page_size=settings.database.insertmanyvalues_page_size,
+    query_cache_size=settings.database.query_cache_size,
+    **_pool_options(settings.database.url),
 )
 
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        """Enforce FKs so ON DELETE CASCADE/SET NULL fire on SQLite.
+
+        Child collections use passive_deletes=True and rely on the
+        database to remove their rows; SQLite ignores FK actions unless
+        this pragma is set on every connection.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -53,6 +89,17 @@ async def init_db() -> None:
         await run_migrations(conn)
 
 
+async def warm_pool() -> None:
+    """Open the pool's connections up front so early requests skip connecting."""
+    if engine.dialect.name == "sqlite":
+        return
+
+    connections = await asyncio.gather(
+        *(engine.connect() for _ in range(settings.database.pool_size))
+    )
+    await asyncio.gather(*(conn.close() for conn in connections))
+
+
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
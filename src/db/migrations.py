@@ -10,6 +10,8 @@ import logging
 from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from src.db.models import Base, MacAddress
+
 logger = logging.getLogger(__name__)
 
 # Define expected columns for each table
@@ -26,6 +28,10 @@ EXPECTED_SCHEMA = {
         ("home_site_id", "VARCHAR(36)", None),
         ("disk_scan_requested_at", "DATETIME", None),
         ("pending_command", "VARCHAR(50)", None),
+        ("tags", "JSON", "'[]'"),
+    ],
+    "user_groups": [
+        ("tags", "JSON", "'[]'"),
     ],
     "node_health_snapshots": [
         # This table should be created by create_all, but list columns for completeness
@@ -38,6 +44,19 @@ EXPECTED_SCHEMA = {
 # Indexes to create if missing
 EXPECTED_INDEXES = [
     ("ix_nodes_health_status", "nodes", "health_status"),
+    ("ix_nodes_state", "nodes", "state"),
+    ("ix_nodes_group_id", "nodes", "group_id"),
+    # Reverse-direction lookups on association tables; the composite
+    # primary key only serves queries on its leading column
+    ("ix_role_permissions_permission_id", "role_permissions", "permission_id"),
+    ("ix_user_group_members_user_group_id", "user_group_members", "user_group_id"),
+    ("ix_user_group_roles_role_id", "user_group_roles", "role_id"),
+    (
+        "ix_user_group_device_groups_device_group_id",
+        "user_group_device_groups",
+        "device_group_id",
+    ),
+    ("ix_user_group_nodes_node_id", "user_group_nodes", "node_id"),
 ]
 
 
@@ -86,6 +105,170 @@ async def create_index(
     logger.info(f"Created index {index_name}")
 
 
+async def convert_text_mac_addresses(conn: AsyncConnection) -> int:
+    """Re-encode legacy text MAC addresses on nodes as binary.
+
+    Node.mac_address is stored as raw bytes (see MacAddress). Rows written
+    before that change still hold the text form, which SQLite never
+    considers equal to a BLOB parameter, so lookups by MAC would miss them.
+    """
+    result = await conn.execute(
+        text("SELECT id, mac_address FROM nodes WHERE typeof(mac_address) = 'text'")
+    )
+    rows = result.fetchall()
+    mac_type = MacAddress()
+    for node_id, mac in rows:
+        await conn.execute(
+            text("UPDATE nodes SET mac_address = :mac WHERE id = :id"),
+            {"mac": mac_type.process_bind_param(mac, conn.dialect), "id": node_id},
+        )
+    if rows:
+        logger.info(f"Converted {len(rows)} node MAC addresses to binary")
+    return len(rows)
+
+
+async def convert_hex_refresh_token_hashes(conn: AsyncConnection) -> int:
+    """Re-encode legacy hex refresh token hashes as raw SHA-256 digests.
+
+    RefreshToken.token_hash is stored as 32 raw bytes; rows written before
+    that change hold the 64-char hex form and would never match a lookup.
+    """
+    result = await conn.execute(
+        text("SELECT id, token_hash FROM refresh_tokens WHERE typeof(token_hash) = 'text'")
+    )
+    rows = result.fetchall()
+    for token_id, token_hash in rows:
+        await conn.execute(
+            text("UPDATE refresh_tokens SET token_hash = :hash WHERE id = :id"),
+            {"hash": bytes.fromhex(token_hash), "id": token_id},
+        )
+    if rows:
+        logger.info(f"Converted {len(rows)} refresh token hashes to binary")
+    return len(rows)
+
+
+async def move_install_errors_to_diagnostics(conn: AsyncConnection) -> int:
+    """Move nodes.last_install_error into the node_diagnostics table."""
+    if "last_install_error" not in await get_existing_columns(conn, "nodes"):
+        return 0
+
+    await conn.execute(text(
+        "INSERT INTO node_diagnostics (node_id, last_install_error) "
+        "SELECT id, last_install_error FROM nodes "
+        "WHERE last_install_error IS NOT NULL"
+    ))
+    await conn.execute(text("ALTER TABLE nodes DROP COLUMN last_install_error"))
+    logger.info("Moved nodes.last_install_error to node_diagnostics")
+    return 1
+
+
+async def rebuild_lun_node_fk(conn: AsyncConnection) -> int:
+    """Rebuild iscsi_luns so assigned_node_id is ON DELETE SET NULL.
+
+    SQLite can't change a constraint in place, so the table is renamed,
+    recreated from the model and its rows copied back. Assignments to nodes
+    that no longer exist are cleared first, as the new constraint would.
+    """
+    result = await conn.execute(text("PRAGMA foreign_key_list(iscsi_luns)"))
+    # Columns: id, seq, table, from, to, on_update, on_delete, match
+    if not any(
+        row[3] == "assigned_node_id" and row[6] != "SET NULL"
+        for row in result.fetchall()
+    ):
+        return 0
+
+    lun_table = Base.metadata.tables["iscsi_luns"]
+    existing_columns = await get_existing_columns(conn, "iscsi_luns")
+    columns = ", ".join(c.name for c in lun_table.columns if c.name in existing_columns)
+
+    await conn.execute(text(
+        "UPDATE iscsi_luns SET assigned_node_id = NULL "
+        "WHERE assigned_node_id NOT IN (SELECT id FROM nodes)"
+    ))
+    await conn.execute(text("ALTER TABLE iscsi_luns RENAME TO iscsi_luns_old"))
+    await conn.run_sync(lun_table.create)
+    await conn.execute(text(
+        f"INSERT INTO iscsi_luns ({columns}) SELECT {columns} FROM iscsi_luns_old"
+    ))
+    await conn.execute(text("DROP TABLE iscsi_luns_old"))
+    logger.info("Rebuilt iscsi_luns with assigned_node_id ON DELETE SET NULL")
+    return 1
+
+
+# Blanket status indexes replaced by partial indexes on live rows
+LEGACY_STATUS_INDEXES = [
+    "ix_approvals_status",
+    "ix_storage_backends_status",
+    "ix_iscsi_luns_status",
+    "ix_sync_jobs_status",
+    "ix_hypervisors_status",
+]
+
+# Partial indexes defined in the models; create_all() only builds indexes
+# for tables it creates, so existing tables get them here
+PARTIAL_INDEXES = [
+    ("approvals", "ix_approvals_pending"),
+]
+
+
+async def replace_status_indexes(conn: AsyncConnection) -> int:
+    """Drop full status indexes and create the partial live-row indexes."""
+    existing_indexes = await get_existing_indexes(conn)
+    migrations_applied = 0
+
+    for index_name in LEGACY_STATUS_INDEXES:
+        if index_name in existing_indexes:
+            await conn.execute(text(f"DROP INDEX {index_name}"))
+            logger.info(f"Dropped index {index_name}")
+            migrations_applied += 1
+
+    for table_name, index_name in PARTIAL_INDEXES:
+        if index_name in existing_indexes:
+            continue
+        index = next(
+            i for i in Base.metadata.tables[table_name].indexes if i.name == index_name
+        )
+        await conn.run_sync(index.create)
+        logger.info(f"Created index {index_name}")
+        migrations_applied += 1
+
+    return migrations_applied
+
+
+# Tag tables folded into a tags list column on their owner
+# Format: [(tag_table, owner_table, foreign_key_column), ...]
+LEGACY_TAG_TABLES = [
+    ("node_tags", "nodes", "node_id"),
+    ("user_group_tags", "user_groups", "user_group_id"),
+]
+
+
+async def fold_legacy_tag_tables(conn: AsyncConnection) -> int:
+    """Copy rows from the old one-row-per-tag tables into tag lists.
+
+    Node.tags and UserGroup.tags used to be separate tables; each is copied
+    into its owner's tags column and then dropped.
+    """
+    migrations_applied = 0
+    for tag_table, owner_table, fk_column in LEGACY_TAG_TABLES:
+        result = await conn.execute(
+            text(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{tag_table}'")
+        )
+        if not result.fetchone():
+            continue
+
+        await conn.execute(text(
+            f"UPDATE {owner_table} SET tags = ("
+            f"SELECT json_group_array(tag) FROM {tag_table} "
+            f"WHERE {tag_table}.{fk_column} = {owner_table}.id"
+            f") WHERE id IN (SELECT {fk_column} FROM {tag_table})"
+        ))
+        await conn.execute(text(f"DROP TABLE {tag_table}"))
+        logger.info(f"Folded {tag_table} into {owner_table}.tags")
+        migrations_applied += 1
+    return migrations_applied
+
+
 async def run_migrations(conn: AsyncConnection) -> None:
     """Run all pending migrations.
 
@@ -119,6 +302,14 @@ async def run_migrations(conn: AsyncConnection) -> None:
             await create_index(conn, index_name, table_name, column_name)
             migrations_applied += 1
 
+    # Data migrations
+    migrations_applied += await convert_text_mac_addresses(conn)
+    migrations_applied += await convert_hex_refresh_token_hashes(conn)
+    migrations_applied += await fold_legacy_tag_tables(conn)
+    migrations_applied += await move_install_errors_to_diagnostics(conn)
+    migrations_applied += await replace_status_indexes(conn)
+    migrations_applied += await rebuild_lun_node_fk(conn)
+
     if migrations_applied > 0:
         logger.info(f"Applied {migrations_applied} schema migrations")
     else:
@@ -1,9 +1,282 @@
 """SQLAlchemy database models."""
+import re
 import uuid
 from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    Table,
+    Text,
+    TypeDecorator,
+    UniqueConstraint,
+    func,
+    insert,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, INET, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    joinedload,
+    mapped_column,
+    relationship,
+)
+from sqlalchemy.sql.functions import FunctionElement
+
+# Structured payload columns: JSONB on PostgreSQL, JSON-encoded text elsewhere.
+# Values are (de)serialized by the column type, so callers work with dicts.
+JSONDocument = JSON(none_as_null=True).with_variant(
+    JSONB(none_as_null=True), "postgresql"
+)
+
+# IPv4/IPv6 address columns: native INET on PostgreSQL, text elsewhere.
+IPAddress = String(45).with_variant(INET(), "postgresql")
+
+# Tag lists stored inline: TEXT[] on PostgreSQL, a JSON array elsewhere.
+# The column is not mutation-tracked, so assign a new list to change it.
+TagList = JSON().with_variant(ARRAY(Text), "postgresql")
+
+
+class empty_tag_list(FunctionElement):
+    """Server default for tag list columns: ``'{}'`` on PostgreSQL, ``'[]'`` elsewhere."""
+
+    type = TagList
+    inherit_cache = True
+    name = "empty_tag_list"
+
+
+@compiles(empty_tag_list)
+def _compile_empty_tag_list(element, compiler, **kw):
+    return "'[]'"
+
+
+@compiles(empty_tag_list, "postgresql")
+def _compile_empty_tag_list_postgresql(element, compiler, **kw):
+    return "'{}'"
+
+
+class has_tag(FunctionElement):
+    """SQL predicate: ``has_tag(Node.tags, "prod")``.
+
+    Compiles to ``tags @> ARRAY['prod']`` on PostgreSQL (served by the GIN
+    index) and to a json_each() lookup elsewhere.
+    """
+
+    type = Boolean()
+    inherit_cache = True
+    name = "has_tag"
+
+
+@compiles(has_tag)
+def _compile_has_tag(element, compiler, **kw):
+    column, tag = element.clauses
+    return (
+        f"EXISTS (SELECT 1 FROM json_each({compiler.process(column, **kw)}) "
+        f"WHERE json_each.value = {compiler.process(tag, **kw)})"
+    )
+
+
+@compiles(has_tag, "postgresql")
+def _compile_has_tag_postgresql(element, compiler, **kw):
+    column, tag = element.clauses
+    return (
+        f"({compiler.process(column, **kw)} "
+        f"@> CAST(ARRAY[{compiler.process(tag, **kw)}] AS TEXT[]))"
+    )
+
+
+class tag_append(FunctionElement):
+    """SQL expression for a tag list with one tag appended.
+
+    Used as ``update(Node).values(tags=tag_append(Node.tags, "prod"))`` so
+    the change is applied atomically in the UPDATE instead of by a
+    read-modify-write of the whole list. Compiles to array_append() on
+    PostgreSQL and json_insert() elsewhere.
+    """
+
+    type = TagList
+    inherit_cache = True
+    name = "tag_append"
+
+
+@compiles(tag_append)
+def _compile_tag_append(element, compiler, **kw):
+    column, tag = element.clauses
+    return (
+        f"json_insert({compiler.process(column, **kw)}, '$[#]', "
+        f"{compiler.process(tag, **kw)})"
+    )
+
+
+@compiles(tag_append, "postgresql")
+def _compile_tag_append_postgresql(element, compiler, **kw):
+    column, tag = element.clauses
+    return (
+        f"array_append({compiler.process(column, **kw)}, "
+        f"CAST({compiler.process(tag, **kw)} AS TEXT))"
+    )
+
+
+class tag_remove(FunctionElement):
+    """SQL expression for a tag list with every copy of one tag removed.
+
+    Counterpart of tag_append(); compiles to array_remove() on PostgreSQL
+    and a json_each() filter elsewhere.
+    """
+
+    type = TagList
+    inherit_cache = True
+    name = "tag_remove"
+
+
+@compiles(tag_remove)
+def _compile_tag_remove(element, compiler, **kw):
+    column, tag = element.clauses
+    return (
+        f"(SELECT json_group_array(json_each.value) "
+        f"FROM json_each({compiler.process(column, **kw)}) "
+        f"WHERE json_each.value != {compiler.process(tag, **kw)})"
+    )
+
+
+@compiles(tag_remove, "postgresql")
+def _compile_tag_remove_postgresql(element, compiler, **kw):
+    column, tag = element.clauses
+    return (
+        f"array_remove({compiler.process(column, **kw)}, "
+        f"CAST({compiler.process(tag, **kw)} AS TEXT))"
+    )
+
+
+MAC_BYTES_PATTERN = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}$")
+
+
+class MacAddress(TypeDecorator):
+    """MAC address stored as 6 raw bytes, exposed as ``aa:bb:cc:dd:ee:ff``.
+
+    Values that are not MACs (the ``pi-<serial>`` placeholder used for Pi
+    nodes registered before their MAC is known) are stored as ASCII bytes.
+    """
+
+    impl = LargeBinary(17)
+    cache_ok = True
+
+    def process_bind_param(self, value: str | bytes | None, dialect) -> bytes | None:
+        if value is None or isinstance(value, bytes):
+            return value
+        if MAC_BYTES_PATTERN.match(value):
+            return bytes.fromhex(value.replace(":", "").replace("-", ""))
+        return value.encode("ascii")
+
+    def process_result_value(self, value: bytes | str | None, dialect) -> str | None:
+        if value is None or isinstance(value, str):
+            return value
+        value = bytes(value)
+        if len(value) == 6:
+            return ":".join(f"{b:02x}" for b in value)
+        return value.decode("ascii")
+
+
+class NodeState(StrEnum):
+    """Node lifecycle states (see NodeStateMachine)."""
+
+    DISCOVERED = "discovered"
+    PENDING = "pending"
+    INSTALLING = "installing"
+    INSTALL_FAILED = "install_failed"
+    INSTALLED = "installed"
+    ACTIVE = "active"
+    REPROVISION = "reprovision"
+    DEPROVISIONING = "deprovisioning"
+    MIGRATING = "migrating"
+    SERVING_SOURCE = "serving_source"
+    CLONING_TARGET = "cloning_target"
+    RETIRED = "retired"
+
+
+class NodeArch(StrEnum):
+    """CPU architecture reported for a node."""
+
+    X86_64 = "x86_64"
+    ARM64 = "arm64"
+    AARCH64 = "aarch64"
+
+
+class BootMode(StrEnum):
+    """Firmware boot mode of a node."""
+
+    BIOS = "bios"
+    UEFI = "uefi"
+    PI = "pi"
+
+
+class BackendStatus(StrEnum):
+    """Storage backend and hypervisor connectivity status."""
+
+    ONLINE = "online"
+    OFFLINE = "offline"
+    ERROR = "error"
+    UNKNOWN = "unknown"
+
+
+class LunStatus(StrEnum):
+    """iSCSI LUN provisioning status."""
+
+    CREATING = "creating"
+    READY = "ready"
+    ACTIVE = "active"
+    ERROR = "error"
+    DELETING = "deleting"
+
+
+class SyncJobStatus(StrEnum):
+    """Sync job status."""
 
-from sqlalchemy import ForeignKey, Index, String, Text, UniqueConstraint, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+    IDLE = "idle"
+    RUNNING = "running"
+    SYNCED = "synced"
+    FAILED = "failed"
+
+
+class SyncRunStatus(StrEnum):
+    """Status of a single sync job run."""
+
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+
+
+class VoteChoice(StrEnum):
+    """Vote cast on an approval request."""
+
+    APPROVE = "approve"
+    REJECT = "reject"
+
+
+def enum_column(enum_cls: type[StrEnum], name: str, length: int) -> Enum:
+    """Build an Enum column type that stores member values.
+
+    PostgreSQL gets a native ENUM type named ``name``; other dialects keep a
+    VARCHAR(length) so existing SQLite schemas are unchanged.
+    """
+    return Enum(
+        enum_cls,
+        name=name,
+        length=length,
+        values_callable=lambda members: [m.value for m in members],
+    )
 
 
 class Base(DeclarativeBase):
@@ -12,6 +285,20 @@ class Base(DeclarativeBase):
     pass
 
 
+class BulkInsertMixin:
+    """Adds batched inserts to append-only models written in bursts."""
+
+    @classmethod
+    async def bulk_insert(cls, db: AsyncSession, rows: list[dict[str, Any]]) -> None:
+        """Insert many rows with a single executemany (insertmanyvalues).
+
+        Column defaults (ids, timestamps) are applied, but the rows bypass the
+        unit of work and are not attached to the session.
+        """
+        if rows:
+            await db.execute(insert(cls), rows)
+
+
 class DeviceGroup(Base):
     """Device group for organizing nodes with shared settings.
 
@@ -77,9 +364,11 @@ class DeviceGroup(Base):
     )  # manual, auto_accept, auto_release, bidirectional
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
@@ -92,8 +381,10 @@ class DeviceGroup(Base):
         "DeviceGroup",
         back_populates="parent",
     )
+    # Can hold every node in the group; query Node.group_id or load
+    # explicitly with selectinload(DeviceGroup.nodes)
     nodes: Mapped[list["Node"]] = relationship(
-        back_populates="group", foreign_keys="Node.group_id"
+        back_populates="group", foreign_keys="Node.group_id", lazy="raise"
     )
     user_groups: Mapped[list["UserGroup"]] = relationship(
         secondary="user_group_device_groups", back_populates="device_groups"
@@ -109,11 +400,16 @@ class Node(Base):
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     mac_address: Mapped[str] = mapped_column(
-        String(17), unique=True, index=True, nullable=False
+        MacAddress, unique=True, index=True, nullable=False
     )
     hostname: Mapped[str | None] = mapped_column(String(255))
-    ip_address: Mapped[str | None] = mapped_column(String(45))  # IPv6 compatible
-    state: Mapped[str] = mapped_column(String(20), default="discovered", nullable=False)
+    ip_address: Mapped[str | None] = mapped_column(IPAddress)
+    state: Mapped[NodeState] = mapped_column(
+        enum_column(NodeState, "node_state", 20),
+        default=NodeState.DISCOVERED,
+        nullable=False,
+        index=True,
+    )
     workflow_id: Mapped[str | None] = mapped_column(String(36))
 
     # Hardware identification
@@ -123,8 +419,12 @@ class Node(Base):
     system_uuid: Mapped[str | None] = mapped_column(String(36))
 
     # Metadata
-    arch: Mapped[str] = mapped_column(String(10), default="x86_64")
-    boot_mode: Mapped[str] = mapped_column(String(4), default="bios")
+    arch: Mapped[NodeArch] = mapped_column(
+        enum_column(NodeArch, "node_arch", 10), default=NodeArch.X86_64
+    )
+    boot_mode: Mapped[BootMode] = mapped_column(
+        enum_column(BootMode, "boot_mode", 4), default=BootMode.BIOS
+    )
 
     # Health monitoring
     health_status: Mapped[str] = mapped_column(
@@ -134,14 +434,16 @@ class Node(Base):
     boot_count: Mapped[int] = mapped_column(default=0)
     last_boot_at: Mapped[datetime | None] = mapped_column(nullable=True)
     last_ip_change_at: Mapped[datetime | None] = mapped_column(nullable=True)
-    previous_ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
+    previous_ip_address: Mapped[str | None] = mapped_column(IPAddress, nullable=True)
 
     pi_model: Mapped[str | None] = mapped_column(String(20), nullable=True)
 
     # Relationships
-    group_id: Mapped[str | None] = mapped_column(ForeignKey("device_groups.id"))
+    group_id: Mapped[str | None] = mapped_column(
+        ForeignKey("device_groups.id"), index=True
+    )
     group: Mapped[DeviceGroup | None] = relationship(
-        back_populates="nodes", foreign_keys=[group_id]
+        back_populates="nodes", foreign_keys=[group_id], lazy="selectin"
     )
 
     # Physical site where node boots from (may differ from logical group)
@@ -150,20 +452,21 @@ class Node(Base):
     )
     home_site: Mapped["DeviceGroup | None"] = relationship(foreign_keys=[home_site_id])
 
-    tags: Mapped[list["NodeTag"]] = relationship(
-        back_populates="node", cascade="all, delete-orphan"
+    tags: Mapped[list[str]] = mapped_column(
+        TagList, default=list, server_default=empty_tag_list(), nullable=False
     )
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
     last_seen_at: Mapped[datetime | None] = mapped_column()
 
-    # Installation tracking
+    # Installation tracking (last error text lives in NodeDiagnostics)
     install_attempts: Mapped[int] = mapped_column(default=0)
-    last_install_error: Mapped[str | None] = mapped_column(Text, nullable=True)
     state_changed_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
     # Disk scan request (set when UI requests scan, cleared after agent reports)
@@ -174,12 +477,12 @@ class Node(Base):
 
     # State log relationship
     state_logs: Mapped[list["NodeStateLog"]] = relationship(
-        back_populates="node", cascade="all, delete-orphan"
+        back_populates="node", cascade="all, delete-orphan", passive_deletes=True
     )
 
     # Event log relationship
     events: Mapped[list["NodeEvent"]] = relationship(
-        back_populates="node", cascade="all, delete-orphan"
+        back_populates="node", cascade="all, delete-orphan", passive_deletes=True
     )
 
     # User groups with direct access to this node
@@ -187,9 +490,57 @@ class Node(Base):
         secondary="user_group_nodes", back_populates="nodes"
     )
 
+    # Cold diagnostic payload; load explicitly with selectinload(Node.diagnostics)
+    # or Node.get_with_diagnostics()
+    diagnostics: Mapped["NodeDiagnostics | None"] = relationship(
+        back_populates="node", uselist=False, lazy="raise", passive_deletes=True
+    )
+
+    __table_args__ = (
+        Index("ix_nodes_tags_gin", "tags", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
+
+    @classmethod
+    async def get_with_diagnostics(cls, db: AsyncSession, node_id: str) -> "Node | None":
+        """Fetch a node with its diagnostics joined into the same query.
+
+        Overwrites any state the session already holds for the node, so it
+        also serves as the reload after a flush before building a
+        NodeResponse.
+        """
+        return await db.get(
+            cls,
+            node_id,
+            options=[joinedload(cls.diagnostics)],
+            populate_existing=True,
+        )
+
+
+class NodeDiagnostics(Base):
+    """Rarely read diagnostic text for a node, split off the nodes row.
+
+    Keeps large error output out of full-entity node fetches (lists,
+    dashboards, boot lookups). One row per node, created on first write.
+    """
+
+    __tablename__ = "node_diagnostics"
+
+    node_id: Mapped[str] = mapped_column(
+        ForeignKey("nodes.id", ondelete="CASCADE"), primary_key=True
+    )
+    last_install_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    node: Mapped["Node"] = relationship(back_populates="diagnostics")
 
-class NodeStateLog(Base):
-    """Audit log for node state transitions."""
+
+class NodeStateLog(BulkInsertMixin, Base):
+    """Audit log for node state transitions.
+
+    On PostgreSQL this table is range-partitioned by month on created_at
+    (see migrations/versions/005_partition_event_logs.sql).
+    """
 
     __tablename__ = "node_state_logs"
 
@@ -206,15 +557,23 @@ class NodeStateLog(Base):
     )  # admin, system, node_report
     user_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     comment: Mapped[str | None] = mapped_column(Text, nullable=True)
-    metadata_json: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    metadata_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONDocument, nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
 
     # Relationship
     node: Mapped["Node"] = relationship(back_populates="state_logs")
 
 
-class NodeEvent(Base):
-    """General event log for node lifecycle events."""
+class NodeEvent(BulkInsertMixin, Base):
+    """General event log for node lifecycle events.
+
+    On PostgreSQL this table is range-partitioned by month on created_at
+    (see migrations/versions/005_partition_event_logs.sql).
+    """
 
     __tablename__ = "node_events"
 
@@ -237,16 +596,27 @@ class NodeEvent(Base):
     progress: Mapped[int | None] = mapped_column(nullable=True)  # 0-100
 
     # Metadata (OS version, kernel, etc.)
-    metadata_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    metadata_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONDocument, nullable=True
+    )
 
     # Client info
-    ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
+    ip_address: Mapped[str | None] = mapped_column(IPAddress, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
 
     # Relationship
     node: Mapped["Node"] = relationship(back_populates="events")
 
+    __table_args__ = (
+        # GIN index for metadata key predicates; PostgreSQL only
+        Index(
+            "ix_node_events_metadata_gin", "metadata_json", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
 
 class NodeHealthSnapshot(Base):
     """Point-in-time health snapshot for trend tracking."""
@@ -259,7 +629,9 @@ class NodeHealthSnapshot(Base):
     node_id: Mapped[str] = mapped_column(
         ForeignKey("nodes.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    timestamp: Mapped[datetime] = mapped_column(default=func.now(), index=True)
+    timestamp: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now(), index=True
+    )
     health_status: Mapped[str] = mapped_column(String(20), nullable=False)
     health_score: Mapped[int] = mapped_column(nullable=False)
     last_seen_seconds_ago: Mapped[int] = mapped_column(nullable=False)
@@ -299,7 +671,9 @@ class HealthAlert(Base):
     message: Mapped[str] = mapped_column(Text, nullable=False)
     details_json: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     acknowledged_at: Mapped[datetime | None] = mapped_column(nullable=True)
     acknowledged_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
     resolved_at: Mapped[datetime | None] = mapped_column(nullable=True)
@@ -308,25 +682,6 @@ class HealthAlert(Base):
     node: Mapped["Node"] = relationship()
 
 
-class NodeTag(Base):
-    """Tag for categorizing nodes."""
-
-    __tablename__ = "node_tags"
-
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
-    )
-    node_id: Mapped[str] = mapped_column(
-        ForeignKey("nodes.id", ondelete="CASCADE"), nullable=False
-    )
-    tag: Mapped[str] = mapped_column(String(50), index=True, nullable=False)
-
-    # Relationships
-    node: Mapped[Node] = relationship(back_populates="tags")
-
-    __table_args__ = (UniqueConstraint("node_id", "tag", name="uq_node_tag"),)
-
-
 class StorageBackend(Base):
     """Storage backend configuration (NFS, iSCSI, S3, HTTP)."""
 
@@ -337,10 +692,13 @@ class StorageBackend(Base):
     )
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     type: Mapped[str] = mapped_column(String(10), index=True, nullable=False)  # nfs, iscsi, s3, http
-    status: Mapped[str] = mapped_column(String(10), index=True, default="offline")  # online, offline, error
+    status: Mapped[BackendStatus] = mapped_column(
+        enum_column(BackendStatus, "backend_status", 10),
+        default=BackendStatus.OFFLINE,
+    )
 
-    # Type-specific config stored as JSON
-    config_json: Mapped[str] = mapped_column(Text, nullable=False)
+    # Type-specific config
+    config_json: Mapped[dict[str, Any]] = mapped_column(JSONDocument, nullable=False)
 
     # Cached stats (updated periodically)
     used_bytes: Mapped[int] = mapped_column(default=0)
@@ -351,9 +709,11 @@ class StorageBackend(Base):
     mount_point: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
 
@@ -373,7 +733,9 @@ class FileChecksum(Base):
     file_path: Mapped[str] = mapped_column(String(500), nullable=False)
     checksum_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
     size_bytes: Mapped[int] = mapped_column(nullable=False)
-    computed_at: Mapped[datetime] = mapped_column(default=func.now())
+    computed_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
 
     backend: Mapped["StorageBackend"] = relationship()
 
@@ -389,7 +751,9 @@ class SystemSetting(Base):
 
     key: Mapped[str] = mapped_column(String(100), primary_key=True)
     value: Mapped[str | None] = mapped_column(Text, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
 
 
 class IscsiLun(Base):
@@ -417,14 +781,15 @@ class IscsiLun(Base):
     purpose: Mapped[str] = mapped_column(
         String(20), nullable=False
     )  # boot_from_san, install_source, auto_provision
-    status: Mapped[str] = mapped_column(
-        String(20), default="creating", index=True
-    )  # creating, ready, active, error, deleting
+    status: Mapped[LunStatus] = mapped_column(
+        enum_column(LunStatus, "lun_status", 20),
+        default=LunStatus.CREATING,
+    )
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Node assignment
     assigned_node_id: Mapped[str | None] = mapped_column(
-        ForeignKey("nodes.id"), nullable=True
+        ForeignKey("nodes.id", ondelete="SET NULL"), nullable=True
     )
     assigned_node: Mapped["Node | None"] = relationship()
 
@@ -434,9 +799,11 @@ class IscsiLun(Base):
     chap_password_encrypted: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
 
@@ -475,26 +842,29 @@ class SyncJob(Base):
     keep_versions: Mapped[int] = mapped_column(default=3)
 
     # Status
-    status: Mapped[str] = mapped_column(
-        String(20), default="idle", index=True
-    )  # idle, running, synced, failed
+    status: Mapped[SyncJobStatus] = mapped_column(
+        enum_column(SyncJobStatus, "sync_job_status", 20),
+        default=SyncJobStatus.IDLE,
+    )
     last_run_at: Mapped[datetime | None] = mapped_column(nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
     next_run_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
     runs: Mapped[list["SyncJobRun"]] = relationship(
-        back_populates="job", cascade="all, delete-orphan"
+        back_populates="job", cascade="all, delete-orphan", passive_deletes=True
     )
 
 
-class SyncJobRun(Base):
+class SyncJobRun(BulkInsertMixin, Base):
     """Individual run record for a sync job."""
 
     __tablename__ = "sync_job_runs"
@@ -505,11 +875,14 @@ class SyncJobRun(Base):
     job_id: Mapped[str] = mapped_column(
         ForeignKey("sync_jobs.id", ondelete="CASCADE"), nullable=False
     )
-    started_at: Mapped[datetime] = mapped_column(default=func.now())
+    started_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
-    status: Mapped[str] = mapped_column(
-        String(20), default="running"
-    )  # running, success, failed
+    status: Mapped[SyncRunStatus] = mapped_column(
+        enum_column(SyncRunStatus, "sync_run_status", 20),
+        default=SyncRunStatus.RUNNING,
+    )
 
     # Stats
     files_synced: Mapped[int] = mapped_column(default=0)
@@ -558,14 +931,16 @@ class Template(Base):
     description: Mapped[str | None] = mapped_column(Text)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
     versions: Mapped[list["TemplateVersion"]] = relationship(
-        back_populates="template", cascade="all, delete-orphan"
+        back_populates="template", cascade="all, delete-orphan", passive_deletes=True
     )
 
 
@@ -589,7 +964,9 @@ class TemplateVersion(Base):
     size_bytes: Mapped[int | None] = mapped_column(nullable=True)
 
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     created_by_id: Mapped[str | None] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
@@ -634,15 +1011,18 @@ class Workflow(Base):
     is_active: Mapped[bool] = mapped_column(default=True, index=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
     steps: Mapped[list["WorkflowStep"]] = relationship(
         back_populates="workflow",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="WorkflowStep.sequence",
     )
 
@@ -665,7 +1045,7 @@ class WorkflowStep(Base):
     )  # boot, script, reboot, wait, cloud_init
 
     # Step configuration
-    config_json: Mapped[str] = mapped_column(Text, default="{}")
+    config_json: Mapped[dict[str, Any]] = mapped_column(JSONDocument, default=dict)
     timeout_seconds: Mapped[int] = mapped_column(default=3600)
 
     # Failure handling
@@ -720,14 +1100,18 @@ class WorkflowExecution(Base):
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
 
     # Relationships
     node: Mapped["Node"] = relationship()
     workflow: Mapped["Workflow"] = relationship()
     current_step: Mapped["WorkflowStep | None"] = relationship()
     step_results: Mapped[list["StepResult"]] = relationship(
-        back_populates="execution", cascade="all, delete-orphan"
+        back_populates="execution",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -749,7 +1133,9 @@ class StepResult(Base):
     )
     attempt: Mapped[int] = mapped_column(default=1)
     status: Mapped[str] = mapped_column(String(50), nullable=False)
-    started_at: Mapped[datetime] = mapped_column(default=func.now())
+    started_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
     exit_code: Mapped[int | None] = mapped_column(nullable=True)
     message: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -781,7 +1167,9 @@ class SyncState(Base):
         ForeignKey("device_groups.id"), nullable=False
     )
     version: Mapped[int] = mapped_column(default=1)
-    last_modified: Mapped[datetime] = mapped_column(default=func.now())
+    last_modified: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     last_modified_by: Mapped[str] = mapped_column(
         String(50), nullable=False
     )  # site_id or "central"
@@ -813,7 +1201,9 @@ class SyncConflict(Base):
     )
     central_state_json: Mapped[str] = mapped_column(Text, nullable=False)
     site_state_json: Mapped[str] = mapped_column(Text, nullable=False)
-    detected_at: Mapped[datetime] = mapped_column(default=func.now())
+    detected_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     resolved_at: Mapped[datetime | None] = mapped_column(nullable=True)
     resolution: Mapped[str | None] = mapped_column(
         String(20), nullable=True
@@ -848,7 +1238,9 @@ class MigrationClaim(Base):
     approval_id: Mapped[str | None] = mapped_column(
         ForeignKey("approvals.id"), nullable=True
     )
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     resolved_at: Mapped[datetime | None] = mapped_column(nullable=True)
     expires_at: Mapped[datetime] = mapped_column(nullable=False)
 
@@ -870,7 +1262,9 @@ class Approval(Base):
     action_type: Mapped[str] = mapped_column(
         String(50), nullable=False, index=True
     )  # bulk_wipe, bulk_retire, delete_template, etc.
-    action_data_json: Mapped[str] = mapped_column(Text, nullable=False)  # JSON
+    action_data_json: Mapped[dict[str, Any]] = mapped_column(
+        JSONDocument, nullable=False
+    )
 
     # Link to approval rule that triggered this request
     rule_id: Mapped[str | None] = mapped_column(
@@ -886,7 +1280,7 @@ class Approval(Base):
 
     # Status
     status: Mapped[str] = mapped_column(
-        String(20), default="pending", index=True
+        String(20), default="pending"
     )  # pending, approved, rejected, expired, cancelled
     required_approvers: Mapped[int] = mapped_column(default=2)
 
@@ -899,19 +1293,34 @@ class Approval(Base):
     resolved_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
     # Additional context about the request
-    metadata_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    metadata_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONDocument, nullable=True
+    )
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
 
     # Relationships
     rule: Mapped["ApprovalRule | None"] = relationship(back_populates="approvals")
     votes: Mapped[list["ApprovalVote"]] = relationship(
-        back_populates="approval", cascade="all, delete-orphan"
+        back_populates="approval", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+    # Only pending approvals are scanned (expiry job, vote queue); resolved
+    # history is never filtered by status, so it stays out of the index
+    __table_args__ = (
+        Index(
+            "ix_approvals_pending",
+            "expires_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
     )
 
 
-class ApprovalVote(Base):
+class ApprovalVote(BulkInsertMixin, Base):
     """Vote on an approval request."""
 
     __tablename__ = "approval_votes"
@@ -928,14 +1337,18 @@ class ApprovalVote(Base):
     user_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # Vote
-    vote: Mapped[str] = mapped_column(String(10), nullable=False)  # approve, reject
+    vote: Mapped[VoteChoice] = mapped_column(
+        enum_column(VoteChoice, "vote_choice", 10), nullable=False
+    )
     comment: Mapped[str | None] = mapped_column(Text)
 
     # Whether this vote came from escalation (e.g., escalation role member)
     is_escalation_vote: Mapped[bool] = mapped_column(default=False)
 
     # Timestamp
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
 
     # Relationship
     approval: Mapped["Approval"] = relationship(back_populates="votes")
@@ -985,9 +1398,11 @@ class User(Base):
 
     # Tracking
     last_login_at: Mapped[datetime | None] = mapped_column(nullable=True)
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
@@ -1007,9 +1422,11 @@ class Role(Base):
     name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(String(255))
     is_system_role: Mapped[bool] = mapped_column(default=False)
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
@@ -1035,9 +1452,11 @@ class Permission(Base):
     resource: Mapped[str] = mapped_column(String(50), nullable=False)
     action: Mapped[str] = mapped_column(String(50), nullable=False)
     description: Mapped[str | None] = mapped_column(String(255))
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
@@ -1050,17 +1469,18 @@ class Permission(Base):
     )
 
 
-class RolePermission(Base):
-    """Association table for roles and permissions."""
-
-    __tablename__ = "role_permissions"
-
-    role_id: Mapped[str] = mapped_column(
-        ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True
-    )
-    permission_id: Mapped[str] = mapped_column(
-        ForeignKey("permissions.id", ondelete="CASCADE"), primary_key=True
-    )
+# Association table for roles and permissions
+role_permissions = Table(
+    "role_permissions",
+    Base.metadata,
+    Column("role_id", ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True),
+    Column(
+        "permission_id",
+        ForeignKey("permissions.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+)
 
 
 class UserGroup(Base):
@@ -1075,9 +1495,15 @@ class UserGroup(Base):
     description: Mapped[str | None] = mapped_column(String(500))
     requires_approval: Mapped[bool] = mapped_column(default=False)
     ldap_group_dn: Mapped[str | None] = mapped_column(String(500), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    # Node tags this group grants access to
+    tags: Mapped[list[str]] = mapped_column(
+        TagList, default=list, server_default=empty_tag_list(), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
@@ -1090,86 +1516,94 @@ class UserGroup(Base):
     device_groups: Mapped[list["DeviceGroup"]] = relationship(
         secondary="user_group_device_groups", back_populates="user_groups"
     )
-    tags: Mapped[list["UserGroupTag"]] = relationship(
-        back_populates="user_group", cascade="all, delete-orphan"
-    )
     nodes: Mapped[list["Node"]] = relationship(
         secondary="user_group_nodes", back_populates="user_groups"
     )
 
-
-class UserGroupMember(Base):
-    """Association table for users and user groups."""
-
-    __tablename__ = "user_group_members"
-
-    user_id: Mapped[str] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
-    )
-    user_group_id: Mapped[str] = mapped_column(
-        ForeignKey("user_groups.id", ondelete="CASCADE"), primary_key=True
-    )
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
-
-
-class UserGroupRole(Base):
-    """Association table for user groups and roles."""
-
-    __tablename__ = "user_group_roles"
-
-    user_group_id: Mapped[str] = mapped_column(
-        ForeignKey("user_groups.id", ondelete="CASCADE"), primary_key=True
-    )
-    role_id: Mapped[str] = mapped_column(
-        ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True
-    )
-
-
-class UserGroupDeviceGroup(Base):
-    """Association table for user groups and device groups."""
-
-    __tablename__ = "user_group_device_groups"
-
-    user_group_id: Mapped[str] = mapped_column(
-        ForeignKey("user_groups.id", ondelete="CASCADE"), primary_key=True
-    )
-    device_group_id: Mapped[str] = mapped_column(
-        ForeignKey("device_groups.id", ondelete="CASCADE"), primary_key=True
-    )
-
-
-class UserGroupTag(Base):
-    """Tag for categorizing user groups and defining node access by tag."""
-
-    __tablename__ = "user_group_tags"
-
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
-    )
-    user_group_id: Mapped[str] = mapped_column(
-        ForeignKey("user_groups.id", ondelete="CASCADE"), nullable=False
-    )
-    tag: Mapped[str] = mapped_column(String(50), index=True, nullable=False)
-
-    # Relationships
-    user_group: Mapped["UserGroup"] = relationship(back_populates="tags")
-
     __table_args__ = (
-        UniqueConstraint("user_group_id", "tag", name="uq_user_group_tag"),
+        Index("ix_user_groups_tags_gin", "tags", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
     )
 
 
-class UserGroupNode(Base):
-    """Association table for user groups and nodes (direct node access)."""
-
-    __tablename__ = "user_group_nodes"
+# Association tables for user groups. These are plain Core tables (no
+# mapper or identity map); write links with insert()/delete() on the table.
+# Each composite primary key leads with the side it is most often looked up
+# from; the other column carries its own index for the reverse direction
+# and for ON DELETE CASCADE from that parent.
 
-    user_group_id: Mapped[str] = mapped_column(
-        ForeignKey("user_groups.id", ondelete="CASCADE"), primary_key=True
-    )
-    node_id: Mapped[str] = mapped_column(
-        ForeignKey("nodes.id", ondelete="CASCADE"), primary_key=True
-    )
+# Users and user groups; keyed by user for the per-login group lookups
+# (LDAP sync, approval eligibility)
+user_group_members = Table(
+    "user_group_members",
+    Base.metadata,
+    Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    Column(
+        "user_group_id",
+        ForeignKey("user_groups.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+    Column(
+        "created_at",
+        DateTime,
+        default=func.now(),
+        server_default=func.now(),
+        nullable=False,
+    ),
+)
+
+# User groups and roles
+user_group_roles = Table(
+    "user_group_roles",
+    Base.metadata,
+    Column(
+        "user_group_id",
+        ForeignKey("user_groups.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "role_id",
+        ForeignKey("roles.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+)
+
+# User groups and device groups
+user_group_device_groups = Table(
+    "user_group_device_groups",
+    Base.metadata,
+    Column(
+        "user_group_id",
+        ForeignKey("user_groups.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "device_group_id",
+        ForeignKey("device_groups.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+)
+
+# User groups and nodes (direct node access)
+user_group_nodes = Table(
+    "user_group_nodes",
+    Base.metadata,
+    Column(
+        "user_group_id",
+        ForeignKey("user_groups.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "node_id",
+        ForeignKey("nodes.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+)
 
 
 class ApprovalRule(Base):
@@ -1197,9 +1631,11 @@ class ApprovalRule(Base):
     )
     is_active: Mapped[bool] = mapped_column(default=True)
     priority: Mapped[int] = mapped_column(default=0)  # Higher priority rules evaluated first
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
     # Relationships
@@ -1220,7 +1656,7 @@ class AuditLog(Base):
 
     # When
     timestamp: Mapped[datetime] = mapped_column(
-        default=func.now(), index=True, nullable=False
+        default=func.now(), server_default=func.now(), index=True, nullable=False
     )
 
     # Who
@@ -1295,8 +1731,12 @@ class LdapConfig(Base):
     auto_create_users: Mapped[bool] = mapped_column(default=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now(), onupdate=func.now()
+    )
     last_sync_at: Mapped[datetime | None] = mapped_column(nullable=True)
 
 
@@ -1311,9 +1751,12 @@ class RefreshToken(Base):
     user_id: Mapped[str] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    token_hash: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    # Raw SHA-256 digest (32 bytes) rather than its 64-char hex form
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True, nullable=False)
     expires_at: Mapped[datetime] = mapped_column(nullable=False)
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
 
     # Relationship
     user: Mapped["User"] = relationship()
@@ -1335,7 +1778,9 @@ class ApiKey(Base):
     key_prefix: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
     scopes_json: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array of scope restrictions
     is_active: Mapped[bool] = mapped_column(default=True)
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     expires_at: Mapped[datetime | None] = mapped_column(nullable=True)
     last_used_at: Mapped[datetime | None] = mapped_column(nullable=True)
     last_used_ip: Mapped[str | None] = mapped_column(String(45), nullable=True)
@@ -1372,9 +1817,10 @@ class Hypervisor(Base):
     verify_ssl: Mapped[bool] = mapped_column(default=True)
 
     # Status
-    status: Mapped[str] = mapped_column(
-        String(20), default="unknown", index=True
-    )  # online, offline, error, unknown
+    status: Mapped[BackendStatus] = mapped_column(
+        enum_column(BackendStatus, "hypervisor_status", 20),
+        default=BackendStatus.UNKNOWN,
+    )
     last_error: Mapped[str | None] = mapped_column(Text)
     last_sync_at: Mapped[datetime | None] = mapped_column()
 
@@ -1383,9 +1829,11 @@ class Hypervisor(Base):
     host_count: Mapped[int] = mapped_column(default=0)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(), onupdate=func.now()
+        default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
 
@@ -1451,7 +1899,9 @@ class CloneSession(Base):
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     started_at: Mapped[datetime | None] = mapped_column(nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
     created_by: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -1478,7 +1928,9 @@ class DiskInfo(Base):
     # gpt, mbr, unknown
     partitions_json: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    scanned_at: Mapped[datetime] = mapped_column(default=func.now())
+    scanned_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
 
     __table_args__ = (UniqueConstraint("node_id", "device", name="uq_node_device"),)
 
@@ -1511,5 +1963,7 @@ class PartitionOperation(Base):
     # pending, running, completed, failed
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        default=func.now(), server_default=func.now()
+    )
     executed_at: Mapped[datetime | None] = mapped_column(nullable=True)
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""Prebuilt SELECTs that carry the loader options their callers need.
+
+Approval.votes and UserGroup.members/roles are lazy relationships, which
+cannot load implicitly under AsyncSession. Every reader of those objects
+needs them, so the eager loads are attached here once instead of at each
+call site.
+"""
+from sqlalchemy import Select, select
+from sqlalchemy.orm import selectinload
+
+from src.db.models import Approval, UserGroup
+
+
+def approvals_with_votes() -> Select[tuple[Approval]]:
+    """Select approvals with their votes loaded."""
+    return select(Approval).options(selectinload(Approval.votes))
+
+
+def user_groups_with_members() -> Select[tuple[UserGroup]]:
+    """Select user groups with their members and roles loaded."""
+    return select(UserGroup).options(
+        selectinload(UserGroup.members),
+        selectinload(UserGroup.roles),
+    )
@@ -1,12 +1,27 @@
 """Seed database with default roles and permissions."""
 import asyncio
-from sqlalchemy import select
+import logging
+
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.system_settings import SETTING_SEED_VERSION, get_setting, set_setting
 from src.db.database import async_session_factory, init_db
-from src.db.models import Role, Permission, RolePermission, User, UserGroup, UserGroupRole
+from src.db.models import (
+    Role, Permission, User, UserGroup, role_permissions, user_group_roles
+)
 from src.api.routes.auth import hash_password
 
+logger = logging.getLogger(__name__)
+
+
+# Bump whenever PERMISSIONS, ROLES or USER_GROUPS change so the next run
+# seeds existing databases again: missing permissions, roles and groups are
+# inserted and system roles are granted any permissions they now lack.
+# Nothing is revoked, and the roles of existing groups are left alone.
+SEED_VERSION = 1
 
 # Define all permissions
 PERMISSIONS = [
@@ -49,6 +64,8 @@ PERMISSIONS = [
     ("ldap", "write", "Manage LDAP configurations"),
 ]
 
+PERMISSION_KEYS = [(resource, action) for resource, action, _ in PERMISSIONS]
+
 # Define roles and their permissions
 ROLES = {
     "admin": {
@@ -59,104 +76,139 @@ ROLES = {
     "operator": {
         "description": "Node and workflow management",
         "is_system_role": True,
-        "permissions": [
+        "permissions": frozenset({
             ("node", "create"), ("node", "read"), ("node", "update"), ("node", "transition"),
             ("group", "read"),
             ("workflow", "read"), ("workflow", "execute"),
             ("storage", "read"),
             ("system", "read"),
             ("approval", "read"), ("approval", "vote"),
-        ],
+        }),
     },
     "viewer": {
         "description": "Read-only access",
         "is_system_role": True,
-        "permissions": [
+        "permissions": frozenset({
             ("node", "read"),
             ("group", "read"),
             ("workflow", "read"),
             ("storage", "read"),
             ("system", "read"),
             ("approval", "read"),
-        ],
+        }),
     },
     "auditor": {
         "description": "Audit log access",
         "is_system_role": True,
-        "permissions": [
+        "permissions": frozenset({
             ("node", "read"),
             ("group", "read"),
             ("system", "read"),
             ("audit", "read"), ("audit", "export"),
-        ],
+        }),
     },
 }
 
 
+async def _insert_missing(
+    db: AsyncSession,
+    target,
+    rows: list[dict],
+    key: list[str],
+    returning: bool = False,
+) -> list:
+    """Insert rows in one statement, skipping any that already exist.
+
+    Uses ON CONFLICT DO NOTHING on PostgreSQL and SQLite so a concurrent
+    seeder racing on the same unique key doesn't abort the transaction.
+    With ``returning=True`` the inserted ORM objects come back via
+    RETURNING (rows skipped on conflict are not included).
+    """
+    if not rows:
+        return []
+
+    dialect = (await db.connection()).dialect.name
+    if dialect == "postgresql":
+        stmt = pg_insert(target).on_conflict_do_nothing(index_elements=key)
+    elif dialect == "sqlite":
+        stmt = sqlite_insert(target).on_conflict_do_nothing(index_elements=key)
+    else:
+        stmt = insert(target)
+
+    if returning:
+        return list(await db.scalars(stmt.returning(target), rows))
+    await db.execute(stmt, rows)
+    return []
+
+
 async def seed_permissions(db: AsyncSession) -> dict[tuple[str, str], Permission]:
     """Create all permissions if they don't exist."""
-    perm_map = {}
-
-    for resource, action, description in PERMISSIONS:
-        result = await db.execute(
-            select(Permission).where(
-                Permission.resource == resource,
-                Permission.action == action
-            )
+    result = await db.execute(
+        select(Permission).where(
+            tuple_(Permission.resource, Permission.action).in_(PERMISSION_KEYS)
         )
-        perm = result.scalar_one_or_none()
-
-        if not perm:
-            perm = Permission(
-                resource=resource,
-                action=action,
-                description=description,
-            )
-            db.add(perm)
-            await db.flush()
-
-        perm_map[(resource, action)] = perm
-
+    )
+    perm_map = {(perm.resource, perm.action): perm for perm in result.scalars()}
+
+    inserted = await _insert_missing(
+        db,
+        Permission,
+        [
+            {"resource": resource, "action": action, "description": description}
+            for resource, action, description in PERMISSIONS
+            if (resource, action) not in perm_map
+        ],
+        ["resource", "action"],
+        returning=True,
+    )
+    perm_map.update({(perm.resource, perm.action): perm for perm in inserted})
     return perm_map
 
 
 async def seed_roles(db: AsyncSession, perm_map: dict[tuple[str, str], Permission]) -> dict[str, Role]:
-    """Create all roles if they don't exist."""
-    role_map = {}
-
-    for role_name, role_def in ROLES.items():
-        result = await db.execute(
-            select(Role).where(Role.name == role_name)
+    """Create missing roles and grant system roles their listed permissions."""
+    result = await db.execute(select(Role).where(Role.name.in_(ROLES)))
+    role_map = {role.name: role for role in result.scalars()}
+
+    inserted = await _insert_missing(
+        db,
+        Role,
+        [
+            {
+                "name": role_name,
+                "description": role_def["description"],
+                "is_system_role": role_def["is_system_role"],
+            }
+            for role_name, role_def in ROLES.items()
+            if role_name not in role_map
+        ],
+        ["name"],
+        returning=True,
+    )
+    role_map.update({role.name: role for role in inserted})
+
+    # Grant permissions to the roles created above and top up existing
+    # system roles, which can't be edited through the API
+    role_permission_rows = []
+    inserted_ids = {role.id for role in inserted}
+    for role in role_map.values():
+        if role.id not in inserted_ids and not role.is_system_role:
+            continue
+        wanted = ROLES[role.name]["permissions"]
+        if wanted == "*":
+            wanted = perm_map.keys()
+        else:
+            for p in sorted(wanted - perm_map.keys()):
+                logger.warning(f"Permission {p} not found for role {role.name}")
+
+        role_permission_rows.extend(
+            {"role_id": role.id, "permission_id": perm_map[p].id}
+            for p in wanted & perm_map.keys()
         )
-        role = result.scalar_one_or_none()
-
-        if not role:
-            role = Role(
-                name=role_name,
-                description=role_def["description"],
-                is_system_role=role_def["is_system_role"],
-            )
-            db.add(role)
-            await db.flush()
-
-            # Add permissions
-            if role_def["permissions"] == "*":
-                perms = list(perm_map.values())
-            else:
-                perms = []
-                for p in role_def["permissions"]:
-                    if p in perm_map:
-                        perms.append(perm_map[p])
-                    else:
-                        print(f"  Warning: Permission {p} not found for role {role_name}")
 
-            for perm in perms:
-                rp = RolePermission(role_id=role.id, permission_id=perm.id)
-                db.add(rp)
-
-        role_map[role_name] = role
-
-    await db.flush()
+    await _insert_missing(
+        db, role_permissions, role_permission_rows, ["role_id", "permission_id"]
+    )
     return role_map
 
 
@@ -187,56 +239,66 @@ USER_GROUPS = {
 
 async def seed_user_groups(db: AsyncSession, role_map: dict[str, Role]) -> dict[str, UserGroup]:
     """Create default user groups if they don't exist."""
-    group_map = {}
-
-    for group_name, group_def in USER_GROUPS.items():
-        result = await db.execute(
-            select(UserGroup).where(UserGroup.name == group_name)
-        )
-        group = result.scalar_one_or_none()
-
-        if not group:
-            group = UserGroup(
-                name=group_name,
-                description=group_def["description"],
-                requires_approval=group_def["requires_approval"],
-            )
-            db.add(group)
-            await db.flush()
-
-            # Add roles
-            for role_name in group_def["roles"]:
-                if role_name in role_map:
-                    db.add(UserGroupRole(
-                        user_group_id=group.id,
-                        role_id=role_map[role_name].id
-                    ))
-                else:
-                    print(f"  Warning: Role {role_name} not found for group {group_name}")
-
-        group_map[group_name] = group
+    result = await db.execute(
+        select(UserGroup).where(UserGroup.name.in_(USER_GROUPS))
+    )
+    group_map = {group.name: group for group in result.scalars()}
+
+    inserted = await _insert_missing(
+        db,
+        UserGroup,
+        [
+            {
+                "name": group_name,
+                "description": group_def["description"],
+                "requires_approval": group_def["requires_approval"],
+            }
+            for group_name, group_def in USER_GROUPS.items()
+            if group_name not in group_map
+        ],
+        ["name"],
+        returning=True,
+    )
+    group_map.update({group.name: group for group in inserted})
+
+    # Add roles to the groups created above
+    group_role_rows = []
+    for group in inserted:
+        group_name = group.name
+        for role_name in USER_GROUPS[group_name]["roles"]:
+            if role_name in role_map:
+                group_role_rows.append({
+                    "user_group_id": group.id,
+                    "role_id": role_map[role_name].id,
+                })
+            else:
+                logger.warning(f"Role {role_name} not found for group {group_name}")
 
-    await db.flush()
+    await _insert_missing(
+        db, user_group_roles, group_role_rows, ["user_group_id", "role_id"]
+    )
     return group_map
 
 
 async def seed_admin_user(db: AsyncSession, role_map: dict[str, Role]) -> None:
     """Create default admin user if no users exist."""
-    result = await db.execute(select(User).limit(1))
-    if result.scalar_one_or_none():
+    if await db.scalar(select(User.id).limit(1)):
         return  # Users already exist
 
+    # bcrypt is deliberately slow; keep it off the event loop
+    password_hash = await asyncio.to_thread(hash_password, "admin")
+
     admin_role = role_map.get("admin")
     admin = User(
         username="admin",
         email="admin@localhost",
-        password_hash=hash_password("admin"),  # Change in production!
+        password_hash=password_hash,  # Change in production!
         role="admin",  # Legacy field
         role_id=admin_role.id if admin_role else None,
     )
     db.add(admin)
     await db.flush()
-    print("Created default admin user (username: admin, password: admin)")
+    logger.info("Created default admin user (username: admin, password: admin)")
 
 
 async def seed_database():
@@ -244,28 +306,29 @@ async def seed_database():
     await init_db()
 
     if not async_session_factory:
-        print("Database not initialized")
+        logger.error("Database not initialized")
         return
 
-    async with async_session_factory() as db:
-        print("Seeding permissions...")
-        perm_map = await seed_permissions(db)
-        print(f"  Created/verified {len(perm_map)} permissions")
+    # Every step writes through explicit statements and flushes, so the
+    # session has nothing to autoflush before each lookup
+    async with async_session_factory(autoflush=False) as db:
+        if await get_setting(db, SETTING_SEED_VERSION) == str(SEED_VERSION):
+            logger.info(f"Database already seeded (version {SEED_VERSION})")
+            return
 
-        print("Seeding roles...")
+        perm_map = await seed_permissions(db)
         role_map = await seed_roles(db, perm_map)
-        print(f"  Created/verified {len(role_map)} roles")
-
-        print("Seeding user groups...")
         group_map = await seed_user_groups(db, role_map)
-        print(f"  Created/verified {len(group_map)} user groups")
-
-        print("Checking admin user...")
         await seed_admin_user(db, role_map)
 
+        await set_setting(db, SETTING_SEED_VERSION, str(SEED_VERSION))
         await db.commit()
-        print("Database seeding complete!")
+        logger.info(
+            f"Database seeded (version {SEED_VERSION}): {len(perm_map)} permissions, "
+            f"{len(role_map)} roles, {len(group_map)} user groups"
+        )
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(seed_database())
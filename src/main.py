@@ -1,38 +1,23 @@
 """PureBoot main application."""
 import asyncio
+import atexit
+import importlib
 import logging
+import os
+import queue
+import stat
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-
-from src.api.routes import boot, boot_pi, ipxe, nodes, groups, storage, files, luns, system, sites, agents
-from src.api.routes.sync_jobs import router as sync_jobs_router
-from src.api.routes.workflows import router as workflows_router
-from src.api.routes.templates import router as templates_router
-from src.api.routes.activity import router as activity_router
-from src.api.routes.approvals import router as approvals_router
-from src.api.routes.auth import router as auth_router
-from src.api.routes.users import router as users_router
-from src.api.routes.ws import router as ws_router
-from src.api.routes.hypervisors import router as hypervisors_router
-from src.api.routes.user_groups import router as user_groups_router
-from src.api.routes.service_accounts import router as service_accounts_router
-from src.api.routes.roles import router as roles_router
-from src.api.routes.approval_rules import router as approval_rules_router
-from src.api.routes.audit import router as audit_router
-from src.api.routes.ldap import router as ldap_router
-from src.api.routes.clone import router as clone_router
-from src.api.routes.disks import router as disks_router
-from src.api.routes.callbacks import router as callbacks_router
-from src.api.routes.boot_files import router as boot_files_router
-from src.api.routes.health import router as health_router
+from fastapi.responses import FileResponse, Response
+
 from src.api.middleware.auth import AuthMiddleware
 from src.core.ca import ca_service
-from src.db.database import init_db, close_db, async_session_factory
+from src.db.database import init_db, close_db, async_session_factory, warm_pool
 from src.config import settings
 from src.pxe.tftp_server import TFTPServer
 from src.pxe.dhcp_proxy import DHCPProxy
@@ -42,78 +27,121 @@ from sqlalchemy import select
 from src.core.scheduler import sync_scheduler
 from src.core.escalation_job import process_escalations
 from src.core.agent_status_job import update_agent_statuses
+from src.core.partition_job import ensure_log_partitions
 from src.db.models import Node, NodeHealthSnapshot
 from src.services.audit import audit_service
 from src.utils.network import get_primary_ip
 
+# Log records are queued on the event loop thread and written to stderr by a
+# listener thread, so handlers never block on the stream
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
 logging.basicConfig(
     level=logging.DEBUG if settings.debug else logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    handlers=[QueueHandler(_log_queue)],
+    format="%(message)s",
 )
+log_listener = QueueListener(_log_queue, _log_stream, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Global server instances
 tftp_server: TFTPServer | None = None
 dhcp_proxy: DHCPProxy | None = None
+register_jobs_task: asyncio.Task | None = None
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan handler."""
-    global tftp_server, dhcp_proxy
+def _prepare_tftp_root(server_address: str) -> Path:
+    """Create the TFTP directory layout and refresh its boot scripts."""
+    tftp_root = Path(settings.tftp.root)
+    tftp_root.mkdir(parents=True, exist_ok=True)
+    (tftp_root / "bios").mkdir(exist_ok=True)
+    (tftp_root / "uefi").mkdir(exist_ok=True)
+    update_tftp_boot_scripts(tftp_root, server_address)
+    return tftp_root
 
-    logger.info("Starting PureBoot...")
 
-    # Initialize database
+async def _init_database() -> None:
+    """Create and migrate tables, then pre-open pooled connections."""
     await init_db()
+    await warm_pool()
     logger.info("Database initialized")
 
-    # Configure audit service
-    if settings.audit.file_enabled:
-        audit_service.configure(file_path=settings.audit.file_path)
-        logger.info(f"Audit file logging enabled: {settings.audit.file_path}")
-    if settings.audit.siem_enabled and settings.audit.siem_webhook_url:
-        audit_service.configure(siem_webhook_url=settings.audit.siem_webhook_url)
-        logger.info("Audit SIEM webhook enabled")
 
-    # Ensure TFTP root exists
-    tftp_root = Path(settings.tftp.root)
-    tftp_root.mkdir(parents=True, exist_ok=True)
-    (tftp_root / "bios").mkdir(exist_ok=True)
-    (tftp_root / "uefi").mkdir(exist_ok=True)
+async def _start_scheduler() -> None:
+    """Start the scheduler and re-register sync jobs in the background."""
+    global register_jobs_task
+
+    sync_scheduler.start()
+    # Readiness doesn't wait on rescheduling every sync job
+    register_jobs_task = asyncio.create_task(_register_scheduled_jobs_background())
+    logger.info("Scheduler started")
+
+
+async def _register_scheduled_jobs_background() -> None:
+    """Re-register sync jobs off the startup path, logging any failure."""
+    try:
+        await _register_scheduled_jobs()
+    except Exception:
+        logger.exception("Failed to re-register scheduled sync jobs")
+
 
+async def _init_database_and_scheduler() -> None:
+    """Bring up the database, then the scheduler that reads from it."""
+    await _init_database()
+    await _start_scheduler()
+
+
+async def _start_pxe_services() -> None:
+    """Prepare the TFTP root and start the TFTP and proxy DHCP servers."""
     # Detect server IP for boot scripts
     server_ip = settings.host
     if server_ip == "0.0.0.0":
         server_ip = get_primary_ip()
         logger.info(f"Auto-detected server IP: {server_ip}")
 
-    # Update TFTP boot scripts with current server address
+    # Ensure TFTP root exists and its boot scripts use the current address
     server_address = f"{server_ip}:{settings.port}"
-    update_tftp_boot_scripts(tftp_root, server_address)
+    tftp_root = await asyncio.to_thread(_prepare_tftp_root, server_address)
+
+    # The two servers bind separate sockets, so start them together
+    await asyncio.gather(
+        _start_tftp(tftp_root, server_ip),
+        _start_dhcp(server_ip, server_address),
+    )
 
-    # Start TFTP server if enabled
-    if settings.tftp.enabled:
+
+async def _start_tftp(tftp_root: Path, server_ip: str) -> None:
+    """Start the TFTP server if enabled."""
+    global tftp_server
+    tftp_cfg, pi_cfg = settings.tftp, settings.pi
+
+    if tftp_cfg.enabled:
         # Initialize Pi discovery if enabled
+        pi_discovery_enabled = pi_cfg.enabled and pi_cfg.discovery_enabled
         pi_discovery_dir = None
         pi_nodes_dir = None
         on_pi_discovery = None
 
-        if settings.pi.enabled and settings.pi.discovery_enabled:
+        if pi_discovery_enabled:
             # Ensure Pi nodes directory exists
-            pi_nodes_dir = Path(settings.pi.nodes_dir)
+            pi_nodes_dir = Path(pi_cfg.nodes_dir)
             pi_nodes_dir.mkdir(parents=True, exist_ok=True)
 
             # Initialize discovery directory
             discovery_manager = PiDiscoveryManager(
-                discovery_dir=settings.pi.discovery_dir,
-                firmware_dir=settings.pi.firmware_dir,
-                deploy_dir=settings.pi.deploy_dir,
-                default_model=settings.pi.discovery_default_model,
+                discovery_dir=pi_cfg.discovery_dir,
+                firmware_dir=pi_cfg.firmware_dir,
+                deploy_dir=pi_cfg.deploy_dir,
+                default_model=pi_cfg.discovery_default_model,
                 controller_url=f"http://{server_ip}:{settings.port}",
             )
             discovery_manager.ensure_discovery_directory()
-            pi_discovery_dir = settings.pi.discovery_dir
+            pi_discovery_dir = pi_cfg.discovery_dir
 
             # Callback for logging Pi discovery events
             def on_pi_discovery_callback(serial: str, filename: str):
@@ -126,9 +154,9 @@ async def lifespan(app: FastAPI):
 
         tftp_server = TFTPServer(
             root=tftp_root,
-            host=settings.tftp.host,
-            port=settings.tftp.port,
-            pi_discovery_enabled=settings.pi.enabled and settings.pi.discovery_enabled,
+            host=tftp_cfg.host,
+            port=tftp_cfg.port,
+            pi_discovery_enabled=pi_discovery_enabled,
             pi_discovery_dir=pi_discovery_dir,
             pi_nodes_dir=pi_nodes_dir,
             on_pi_discovery=on_pi_discovery,
@@ -137,35 +165,54 @@ async def lifespan(app: FastAPI):
             await tftp_server.start()
         except PermissionError:
             logger.warning(
-                f"Cannot bind to port {settings.tftp.port} (requires root). "
+                f"Cannot bind to port {tftp_cfg.port} (requires root). "
                 "TFTP server disabled."
             )
             tftp_server = None
 
-    # Start Proxy DHCP if enabled
-    if settings.dhcp_proxy.enabled:
+
+async def _start_dhcp(server_ip: str, server_address: str) -> None:
+    """Start the proxy DHCP server if enabled."""
+    global dhcp_proxy
+    dhcp_cfg = settings.dhcp_proxy
+
+    if dhcp_cfg.enabled:
         # Use already-detected server_ip for DHCP proxy
-        tftp_addr = settings.dhcp_proxy.tftp_server or server_ip
-        http_addr = settings.dhcp_proxy.http_server or server_address
+        tftp_addr = dhcp_cfg.tftp_server or server_ip
+        http_addr = dhcp_cfg.http_server or server_address
         dhcp_proxy = DHCPProxy(
             tftp_server=tftp_addr,
             http_server=http_addr,
-            host=settings.dhcp_proxy.host,
-            port=settings.dhcp_proxy.port
+            host=dhcp_cfg.host,
+            port=dhcp_cfg.port
         )
         try:
             await dhcp_proxy.start()
         except PermissionError:
             logger.warning(
-                f"Cannot bind to port {settings.dhcp_proxy.port}. "
+                f"Cannot bind to port {dhcp_cfg.port}. "
                 "Proxy DHCP disabled."
             )
             dhcp_proxy = None
 
-    # Start scheduler and re-register scheduled jobs
-    sync_scheduler.start()
-    await _register_scheduled_jobs()
-    logger.info("Scheduler started")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan handler."""
+    logger.info("Starting PureBoot...")
+
+    # Configure audit service
+    if settings.audit.file_enabled:
+        audit_service.configure(file_path=settings.audit.file_path)
+        logger.info(f"Audit file logging enabled: {settings.audit.file_path}")
+    if settings.audit.siem_enabled and settings.audit.siem_webhook_url:
+        audit_service.configure(siem_webhook_url=settings.audit.siem_webhook_url)
+        logger.info("Audit SIEM webhook enabled")
+
+    # Database and scheduler setup don't depend on PXE startup, so their
+    # I/O (migrations, job registration, directory setup, socket binds)
+    # overlaps
+    await asyncio.gather(_init_database_and_scheduler(), _start_pxe_services())
 
     # Schedule escalation check job for expired approvals
     sync_scheduler.scheduler.add_job(
@@ -220,6 +267,19 @@ async def lifespan(app: FastAPI):
     )
     logger.info("Health snapshot cleanup job scheduled (daily at 3:00 AM)")
 
+    # Pre-create event log partitions now and on the 1st of every month
+    await ensure_log_partitions()
+    sync_scheduler.scheduler.add_job(
+        ensure_log_partitions,
+        'cron',
+        day=1,
+        hour=0,
+        minute=5,
+        id='log_partitions',
+        replace_existing=True,
+    )
+    logger.info("Log partition job scheduled (monthly on the 1st at 00:05)")
+
     # Initialize CA service
     ca_service.initialize()
     logger.info("CA service initialized")
@@ -231,6 +291,13 @@ async def lifespan(app: FastAPI):
     # Cleanup
     logger.info("Shutting down PureBoot...")
 
+    # Give an unfinished job re-registration a moment before stopping
+    if register_jobs_task and not register_jobs_task.done():
+        try:
+            await asyncio.wait_for(register_jobs_task, timeout=5)
+        except asyncio.TimeoutError:
+            logger.warning("Sync job re-registration cancelled at shutdown")
+
     # Stop scheduler
     sync_scheduler.shutdown(wait=True)
     logger.info("Scheduler stopped")
@@ -248,26 +315,36 @@ async def lifespan(app: FastAPI):
 async def _register_scheduled_jobs():
     """Re-register all non-manual sync jobs on startup."""
     from src.db.models import SyncJob
-    from sqlalchemy import select
+    from sqlalchemy import update
 
     if not async_session_factory:
         return
 
     async with async_session_factory() as db:
         result = await db.execute(
-            select(SyncJob).where(SyncJob.schedule != "manual")
+            select(
+                SyncJob.id,
+                SyncJob.schedule,
+                SyncJob.schedule_day,
+                SyncJob.schedule_time,
+            ).where(SyncJob.schedule != "manual")
         )
-        jobs = result.scalars().all()
-
-        for job in jobs:
-            next_run = sync_scheduler.schedule_job(
+        jobs = result.all()
+
+        # Bulk UPDATE by primary key: one executemany instead of an ORM
+        # flush issuing one UPDATE per job.
+        mappings = [
+            {"id": job.id, "next_run_at": next_run}
+            for job in jobs
+            if (next_run := sync_scheduler.schedule_job(
                 job.id,
                 job.schedule,
                 job.schedule_day,
                 job.schedule_time,
-            )
-            if next_run:
-                job.next_run_at = next_run
+            ))
+        ]
+        if mappings:
+            await db.execute(update(SyncJob), mappings)
 
         await db.commit()
         logger.info(f"Re-registered {len(jobs)} scheduled sync jobs")
@@ -527,41 +604,53 @@ app = FastAPI(
 # Add authentication middleware
 app.add_middleware(AuthMiddleware)
 
+# API routers: (module under src.api.routes, OpenAPI tag). Every module
+# exposes ``router``; all are mounted under /api/v1 ahead of the SPA routes.
+API_ROUTERS = [
+    ("boot", "boot"),
+    ("boot_pi", "boot-pi"),
+    ("ipxe", "ipxe"),
+    ("nodes", "nodes"),
+    ("groups", "groups"),
+    ("sites", "sites"),
+    ("agents", "agents"),
+    ("storage", "storage"),
+    ("files", "files"),
+    ("luns", "luns"),
+    ("system", "system"),
+    ("sync_jobs", "sync-jobs"),
+    ("workflows", "workflows"),
+    ("templates", "templates"),
+    ("activity", "activity"),
+    ("approvals", "approvals"),
+    ("auth", "auth"),
+    ("users", "users"),
+    ("ws", "websocket"),
+    ("hypervisors", "hypervisors"),
+    ("user_groups", "user-groups"),
+    ("service_accounts", "service-accounts"),
+    ("roles", "roles"),
+    ("approval_rules", "approval-rules"),
+    ("audit", "audit"),
+    ("ldap", "ldap"),
+    ("clone", "clone-sessions"),
+    ("disks", "disks"),
+    ("callbacks", "callbacks"),
+    ("boot_files", "boot-files"),
+    ("health", "health"),
+]
+
 # Mount API routes
-app.include_router(boot.router, prefix="/api/v1", tags=["boot"])
-app.include_router(boot_pi.router, prefix="/api/v1", tags=["boot-pi"])
-app.include_router(ipxe.router, prefix="/api/v1", tags=["ipxe"])
-app.include_router(nodes.router, prefix="/api/v1", tags=["nodes"])
-app.include_router(groups.router, prefix="/api/v1", tags=["groups"])
-app.include_router(sites.router, prefix="/api/v1", tags=["sites"])
-app.include_router(agents.router, prefix="/api/v1", tags=["agents"])
-app.include_router(storage.router, prefix="/api/v1", tags=["storage"])
-app.include_router(files.router, prefix="/api/v1", tags=["files"])
-app.include_router(luns.router, prefix="/api/v1", tags=["luns"])
-app.include_router(system.router, prefix="/api/v1", tags=["system"])
-app.include_router(sync_jobs_router, prefix="/api/v1", tags=["sync-jobs"])
-app.include_router(workflows_router, prefix="/api/v1", tags=["workflows"])
-app.include_router(templates_router, prefix="/api/v1", tags=["templates"])
-app.include_router(activity_router, prefix="/api/v1", tags=["activity"])
-app.include_router(approvals_router, prefix="/api/v1", tags=["approvals"])
-app.include_router(auth_router, prefix="/api/v1", tags=["auth"])
-app.include_router(users_router, prefix="/api/v1", tags=["users"])
-app.include_router(ws_router, prefix="/api/v1", tags=["websocket"])
-app.include_router(hypervisors_router, prefix="/api/v1", tags=["hypervisors"])
-app.include_router(user_groups_router, prefix="/api/v1", tags=["user-groups"])
-app.include_router(service_accounts_router, prefix="/api/v1", tags=["service-accounts"])
-app.include_router(roles_router, prefix="/api/v1", tags=["roles"])
-app.include_router(approval_rules_router, prefix="/api/v1", tags=["approval-rules"])
-app.include_router(audit_router, prefix="/api/v1", tags=["audit"])
-app.include_router(ldap_router, prefix="/api/v1", tags=["ldap"])
-app.include_router(clone_router, prefix="/api/v1", tags=["clone-sessions"])
-app.include_router(disks_router, prefix="/api/v1", tags=["disks"])
-app.include_router(callbacks_router, prefix="/api/v1", tags=["callbacks"])
-app.include_router(boot_files_router, prefix="/api/v1", tags=["boot-files"])
-app.include_router(health_router, prefix="/api/v1", tags=["health"])
-
-# Static assets directory
+for module_name, tag in API_ROUTERS:
+    module = importlib.import_module(f"src.api.routes.{module_name}")
+    app.include_router(module.router, prefix="/api/v1", tags=[tag])
+
+# Static assets directory, resolved once for the SPA handlers
 assets_dir = Path("assets")
+ASSETS_ROOT = assets_dir.resolve()
+ASSETS_PREFIX = f"{ASSETS_ROOT}{os.sep}"
+INDEX_FILE = ASSETS_ROOT / "index.html"
+FRONTEND_NOT_BUILT = {"error": "Frontend not built. Run 'npm run build' in frontend directory."}
 
 
 @app.get("/health")
@@ -571,26 +660,63 @@ async def health_check():
         "status": "healthy",
         "tftp_enabled": tftp_server is not None,
         "dhcp_proxy_enabled": dhcp_proxy is not None,
+        "scheduled_jobs_registered": (
+            register_jobs_task is not None and register_jobs_task.done()
+        ),
     }
 
 
+class HashedStaticFiles(StaticFiles):
+    """Static files whose names carry a content hash, cached for a year.
+
+    Vite fingerprints every bundle it emits, so a changed file always gets
+    a new URL and browsers never need to revalidate the old one.
+    """
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 # Serve React SPA - must be after API routes
 # Mount static assets subdirectory if it exists (contains JS, CSS from Vite build)
 assets_subdir = assets_dir / "assets"
 if assets_subdir.exists():
-    app.mount("/assets", StaticFiles(directory=str(assets_subdir)), name="static-assets")
+    app.mount(
+        "/assets",
+        HashedStaticFiles(directory=str(assets_subdir), check_dir=False),
+        name="static-assets",
+    )
+
 
+def _index_response(request: Request) -> Response | dict:
+    """Serve index.html from one stat, answering revalidations with 304.
 
-@app.get("/")
-async def serve_spa_root():
+    The stat is not cached across requests: a rebuilt frontend must not be
+    served with the old file's length and ETag.
+    """
+    try:
+        stat_result = os.stat(INDEX_FILE)
+    except FileNotFoundError:
+        return FRONTEND_NOT_BUILT
+
+    # Bundles are content-hashed; only index.html needs revalidating
+    headers = {"Cache-Control": "no-cache"}
+    response = FileResponse(INDEX_FILE, headers=headers, stat_result=stat_result)
+    etag = response.headers["etag"]
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={**headers, "ETag": etag})
+    return response
+
+
+@app.get("/", include_in_schema=False)
+async def serve_spa_root(request: Request):
     """Serve the React SPA index.html at root."""
-    index_file = assets_dir / "index.html"
-    if index_file.exists():
-        return FileResponse(index_file)
-    return {"error": "Frontend not built. Run 'npm run build' in frontend directory."}
+    return _index_response(request)
 
 
-@app.get("/{full_path:path}")
+@app.get("/{full_path:path}", include_in_schema=False)
 async def serve_spa_catchall(request: Request, full_path: str):
     """Serve static files or fallback to index.html for SPA routing."""
     # Skip API paths (should be handled by routers above)
@@ -599,15 +725,18 @@ async def serve_spa_catchall(request: Request, full_path: str):
 
     # Try to serve the exact file first
     # Resolve the path and verify it stays within assets_dir to prevent path traversal
-    file_path = (assets_dir / full_path).resolve()
-    if file_path.is_relative_to(assets_dir.resolve()) and file_path.exists() and file_path.is_file():
-        return FileResponse(file_path)
+    file_path = os.path.realpath(os.path.join(ASSETS_ROOT, full_path))
+    if file_path.startswith(ASSETS_PREFIX):
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            stat_result = None
+        # FileResponse reuses the stat instead of taking its own
+        if stat_result and stat.S_ISREG(stat_result.st_mode):
+            return FileResponse(file_path, stat_result=stat_result)
 
     # Fallback to index.html for SPA client-side routing
-    index_file = assets_dir / "index.html"
-    if index_file.exists():
-        return FileResponse(index_file)
-    return {"error": "Frontend not built. Run 'npm run build' in frontend directory."}
+    return _index_response(request)
 
 
 def main():
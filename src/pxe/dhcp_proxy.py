@@ -9,7 +9,7 @@ This enables network boot without requiring custom-compiled iPXE binaries.
 import asyncio
 import logging
 import struct
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import IntEnum
 
 logger = logging.getLogger(__name__)
@@ -29,8 +29,15 @@ BOOT_FILES = {
     ClientArchitecture.UEFI_X64_ALT: "uefi/ipxe.efi",
 }
 
+# Option 93 codes we boot; others (ARM, HTTP boot, ...) map to None without
+# going through the enum's ValueError path
+ARCH_BY_CODE = {arch.value: arch for arch in ClientArchitecture}
 
-@dataclass
+# Marks the start of the options field (RFC 2131)
+DHCP_MAGIC_COOKIE = b"\x63\x82\x53\x63"
+
+
+@dataclass(slots=True)
 class DHCPPacket:
     """Parsed DHCP packet."""
     op: int
@@ -40,7 +47,6 @@ class DHCPPacket:
     client_mac: bytes
     client_arch: ClientArchitecture | None = None
     is_ipxe: bool = False
-    options: dict = field(default_factory=dict)
 
     @classmethod
     def parse(cls, data: bytes) -> "DHCPPacket":
@@ -54,14 +60,15 @@ class DHCPPacket:
         xid = data[4:8]
         client_mac = data[28:28 + hlen]
 
-        # Parse options (after magic cookie at byte 236)
-        options = {}
+        # Parse options (after magic cookie at byte 236). Only the options
+        # that pick the boot file are read; the rest are skipped unsliced.
         client_arch = None
         is_ipxe = False
 
-        if data[236:240] == b"\x63\x82\x53\x63":  # Magic cookie
+        if data.startswith(DHCP_MAGIC_COOKIE, 236):
             i = 240
-            while i < len(data):
+            end = len(data)
+            while i < end:
                 opt_code = data[i]
                 if opt_code == 255:  # End
                     break
@@ -70,25 +77,18 @@ class DHCPPacket:
                     continue
 
                 opt_len = data[i + 1]
-                opt_data = data[i + 2:i + 2 + opt_len]
-                options[opt_code] = opt_data
 
                 # Option 93: Client System Architecture
                 if opt_code == 93 and opt_len >= 2:
-                    arch_type = struct.unpack("!H", opt_data[:2])[0]
-                    try:
-                        client_arch = ClientArchitecture(arch_type)
-                    except ValueError:
-                        client_arch = None
+                    arch_type = struct.unpack_from("!H", data, i + 2)[0]
+                    client_arch = ARCH_BY_CODE.get(arch_type)
 
                 # Option 77: User Class - iPXE identifies itself here
-                if opt_code == 77:
-                    user_class = opt_data.decode("ascii", errors="ignore")
-                    if "iPXE" in user_class:
-                        is_ipxe = True
+                elif opt_code == 77 and b"iPXE" in data[i + 2:i + 2 + opt_len]:
+                    is_ipxe = True
 
                 # Option 175: iPXE encapsulated options (alternative detection)
-                if opt_code == 175:
+                elif opt_code == 175:
                     is_ipxe = True
 
                 i += 2 + opt_len
@@ -101,7 +101,6 @@ class DHCPPacket:
             client_mac=client_mac,
             client_arch=client_arch,
             is_ipxe=is_ipxe,
-            options=options
         )
 
 
@@ -136,6 +135,16 @@ class DHCPProxy:
         self.port = port
         self.transport = None
 
+        # Offers only differ per client in the BOOTP header, so the rest of
+        # each reply is built once per boot file
+        self._ipxe_template = self._build_template(
+            self.get_ipxe_script_url(), is_ipxe=True
+        )
+        self._firmware_templates = {
+            arch: self._build_template(self.get_boot_file(arch), is_ipxe=False)
+            for arch in (None, *ClientArchitecture)
+        }
+
     def get_boot_file(self, arch: ClientArchitecture | None) -> str:
         """Get boot file path for client architecture."""
         if arch is None:
@@ -152,10 +161,16 @@ class DHCPProxy:
         For raw firmware: Returns TFTP server + boot file (iPXE binary)
         For iPXE clients: Returns HTTP boot script URL
         """
-        response = bytearray(512)  # Larger buffer for HTTP URLs
+        if request.is_ipxe:
+            # iPXE client - serve HTTP boot script URL
+            template = self._ipxe_template
+        else:
+            # Raw firmware - serve iPXE binary via TFTP
+            template = self._firmware_templates[request.client_arch]
+
+        response = bytearray(template)
 
         # BOOTP header
-        response[0] = 2  # op: BOOTREPLY
         response[1] = request.htype
         response[2] = request.hlen
         response[4:8] = request.xid
@@ -163,24 +178,24 @@ class DHCPProxy:
         # Copy client MAC
         response[28:28 + request.hlen] = request.client_mac
 
-        # Determine boot file based on client type
-        if request.is_ipxe:
-            # iPXE client - serve HTTP boot script URL
-            boot_file = self.get_ipxe_script_url()
-        else:
-            # Raw firmware - serve iPXE binary via TFTP
-            boot_file = self.get_boot_file(request.client_arch)
+        return bytes(response)
+
+    def _build_template(self, boot_file: str, is_ipxe: bool) -> bytes:
+        """Build an offer with everything but the client's header fields."""
+        response = bytearray(512)  # Larger buffer for HTTP URLs
+
+        response[0] = 2  # op: BOOTREPLY
 
         boot_file_bytes = boot_file.encode("ascii")
 
         # For non-iPXE, put boot file in sname field (bytes 108-171, 63 chars max)
         # For iPXE with HTTP URL, we only use option 67
-        if not request.is_ipxe:
+        if not is_ipxe:
             sname_bytes = boot_file_bytes[:63]
             response[108:108 + len(sname_bytes)] = sname_bytes
 
         # Magic cookie
-        response[236:240] = b"\x63\x82\x53\x63"
+        response[236:240] = DHCP_MAGIC_COOKIE
 
         # Options
         i = 240
@@ -194,7 +209,7 @@ class DHCPProxy:
         response[i:i + 6] = bytes([54, 4]) + server_ip
         i += 6
 
-        if not request.is_ipxe:
+        if not is_ipxe:
             # Option 66: TFTP Server Name (only for initial boot)
             tftp_bytes = self.tftp_server.encode("ascii")
             response[i:i + 2 + len(tftp_bytes) + 1] = (
@@ -252,24 +267,31 @@ class DHCPProxyProtocol(asyncio.DatagramProtocol):
 
     def datagram_received(self, data: bytes, addr: tuple):
         """Handle incoming DHCP packet."""
+        # Only full-size BOOTREQUESTs get an offer; drop anything else
+        # before parsing (short datagrams would otherwise log as errors)
+        if len(data) < 240 or data[0] != 1:
+            return
+
         try:
             packet = DHCPPacket.parse(data)
+            response = self.proxy.build_offer(packet)
+            self.transport.sendto(response, addr)
 
-            if packet.op == 1:  # BOOTREQUEST
-                arch = packet.client_arch.name if packet.client_arch else "unknown"
-                client_type = "iPXE" if packet.is_ipxe else "firmware"
+            # Only describe the request when the line will be emitted
+            if logger.isEnabledFor(logging.INFO):
+                self._log_request(packet)
 
-                if packet.is_ipxe:
-                    boot_target = self.proxy.get_ipxe_script_url()
-                else:
-                    boot_target = self.proxy.get_boot_file(packet.client_arch)
+        except Exception as e:
+            logger.error(f"Error handling DHCP packet: {e}")
 
-                logger.info(
-                    f"DHCP request: {client_type} ({arch}) → {boot_target}"
-                )
+    def _log_request(self, packet: DHCPPacket) -> None:
+        """Log which boot target a request was offered."""
+        arch = packet.client_arch.name if packet.client_arch else "unknown"
+        client_type = "iPXE" if packet.is_ipxe else "firmware"
 
-                response = self.proxy.build_offer(packet)
-                self.transport.sendto(response, addr)
+        if packet.is_ipxe:
+            boot_target = self.proxy.get_ipxe_script_url()
+        else:
+            boot_target = self.proxy.get_boot_file(packet.client_arch)
 
-        except Exception as e:
-            logger.error(f"Error handling DHCP packet: {e}")
+        logger.info(f"DHCP request: {client_type} ({arch}) → {boot_target}")
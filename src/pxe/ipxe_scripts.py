@@ -1,6 +1,7 @@
 """iPXE script generation."""
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,12 @@ ASCII_LOGO = r"""
 /_/    \__,_/_/   \___/_____/\____/\____/\__/
 """
 
+# The logo as iPXE echo commands, backslashes escaped; built once at import
+ASCII_LOGO_ECHO = "\n".join(
+    "echo " + line.replace("\\", "\\\\")
+    for line in ASCII_LOGO.strip().split("\n")
+)
+
 # iPXE color codes (ANSI sequences)
 COLOR_CYAN = "${cls}color --rgb 0x00d4ff 0x000000"
 COLOR_WHITE = "color --rgb 0xffffff 0x000000"
@@ -30,52 +37,41 @@ class IPXEScriptGenerator:
 
     def generate_boot_script(self) -> str:
         """Generate the main boot script served by the API."""
-        lines = ["#!ipxe", ""]
-
-        # Clear screen
-        lines.append("console --x 1024 --y 768 2>/dev/null || console --x 800 --y 600 2>/dev/null ||")
-        lines.append("cpair --foreground 7 --background 0 0")
-        lines.append("")
-
         # Try PNG logo first
+        picture = ""
         if self.logo_url:
-            lines.append(f"console --picture http://{self.server_address}{self.logo_url} --keep 2>/dev/null ||")
-            lines.append("")
-
-        # ASCII logo with cyan color
-        lines.append("cpair --foreground 6 --background 0 1")
-        lines.append("colour 1")
-        for line in ASCII_LOGO.strip().split("\n"):
-            # Escape special characters for iPXE echo
-            escaped = line.replace("\\", "\\\\")
-            lines.append(f"echo {escaped}")
-
-        # Reset to white and show info
-        lines.append("cpair --foreground 7 --background 0 0")
-        lines.append("colour 0")
-        lines.append("echo")
-        lines.append("echo Network Boot Infrastructure")
-        lines.append("echo ============================")
-        lines.append("echo")
-        lines.append("echo MAC Address: ${mac}")
-        lines.append("echo IP Address:  ${ip}")
-        lines.append("echo")
-        lines.append("echo Contacting PureBoot server...")
-        lines.append("echo")
-
-        # Fetch and chain to boot instructions
+            picture = (
+                f"console --picture http://{self.server_address}{self.logo_url}"
+                " --keep 2>/dev/null ||\n\n"
+            )
+
         timeout_ms = self.timeout * 1000
-        lines.extend([
-            ":retry",
-            f"chain --timeout {timeout_ms} http://{self.server_address}/api/v1/boot?mac=${{mac:hexhyp}} && goto end ||",
-            "echo Server unreachable. Retrying in 5 seconds...",
-            "sleep 5",
-            "goto retry",
-            "",
-            ":end",
-        ])
-
-        return "\n".join(lines)
+        return f"""#!ipxe
+
+console --x 1024 --y 768 2>/dev/null || console --x 800 --y 600 2>/dev/null ||
+cpair --foreground 7 --background 0 0
+
+{picture}cpair --foreground 6 --background 0 1
+colour 1
+{ASCII_LOGO_ECHO}
+cpair --foreground 7 --background 0 0
+colour 0
+echo
+echo Network Boot Infrastructure
+echo ============================
+echo
+echo MAC Address: ${{mac}}
+echo IP Address:  ${{ip}}
+echo
+echo Contacting PureBoot server...
+echo
+:retry
+chain --timeout {timeout_ms} http://{self.server_address}/api/v1/boot?mac=${{mac:hexhyp}} && goto end ||
+echo Server unreachable. Retrying in 5 seconds...
+sleep 5
+goto retry
+
+:end"""
 
     def generate_local_boot(self) -> str:
         """Generate script for local boot."""
@@ -144,6 +140,22 @@ boot
 """
 
 
+@lru_cache(maxsize=32)
+def boot_script_bytes(
+    server_address: str, timeout: int = 5, logo_url: str | None = None
+) -> bytes:
+    """Return the encoded main boot script, built once per server and settings.
+
+    The script only depends on its arguments, so repeated chainloads reuse
+    the same buffer. The cache is bounded because the server address can
+    come from a query parameter.
+    """
+    generator = IPXEScriptGenerator(
+        server_address=server_address, timeout=timeout, logo_url=logo_url
+    )
+    return generator.generate_boot_script().encode()
+
+
 def update_tftp_boot_scripts(tftp_root: Path, server_address: str) -> None:
     """Update TFTP boot scripts with current server address.
 
@@ -158,41 +170,34 @@ def update_tftp_boot_scripts(tftp_root: Path, server_address: str) -> None:
 
     # Main autoexec.ipxe in TFTP root
     autoexec_path = tftp_root / "autoexec.ipxe"
-    autoexec_content = generator.generate_autoexec_script()
-
-    # Check if update is needed
-    needs_update = True
-    if autoexec_path.exists():
-        existing = autoexec_path.read_text()
-        if existing == autoexec_content:
-            logger.debug("TFTP boot scripts already up to date")
-            needs_update = False
-        elif f"Server: {server_address}" not in existing:
-            logger.info(f"Server address changed, updating TFTP boot scripts")
-
-    if needs_update:
-        # Write autoexec.ipxe
-        autoexec_path.write_text(autoexec_content)
+    if _write_if_changed(autoexec_path, generator.generate_autoexec_script()):
         logger.info(f"Updated {autoexec_path} with server address {server_address}")
-
-        # Also update uefi/boot.ipxe for UEFI-specific chaining
-        uefi_boot_path = tftp_root / "uefi" / "boot.ipxe"
-        if uefi_boot_path.parent.exists():
-            uefi_content = f"""#!ipxe
-# PureBoot UEFI boot script - Auto-generated
+    else:
+        logger.debug("TFTP boot scripts already up to date")
+
+    # uefi/boot.ipxe and bios/boot.ipxe for firmware-specific chaining
+    for subdir, mode in (("uefi", "UEFI"), ("bios", "BIOS")):
+        boot_path = tftp_root / subdir / "boot.ipxe"
+        if not boot_path.parent.exists():
+            continue
+        content = f"""#!ipxe
+# PureBoot {mode} boot script - Auto-generated
 dhcp
 chain http://{server_address}/api/v1/ipxe/boot.ipxe || shell
 """
-            uefi_boot_path.write_text(uefi_content)
-            logger.info(f"Updated {uefi_boot_path}")
-
-        # Update bios/boot.ipxe for BIOS-specific chaining
-        bios_boot_path = tftp_root / "bios" / "boot.ipxe"
-        if bios_boot_path.parent.exists():
-            bios_content = f"""#!ipxe
-# PureBoot BIOS boot script - Auto-generated
-dhcp
-chain http://{server_address}/api/v1/ipxe/boot.ipxe || shell
-"""
-            bios_boot_path.write_text(bios_content)
-            logger.info(f"Updated {bios_boot_path}")
+        if _write_if_changed(boot_path, content):
+            logger.info(f"Updated {boot_path}")
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content unless the file already holds it; return whether it wrote.
+
+    Skipping identical writes keeps mtimes stable for TFTP clients.
+    """
+    try:
+        if path.read_text() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(content)
+    return True
@@ -9,6 +9,7 @@ containing:
 - Generated cmdline.txt with kernel parameters
 """
 import logging
+import os
 import re
 import shutil
 from pathlib import Path
@@ -16,8 +17,9 @@ from typing import List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
-# Valid serial number pattern: 8 lowercase hex characters
-SERIAL_PATTERN = re.compile(r"^[0-9a-f]{8}$")
+# Valid serial numbers are 8 hex characters (compared lowercased)
+SERIAL_LENGTH = 8
+SERIAL_HEX_DIGITS = frozenset("0123456789abcdef")
 
 # Known Pi boot files for detection (combined approach)
 # These files indicate a request is likely from a Pi network boot
@@ -83,6 +85,28 @@ PI_MODELS = {
     },
 }
 
+VALID_MODELS = ", ".join(PI_MODELS)
+
+
+def get_model_config(pi_model: str) -> dict:
+    """Look up a Pi model's boot configuration.
+
+    Args:
+        pi_model: Pi model (pi3, pi3b+, cm3, pi4, pi5).
+
+    Returns:
+        The model's entry in PI_MODELS.
+
+    Raises:
+        ValueError: If the model is unknown.
+    """
+    model_config = PI_MODELS.get(pi_model)
+    if model_config is None:
+        raise ValueError(
+            f"Unknown Pi model: '{pi_model}'. Valid models: {VALID_MODELS}"
+        )
+    return model_config
+
 
 def validate_serial(serial: str) -> bool:
     """Validate Pi serial number format.
@@ -93,7 +117,30 @@ def validate_serial(serial: str) -> bool:
     Returns:
         True if valid, False otherwise.
     """
-    return bool(SERIAL_PATTERN.match(serial.lower()))
+    # A length check and set containment, no regex engine: this runs for
+    # every TFTP request path
+    return (
+        len(serial) == SERIAL_LENGTH
+        and SERIAL_HEX_DIGITS.issuperset(serial.lower())
+    )
+
+
+def _entry_names(directory: Path) -> Set[str]:
+    """Return the names in a directory, or an empty set if it is missing."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def _symlink_once(src: str, dst: str) -> None:
+    """Link dst to src, leaving an existing dst untouched."""
+    try:
+        os.symlink(src, dst)
+    except FileExistsError:
+        return
+    logger.debug(f"Created symlink: {dst} -> {src}")
 
 
 def is_pi_boot_file(filename: str) -> bool:
@@ -235,12 +282,17 @@ class PiManager:
         Returns:
             List of serial numbers with directories.
         """
-        nodes = []
-        if self.nodes_dir.exists():
-            for path in self.nodes_dir.iterdir():
-                if path.is_dir() and validate_serial(path.name):
-                    nodes.append(path.name)
-        return sorted(nodes)
+        try:
+            # DirEntry.is_dir() answers from the directory listing where
+            # the filesystem reports entry types, saving a stat per entry
+            with os.scandir(self.nodes_dir) as entries:
+                return sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir() and validate_serial(entry.name)
+                )
+        except FileNotFoundError:
+            return []
 
     def create_node_directory(
         self,
@@ -268,53 +320,42 @@ class PiManager:
             ValueError: If serial number is invalid or model unknown.
         """
         serial = self._validate_serial(serial)
-
-        if pi_model not in PI_MODELS:
-            raise ValueError(
-                f"Unknown Pi model: '{pi_model}'. "
-                f"Valid models: {list(PI_MODELS.keys())}"
-            )
-
-        model_config = PI_MODELS[pi_model]
+        model_config = get_model_config(pi_model)
         node_dir = self.nodes_dir / serial
 
         # Create node directory
         node_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Creating Pi node directory: {node_dir}")
 
-        # Create symlinks to firmware files
-        for firmware_file in model_config["firmware_files"]:
-            src = self.firmware_dir / firmware_file
-            dst = node_dir / firmware_file
-            if src.exists() and not dst.exists():
-                dst.symlink_to(src)
-                logger.debug(f"Created symlink: {dst} -> {src}")
+        # One directory listing per source instead of a stat per linked file
+        firmware_present = _entry_names(self.firmware_dir)
+        deploy_present = _entry_names(self.deploy_dir)
 
-        # Create symlink to DTB
-        dtb_file = model_config["dtb"]
-        dtb_src = self.firmware_dir / dtb_file
-        dtb_dst = node_dir / dtb_file
-        if dtb_src.exists() and not dtb_dst.exists():
-            dtb_dst.symlink_to(dtb_src)
-            logger.debug(f"Created symlink: {dtb_dst} -> {dtb_src}")
+        # Create symlinks to firmware files and the DTB
+        for firmware_file in [*model_config["firmware_files"], model_config["dtb"]]:
+            if firmware_file in firmware_present:
+                _symlink_once(
+                    os.path.join(self.firmware_dir, firmware_file),
+                    os.path.join(node_dir, firmware_file),
+                )
 
         # Create symlinks to deploy files (kernel and initramfs)
         deploy_files = ["kernel8.img", "initramfs.img"]
         for deploy_file in deploy_files:
-            src = self.deploy_dir / deploy_file
-            dst = node_dir / deploy_file
-            if src.exists() and not dst.exists():
-                dst.symlink_to(src)
-                logger.debug(f"Created symlink: {dst} -> {src}")
+            if deploy_file in deploy_present:
+                _symlink_once(
+                    os.path.join(self.deploy_dir, deploy_file),
+                    os.path.join(node_dir, deploy_file),
+                )
 
         # Generate and write config.txt
-        config_txt = self.generate_config_txt(serial, pi_model)
+        config_txt = self._render_config_txt(serial, pi_model, model_config)
         config_path = node_dir / "config.txt"
         config_path.write_text(config_txt)
         logger.debug(f"Created config.txt: {config_path}")
 
         # Generate and write cmdline.txt
-        cmdline_txt = self.generate_cmdline_txt(serial, controller_url)
+        cmdline_txt = self._render_cmdline_txt(serial, controller_url)
         cmdline_path = node_dir / "cmdline.txt"
         cmdline_path.write_text(cmdline_txt)
         logger.debug(f"Created cmdline.txt: {cmdline_path}")
@@ -358,64 +399,49 @@ class PiManager:
 
         Returns:
             config.txt content as string.
+
+        Raises:
+            ValueError: If serial number is invalid or model unknown.
         """
         serial = self._validate_serial(serial)
+        return self._render_config_txt(
+            serial, pi_model, get_model_config(pi_model)
+        )
 
-        if pi_model not in PI_MODELS:
-            raise ValueError(f"Unknown Pi model: '{pi_model}'")
-
-        model_config = PI_MODELS[pi_model]
-        lines = [
-            "# PureBoot auto-generated config.txt",
-            f"# Pi Serial: {serial}",
-            f"# Pi Model: {pi_model}",
-            "",
-            "# Boot configuration",
-        ]
-
+    def _render_config_txt(
+        self,
+        serial: str,
+        pi_model: str,
+        model_config: dict,
+    ) -> str:
+        """Render config.txt for an already validated serial and model."""
         # 64-bit mode
-        if model_config["arm_64bit"]:
-            lines.append("arm_64bit=1")
+        arm_64bit = "arm_64bit=1\n" if model_config["arm_64bit"] else ""
 
-        # Kernel and initramfs
-        lines.extend([
-            "",
-            "# Kernel",
-            "kernel=kernel8.img",
-            "initramfs initramfs.img followkernel",
-        ])
+        return f"""# PureBoot auto-generated config.txt
+# Pi Serial: {serial}
+# Pi Model: {pi_model}
 
-        # Device tree
-        lines.extend([
-            "",
-            "# Device tree",
-            f"device_tree={model_config['dtb']}",
-        ])
+# Boot configuration
+{arm_64bit}
+# Kernel
+kernel=kernel8.img
+initramfs initramfs.img followkernel
 
-        # Enable UART for debugging
-        lines.extend([
-            "",
-            "# UART console (for debugging)",
-            "enable_uart=1",
-            "uart_2ndstage=1",
-        ])
+# Device tree
+device_tree={model_config['dtb']}
 
-        # GPU memory (minimal for headless)
-        lines.extend([
-            "",
-            "# GPU memory (minimal for headless)",
-            "gpu_mem=16",
-        ])
+# UART console (for debugging)
+enable_uart=1
+uart_2ndstage=1
 
-        # Disable splash/logo for faster boot
-        lines.extend([
-            "",
-            "# Fast boot",
-            "disable_splash=1",
-            "boot_delay=0",
-        ])
+# GPU memory (minimal for headless)
+gpu_mem=16
 
-        return "\n".join(lines) + "\n"
+# Fast boot
+disable_splash=1
+boot_delay=0
+"""
 
     def generate_cmdline_txt(
         self,
@@ -431,34 +457,23 @@ class PiManager:
         Returns:
             cmdline.txt content as string (single line).
         """
-        serial = self._validate_serial(serial)
-
-        params = [
-            # Console on serial UART
-            "console=serial0,115200",
-            "console=tty1",
-            # Network configuration via DHCP
-            "ip=dhcp",
-            # PureBoot parameters
-            f"pureboot.serial={serial}",
-        ]
-
-        if controller_url:
-            params.append(f"pureboot.url={controller_url}")
-
-        # Root filesystem (initramfs)
-        params.extend([
-            "root=/dev/ram0",
-            "rootfstype=ramfs",
-        ])
+        return self._render_cmdline_txt(self._validate_serial(serial), controller_url)
 
-        # Boot quietly but show errors
-        params.extend([
-            "quiet",
-            "loglevel=4",
-        ])
-
-        return " ".join(params) + "\n"
+    def _render_cmdline_txt(
+        self,
+        serial: str,
+        controller_url: Optional[str] = None,
+    ) -> str:
+        """Render cmdline.txt for an already validated serial."""
+        url = f" pureboot.url={controller_url}" if controller_url else ""
+
+        # Serial and screen consoles, DHCP networking, PureBoot parameters,
+        # initramfs root, and quiet boot that still shows errors
+        return (
+            "console=serial0,115200 console=tty1 ip=dhcp "
+            f"pureboot.serial={serial}{url} "
+            "root=/dev/ram0 rootfstype=ramfs quiet loglevel=4\n"
+        )
 
     def update_cmdline_txt(
         self,
@@ -480,7 +495,7 @@ class PiManager:
         if not node_dir.exists():
             raise FileNotFoundError(f"Node directory not found: {serial}")
 
-        cmdline_txt = self.generate_cmdline_txt(serial, controller_url)
+        cmdline_txt = self._render_cmdline_txt(serial, controller_url)
         cmdline_path = node_dir / "cmdline.txt"
         cmdline_path.write_text(cmdline_txt)
         logger.info(f"Updated cmdline.txt for node: {serial}")
@@ -505,7 +520,9 @@ class PiManager:
         if not node_dir.exists():
             raise FileNotFoundError(f"Node directory not found: {serial}")
 
-        config_txt = self.generate_config_txt(serial, pi_model)
+        config_txt = self._render_config_txt(
+            serial, pi_model, get_model_config(pi_model)
+        )
         config_path = node_dir / "config.txt"
         config_path.write_text(config_txt)
         logger.info(f"Updated config.txt for node: {serial}")
@@ -548,63 +565,65 @@ class PiManager:
         Raises:
             ValueError: If serial number is invalid.
         """
-        serial = self._validate_serial(serial)
-
-        params = [
-            # Console on serial UART
-            "console=serial0,115200",
-            "console=tty1",
-            # Network configuration via DHCP
-            "ip=dhcp",
-            # PureBoot parameters
-            f"pureboot.serial={serial}",
-            f"pureboot.state={state}",
-        ]
+        return self._render_cmdline_for_state(
+            self._validate_serial(serial),
+            state,
+            controller_url,
+            node_id,
+            mac,
+            image_url,
+            target_device,
+            callback_url,
+            nfs_server,
+            nfs_path,
+        )
 
-        # Add controller URL if provided
-        if controller_url:
-            params.append(f"pureboot.url={controller_url}")
+    def _render_cmdline_for_state(
+        self,
+        serial: str,
+        state: str,
+        controller_url: Optional[str] = None,
+        node_id: Optional[str] = None,
+        mac: Optional[str] = None,
+        image_url: Optional[str] = None,
+        target_device: Optional[str] = None,
+        callback_url: Optional[str] = None,
+        nfs_server: Optional[str] = None,
+        nfs_path: Optional[str] = None,
+    ) -> str:
+        """Render state-aware cmdline.txt for an already validated serial."""
+        url = f" pureboot.url={controller_url}" if controller_url else ""
 
-        # Handle installing state with install mode parameters
         if state == "installing" and image_url:
-            params.extend([
-                "pureboot.mode=install",
-                f"pureboot.image_url={image_url}",
-            ])
-            if target_device:
-                params.append(f"pureboot.target={target_device}")
-            if node_id:
-                params.append(f"pureboot.node_id={node_id}")
-            if mac:
-                params.append(f"pureboot.mac={mac}")
-            if callback_url:
-                params.append(f"pureboot.callback={callback_url}")
-            # Install mode uses ramfs
-            params.extend([
-                "root=/dev/ram0",
-                "rootfstype=ramfs",
-            ])
+            # Install mode parameters, then a ramfs root
+            optional = "".join(
+                f" pureboot.{name}={value}"
+                for name, value in (
+                    ("target", target_device),
+                    ("node_id", node_id),
+                    ("mac", mac),
+                    ("callback", callback_url),
+                )
+                if value
+            )
+            root = (
+                f"pureboot.mode=install pureboot.image_url={image_url}{optional} "
+                "root=/dev/ram0 rootfstype=ramfs"
+            )
         elif nfs_server and nfs_path:
             # NFS root boot
-            params.extend([
-                "root=/dev/nfs",
-                f"nfsroot={nfs_server}:{nfs_path},vers=4,tcp",
-                "rw",
-            ])
+            root = f"root=/dev/nfs nfsroot={nfs_server}:{nfs_path},vers=4,tcp rw"
         else:
             # Default: ramfs root
-            params.extend([
-                "root=/dev/ram0",
-                "rootfstype=ramfs",
-            ])
-
-        # Boot quietly but show errors
-        params.extend([
-            "quiet",
-            "loglevel=4",
-        ])
-
-        return " ".join(params) + "\n"
+            root = "root=/dev/ram0 rootfstype=ramfs"
+
+        # Serial and screen consoles, DHCP networking, PureBoot parameters,
+        # the state's root, and quiet boot that still shows errors
+        return (
+            "console=serial0,115200 console=tty1 ip=dhcp "
+            f"pureboot.serial={serial} pureboot.state={state}{url} "
+            f"{root} quiet loglevel=4\n"
+        )
 
     def update_cmdline_for_state(
         self,
@@ -634,7 +653,7 @@ class PiManager:
         if not node_dir.exists():
             raise FileNotFoundError(f"Node directory not found: {serial}")
 
-        cmdline_txt = self.generate_cmdline_for_state(
+        cmdline_txt = self._render_cmdline_for_state(
             serial=serial,
             state=state,
             **kwargs,
@@ -21,8 +21,9 @@ from src.db.models import (
     ApprovalVote,
     User,
     UserGroup,
-    UserGroupMember,
+    user_group_members,
 )
+from src.db.queries import approvals_with_votes
 
 logger = logging.getLogger(__name__)
 
@@ -79,8 +80,8 @@ async def find_matching_rule(
         The highest priority matching ApprovalRule, or None if no rule matches
     """
     # Get user's group IDs for user_group scope matching
-    user_groups_query = select(UserGroupMember.user_group_id).where(
-        UserGroupMember.user_id == user_id
+    user_groups_query = select(user_group_members.c.user_group_id).where(
+        user_group_members.c.user_id == user_id
     )
     result = await db.execute(user_groups_query)
     user_group_ids = [row[0] for row in result.fetchall()]
@@ -212,12 +213,12 @@ async def create_approval_request(
         rule_id=rule.id,
         operation_type=operation_type,
         action_type=operation_type,  # Legacy field compatibility
-        action_data_json=json.dumps(action_data_dict),
+        action_data_json=action_data_dict,
         requester_id=requester_id,
         requester_name=requester_name,
         required_approvers=rule.required_approvers,
         expires_at=expires_at,
-        metadata_json=json.dumps(metadata) if metadata else None,
+        metadata_json=metadata or None,
     )
 
     db.add(approval)
@@ -269,8 +270,7 @@ async def cast_vote(
 
     # Load approval with votes
     result = await db.execute(
-        select(Approval)
-        .options(selectinload(Approval.votes))
+        approvals_with_votes()
         .where(Approval.id == approval_id)
     )
     approval = result.scalar_one_or_none()
@@ -370,8 +370,7 @@ async def check_user_can_approve(
     """
     # Load approval with votes
     result = await db.execute(
-        select(Approval)
-        .options(selectinload(Approval.votes))
+        approvals_with_votes()
         .where(Approval.id == approval_id)
     )
     approval = result.scalar_one_or_none()
@@ -426,8 +425,7 @@ async def get_pending_approvals_for_user(
     """
     # Get all pending approvals with their votes
     result = await db.execute(
-        select(Approval)
-        .options(selectinload(Approval.votes))
+        approvals_with_votes()
         .where(Approval.status == "pending")
         .order_by(Approval.created_at.desc())
     )
@@ -516,8 +514,8 @@ async def get_expired_approvals(
     now = datetime.now(timezone.utc)
 
     result = await db.execute(
-        select(Approval)
-        .options(selectinload(Approval.votes), selectinload(Approval.rule))
+        approvals_with_votes()
+        .options(selectinload(Approval.rule))
         .where(Approval.status == "pending")
         .where(Approval.expires_at < now)
     )
@@ -581,8 +579,8 @@ async def get_approval_with_details(
         Approval with votes and rule loaded, or None if not found
     """
     result = await db.execute(
-        select(Approval)
-        .options(selectinload(Approval.votes), selectinload(Approval.rule))
+        approvals_with_votes()
+        .options(selectinload(Approval.rule))
         .where(Approval.id == approval_id)
     )
     return result.scalar_one_or_none()
@@ -609,8 +607,7 @@ async def cancel_approval(
         UserCannotVoteError: If user is not the requester or approval is not pending
     """
     result = await db.execute(
-        select(Approval)
-        .options(selectinload(Approval.votes))
+        approvals_with_votes()
         .where(Approval.id == approval_id)
     )
     approval = result.scalar_one_or_none()
@@ -2,10 +2,10 @@
 import logging
 from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.models import LdapConfig, User, UserGroup, UserGroupMember
+from src.db.models import LdapConfig, User, UserGroup, user_group_members
 from src.utils.crypto import decrypt_value
 
 logger = logging.getLogger(__name__)
@@ -195,23 +195,29 @@ class LdapService:
 
         # Get current memberships
         result = await db.execute(
-            select(UserGroupMember).where(UserGroupMember.user_id == user.id)
+            select(user_group_members.c.user_group_id).where(
+                user_group_members.c.user_id == user.id
+            )
         )
-        current_memberships = result.scalars().all()
-        current_group_ids = {m.user_group_id for m in current_memberships}
+        current_group_ids = set(result.scalars().all())
 
         # Add missing memberships
-        for group_id in target_group_ids - current_group_ids:
-            db.add(UserGroupMember(user_id=user.id, user_group_id=group_id))
+        missing_ids = target_group_ids - current_group_ids
+        if missing_ids:
+            await db.execute(
+                insert(user_group_members),
+                [{"user_id": user.id, "user_group_id": gid} for gid in missing_ids],
+            )
 
         # Remove stale memberships (only for LDAP-mapped groups)
         ldap_mapped_ids = {g.id for g in mapped_groups}
-        for membership in current_memberships:
-            if (
-                membership.user_group_id in ldap_mapped_ids
-                and membership.user_group_id not in target_group_ids
-            ):
-                await db.delete(membership)
+        stale_ids = (current_group_ids & ldap_mapped_ids) - target_group_ids
+        if stale_ids:
+            await db.execute(
+                delete(user_group_members)
+                .where(user_group_members.c.user_id == user.id)
+                .where(user_group_members.c.user_group_id.in_(stale_ids))
+            )
 
 
 ldap_service = LdapService()
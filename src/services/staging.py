@@ -1,5 +1,4 @@
 """Staging provisioning service for staged mode cloning."""
-import json
 import logging
 from typing import Literal
 
@@ -58,7 +57,7 @@ class StagingService:
         if not backend:
             raise ValueError("Storage backend not found")
 
-        config = json.loads(backend.config_json)
+        config = backend.config_json
 
         if backend.type == "nfs":
             return await self._provision_nfs(session, backend, config)
@@ -180,7 +179,7 @@ class StagingService:
         if not backend:
             raise ValueError("Storage backend not found")
 
-        config = json.loads(backend.config_json)
+        config = backend.config_json
 
         if backend.type == "nfs":
             export_path = config.get("export_path", config.get("export", "/data"))
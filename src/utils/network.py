@@ -1,7 +1,23 @@
 """Network utility functions."""
+import ipaddress
 import socket
 
 
+def normalize_ip(ip: str | None) -> str | None:
+    """Return the canonical form of an IPv4/IPv6 address.
+
+    Clients report placeholders such as "unknown" when they cannot detect
+    their address, and test clients use non-IP hosts, so empty or
+    unparsable values map to None rather than failing an INET cast.
+    """
+    if not ip:
+        return None
+    try:
+        return str(ipaddress.ip_address(ip.strip()))
+    except ValueError:
+        return None
+
+
 def get_primary_ip() -> str:
     """Get the primary IP address of this machine.
 
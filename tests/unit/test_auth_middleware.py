@@ -0,0 +1,37 @@
+"""Tests for the authentication middleware's public path check."""
+import pytest
+
+from src.api.middleware.auth import is_public_path
+
+
+class TestIsPublicPath:
+    """Test is_public_path."""
+
+    @pytest.mark.parametrize("path", [
+        "/",
+        "/health",
+        "/assets/index-abc123.js",
+        "/nodes/abc",
+        "/settings",
+    ])
+    def test_non_api_paths_public(self, path):
+        """The SPA, its assets and client-side routes need no token."""
+        assert is_public_path(path)
+
+    @pytest.mark.parametrize("path", [
+        "/api/v1/auth/login",
+        "/api/v1/boot",
+        "/api/v1/boot/node/abc",
+        "/api/docs",
+    ])
+    def test_public_api_paths(self, path):
+        """Login, boot and docs endpoints stay open."""
+        assert is_public_path(path)
+
+    @pytest.mark.parametrize("path", [
+        "/api/v1/nodes",
+        "/api/v1/users/abc",
+    ])
+    def test_api_paths_protected(self, path):
+        """Other API endpoints require authentication."""
+        assert not is_public_path(path)
@@ -0,0 +1,151 @@
+"""Tests for bulk ingest helpers."""
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.db.bulk import COPY_THRESHOLD, _copy_records, bulk_copy
+from src.db.models import Base, BulkInsertMixin, Node, NodeEvent, SyncJobRun
+
+
+class TestCopyRecords:
+    """Test COPY record building."""
+
+    def test_fills_python_defaults(self):
+        """Ids and scalar defaults are materialized for COPY."""
+        columns, records = _copy_records(
+            NodeEvent, [{"node_id": "node-1", "event_type": "heartbeat"}]
+        )
+        row = dict(zip(columns, records[0]))
+
+        assert len(row["id"]) == 36
+        assert row["status"] == "success"
+        assert row["node_id"] == "node-1"
+
+    def test_server_default_timestamps_omitted(self):
+        """created_at is left to the database's server default."""
+        columns, _ = _copy_records(
+            NodeEvent, [{"node_id": "node-1", "event_type": "heartbeat"}]
+        )
+
+        assert "created_at" not in columns
+
+    def test_started_at_left_to_server_default(self):
+        """SyncJobRun.started_at has a server default, so COPY omits it."""
+        columns, records = _copy_records(SyncJobRun, [{"job_id": "job-1"}])
+        row = dict(zip(columns, records[0]))
+
+        assert "started_at" not in row
+        assert row["progress_percent"] == 0
+
+    def test_clause_defaults_have_server_defaults(self):
+        """COPY relies on server defaults for func.now() style columns."""
+        for model in BulkInsertMixin.__subclasses__():
+            for column in model.__table__.columns:
+                if column.default is not None and column.default.is_clause_element:
+                    assert column.server_default is not None, (
+                        f"{model.__name__}.{column.name}"
+                    )
+
+    def test_json_encoded(self):
+        """JSON columns are sent as text."""
+        columns, records = _copy_records(NodeEvent, [{
+            "node_id": "node-1",
+            "event_type": "heartbeat",
+            "metadata_json": {"a": 1},
+        }])
+        row = dict(zip(columns, records[0]))
+
+        assert json.loads(row["metadata_json"]) == {"a": 1}
+
+
+class TestBulkCopy:
+    """Test bulk_copy fallback on SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_insert(self):
+        """Without asyncpg rows are written via executemany."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as db:
+            node = Node(mac_address="00:11:22:33:44:55")
+            db.add(node)
+            await db.flush()
+
+            rows = [
+                {"node_id": node.id, "event_type": "heartbeat"}
+                for _ in range(COPY_THRESHOLD + 1)
+            ]
+            written = await bulk_copy(db, NodeEvent, rows)
+            count = await db.scalar(select(func.count()).select_from(NodeEvent))
+
+        await engine.dispose()
+        assert written == count == COPY_THRESHOLD + 1
+
+    @pytest.mark.asyncio
+    async def test_copy_on_asyncpg(self):
+        """Large batches on asyncpg go through copy_records_to_table."""
+        raw = MagicMock()
+        raw.driver_connection.copy_records_to_table = AsyncMock()
+        conn = MagicMock()
+        conn.dialect.driver = "asyncpg"
+        conn.get_raw_connection = AsyncMock(return_value=raw)
+        db = MagicMock()
+        db.connection = AsyncMock(return_value=conn)
+        db.execute = AsyncMock()
+
+        rows = [
+            {"node_id": "node-1", "event_type": "heartbeat"}
+            for _ in range(COPY_THRESHOLD)
+        ]
+        written = await bulk_copy(db, NodeEvent, rows)
+
+        assert written == COPY_THRESHOLD
+        db.execute.assert_not_awaited()
+        copy = raw.driver_connection.copy_records_to_table
+        copy.assert_awaited_once()
+        assert copy.await_args.args == ("node_events",)
+        assert len(copy.await_args.kwargs["records"]) == COPY_THRESHOLD
+        assert "created_at" not in copy.await_args.kwargs["columns"]
+
+
+class TestBulkChangeState:
+    """Test bulk state changes write their audit rows in one batch."""
+
+    @pytest.mark.asyncio
+    async def test_state_logs_written_in_batch(self):
+        """Every transitioned node gets a NodeStateLog row, failures none."""
+        from src.api.routes.nodes import bulk_change_state
+        from src.api.schemas import BulkChangeStateRequest
+        from src.db.models import NodeStateLog
+
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as db:
+            nodes = [
+                Node(mac_address="00:11:22:33:44:55"),
+                Node(mac_address="00:11:22:33:44:66"),
+                Node(mac_address="00:11:22:33:44:77", state="retired"),
+            ]
+            db.add_all(nodes)
+            await db.flush()
+
+            response = await bulk_change_state(
+                BulkChangeStateRequest(
+                    node_ids=[n.id for n in nodes], new_state="pending"
+                ),
+                db,
+            )
+            logs = (await db.execute(select(NodeStateLog))).scalars().all()
+
+        await engine.dispose()
+        assert response.data.updated == 2
+        assert response.data.failed == 1
+        assert sorted(log.node_id for log in logs) == sorted(n.id for n in nodes[:2])
+        assert {log.triggered_by for log in logs} == {"bulk_operation"}
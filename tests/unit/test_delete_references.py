@@ -0,0 +1,191 @@
+"""Tests for delete routes refusing to orphan referencing rows."""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.api.routes.roles import delete_role
+from src.api.routes.sites import delete_site
+from src.api.routes.storage import delete_backend
+from src.api.routes.users import delete_user
+from src.db.models import (
+    ApiKey,
+    Base,
+    DeviceGroup,
+    IscsiLun,
+    MigrationClaim,
+    Node,
+    Role,
+    StorageBackend,
+    SyncState,
+    Template,
+    User,
+)
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Async in-memory database with FK enforcement, as in production."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    event.listen(
+        engine.sync_engine, "connect",
+        lambda conn, _: conn.execute("PRAGMA foreign_keys=ON"),
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+    await engine.dispose()
+
+
+def _user(username: str, **kwargs) -> User:
+    return User(username=username, password_hash="x", role="viewer", **kwargs)
+
+
+class TestDeleteRole:
+    """Test role deletion."""
+
+    @pytest.mark.asyncio
+    async def test_role_held_by_user_is_kept(self, db):
+        """A role still assigned to a user is refused with 409."""
+        role = Role(name="custom")
+        db.add(role)
+        await db.flush()
+        db.add(_user("alice", role_id=role.id))
+        await db.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_role(role.id, db, None)
+
+        assert exc_info.value.status_code == 409
+        assert await db.get(Role, role.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_unused_role_deleted(self, db):
+        """A role nobody holds is deleted."""
+        role = Role(name="custom")
+        db.add(role)
+        await db.commit()
+
+        await delete_role(role.id, db, None)
+
+        assert await db.scalar(select(Role)) is None
+
+
+class TestDeleteUser:
+    """Test user deletion."""
+
+    @pytest.mark.asyncio
+    async def test_user_with_api_keys_is_kept(self, db):
+        """A user who created API keys is refused with 409."""
+        creator = _user("alice")
+        account = _user("svc")
+        db.add_all([creator, account])
+        await db.flush()
+        db.add(ApiKey(
+            service_account_id=account.id, name="ci", key_hash="x",
+            key_prefix="pb_ci", created_by_id=creator.id,
+        ))
+        await db.commit()
+        admin = SimpleNamespace(id="admin-id", role="admin")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_user(creator.id, None, admin, db)
+
+        assert exc_info.value.status_code == 409
+        assert await db.get(User, creator.id) is not None
+
+
+class TestDeleteBackend:
+    """Test storage backend deletion."""
+
+    @pytest_asyncio.fixture
+    async def backend(self, db):
+        backend = StorageBackend(name="san", type="iscsi", config_json={})
+        db.add(backend)
+        await db.commit()
+        return backend
+
+    @pytest.mark.asyncio
+    async def test_backend_with_luns_is_kept(self, db, backend):
+        """A backend hosting LUNs is refused with 409."""
+        db.add(IscsiLun(
+            name="disk0", size_gb=10, backend_id=backend.id,
+            purpose="boot_from_san", iqn="iqn.2026-10.local:disk0",
+        ))
+        await db.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_backend(backend.id, db)
+
+        assert exc_info.value.status_code == 409
+        assert "iSCSI LUN" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_backend_used_by_template_is_kept(self, db, backend):
+        """A backend storing templates is refused with 409."""
+        db.add(Template(name="ubuntu", type="iso", storage_backend_id=backend.id))
+        await db.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_backend(backend.id, db)
+
+        assert exc_info.value.status_code == 409
+        assert "template" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_unused_backend_deleted(self, db, backend):
+        """A backend nothing references is deleted."""
+        await delete_backend(backend.id, db)
+
+        assert await db.scalar(select(StorageBackend)) is None
+
+
+class TestDeleteSite:
+    """Test site deletion."""
+
+    @pytest_asyncio.fixture
+    async def site(self, db):
+        site = DeviceGroup(name="edge", is_site=True)
+        db.add(site)
+        await db.commit()
+        return site
+
+    @pytest.mark.asyncio
+    async def test_sync_state_deleted_with_site(self, db, site):
+        """The site's own sync bookkeeping goes with it."""
+        db.add(SyncState(
+            entity_type="node", entity_id="n1", site_id=site.id,
+            last_modified_by="central",
+        ))
+        await db.commit()
+
+        await delete_site(site.id, db)
+
+        assert await db.scalar(select(SyncState)) is None
+        assert await db.scalar(select(DeviceGroup)) is None
+
+    @pytest.mark.asyncio
+    async def test_site_with_migrations_is_kept(self, db, site):
+        """A site with node migrations into or out of it is refused."""
+        other = DeviceGroup(name="core", is_site=True)
+        node = Node(mac_address="00:11:22:33:44:55")
+        db.add_all([other, node])
+        await db.flush()
+        db.add(MigrationClaim(
+            node_id=node.id, source_site_id=other.id, target_site_id=site.id,
+            expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        ))
+        await db.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_site(site.id, db)
+
+        assert exc_info.value.status_code == 400
+        assert await db.get(DeviceGroup, site.id) is not None
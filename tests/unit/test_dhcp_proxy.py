@@ -1,6 +1,14 @@
 """Tests for Proxy DHCP server."""
 import pytest
-from src.pxe.dhcp_proxy import DHCPPacket, DHCPProxy, ClientArchitecture
+import logging
+from unittest.mock import MagicMock
+
+from src.pxe.dhcp_proxy import (
+    ClientArchitecture,
+    DHCPPacket,
+    DHCPProxy,
+    DHCPProxyProtocol,
+)
 
 
 class TestDHCPPacketParsing:
@@ -24,6 +32,13 @@ class TestDHCPPacketParsing:
         assert parsed.client_arch == ClientArchitecture.UEFI_X64
         assert parsed.is_ipxe is False
 
+    def test_unknown_arch_is_none(self):
+        """Unsupported option 93 codes (here ARM64 UEFI) leave client_arch unset."""
+        packet = self._build_discover_packet(arch=0x0B)
+        parsed = DHCPPacket.parse(packet)
+
+        assert parsed.client_arch is None
+
     def test_detect_ipxe_via_user_class(self):
         """Detect iPXE client via user-class option 77."""
         packet = self._build_discover_packet(arch=0x07, user_class=b"iPXE")
@@ -100,6 +115,80 @@ class TestDHCPPacketParsing:
         # Should NOT contain TFTP server option for iPXE
         # (iPXE uses HTTP, not TFTP for the script)
 
+    def test_build_offer_per_client_header(self):
+        """Offers built from the same template carry each client's xid and MAC."""
+        proxy = DHCPProxy(
+            tftp_server="192.168.1.10",
+            http_server="192.168.1.10:8080"
+        )
+        parsed = DHCPPacket.parse(self._build_discover_packet(arch=0x07))
+        other = DHCPPacket.parse(self._build_discover_packet(arch=0x07))
+        other.xid = b"\xaa\xbb\xcc\xdd"
+        other.client_mac = b"\x00\x11\x22\x33\x44\x66"
+
+        first = proxy.build_offer(parsed)
+        second = proxy.build_offer(other)
+
+        assert first[0] == 2
+        assert first[4:8] == parsed.xid
+        assert first[28:34] == parsed.client_mac
+        assert second[4:8] == b"\xaa\xbb\xcc\xdd"
+        assert second[28:34] == b"\x00\x11\x22\x33\x44\x66"
+        assert first[34:] == second[34:]
+
+    def test_protocol_replies_and_logs(self, caplog):
+        """A BOOTREQUEST is answered and logged with its boot target."""
+        proxy = DHCPProxy(
+            tftp_server="192.168.1.10",
+            http_server="192.168.1.10:8080"
+        )
+        protocol = DHCPProxyProtocol(proxy)
+        protocol.connection_made(MagicMock())
+        packet = self._build_discover_packet(arch=0x07)
+
+        with caplog.at_level(logging.INFO, logger="src.pxe.dhcp_proxy"):
+            protocol.datagram_received(packet, ("192.168.1.50", 68))
+
+        protocol.transport.sendto.assert_called_once_with(
+            proxy.build_offer(DHCPPacket.parse(packet)), ("192.168.1.50", 68)
+        )
+        assert "firmware (UEFI_X64) → uefi/ipxe.efi" in caplog.text
+
+    def test_protocol_skips_log_when_disabled(self, caplog):
+        """With INFO disabled the request is answered without describing it."""
+        proxy = DHCPProxy(
+            tftp_server="192.168.1.10",
+            http_server="192.168.1.10:8080"
+        )
+        protocol = DHCPProxyProtocol(proxy)
+        protocol.connection_made(MagicMock())
+        protocol._log_request = MagicMock()
+
+        with caplog.at_level(logging.WARNING, logger="src.pxe.dhcp_proxy"):
+            protocol.datagram_received(
+                self._build_discover_packet(arch=0x07), ("192.168.1.50", 68)
+            )
+
+        protocol.transport.sendto.assert_called_once()
+        protocol._log_request.assert_not_called()
+
+    def test_protocol_drops_replies_and_runts(self, caplog):
+        """BOOTREPLYs and short datagrams are ignored without an error."""
+        proxy = DHCPProxy(
+            tftp_server="192.168.1.10",
+            http_server="192.168.1.10:8080"
+        )
+        protocol = DHCPProxyProtocol(proxy)
+        protocol.connection_made(MagicMock())
+        reply = bytearray(self._build_discover_packet(arch=0x07))
+        reply[0] = 2
+
+        protocol.datagram_received(bytes(reply), ("192.168.1.50", 68))
+        protocol.datagram_received(b"\x01\x01", ("192.168.1.50", 68))
+
+        protocol.transport.sendto.assert_not_called()
+        assert "Error handling DHCP packet" not in caplog.text
+
     def _build_discover_packet(
         self,
         arch: int,
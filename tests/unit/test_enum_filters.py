@@ -0,0 +1,63 @@
+"""Tests for enum-typed list filters on node, sync job and LUN routes."""
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import src.api.middleware.auth as auth_middleware
+from src.db.database import get_db
+from src.db.models import Base, Node
+from src.main import app
+
+
+@pytest_asyncio.fixture
+async def client(monkeypatch):
+    """API client on an in-memory database with auth bypassed."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with factory() as db:
+        db.add_all([
+            Node(mac_address="00:11:22:33:44:55", state="discovered"),
+            Node(mac_address="00:11:22:33:44:66", state="active"),
+        ])
+        await db.commit()
+
+    async def override_get_db():
+        async with factory() as db:
+            yield db
+
+    monkeypatch.setattr(auth_middleware, "is_public_path", lambda path: True)
+    app.dependency_overrides[get_db] = override_get_db
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+class TestEnumFilters:
+    """Unknown enum values are rejected before reaching the database."""
+
+    @pytest.mark.asyncio
+    async def test_node_state_filter(self, client):
+        """A valid state filters nodes."""
+        response = await client.get("/api/v1/nodes", params={"state": "active"})
+
+        assert response.status_code == 200
+        assert [n["state"] for n in response.json()["data"]] == ["active"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", [
+        "/api/v1/nodes?state=bogus",
+        "/api/v1/storage/sync-jobs?status=bogus",
+        "/api/v1/storage/luns?status=bogus",
+    ])
+    async def test_unknown_value_rejected(self, client, path):
+        """An unknown enum value is a 422, not a database error."""
+        response = await client.get(path)
+
+        assert response.status_code == 422
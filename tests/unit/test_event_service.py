@@ -46,7 +46,7 @@ class TestEventService:
         )
 
         assert event.metadata_json is not None
-        assert "Ubuntu 24.04" in event.metadata_json
+        assert event.metadata_json["os_version"] == "Ubuntu 24.04"
 
     @pytest.mark.asyncio
     async def test_log_event_with_progress(self):
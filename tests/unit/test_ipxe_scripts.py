@@ -1,7 +1,11 @@
 """Tests for iPXE script generation."""
 import pytest
 from pathlib import Path
-from src.pxe.ipxe_scripts import IPXEScriptGenerator, update_tftp_boot_scripts
+from src.pxe.ipxe_scripts import (
+    IPXEScriptGenerator,
+    boot_script_bytes,
+    update_tftp_boot_scripts,
+)
 
 
 class TestIPXEScriptGenerator:
@@ -56,6 +60,27 @@ class TestIPXEScriptGenerator:
         assert "chain" in script or "imgfetch" in script
 
 
+class TestBootScriptBytes:
+    """Test the cached, encoded boot script."""
+
+    def test_matches_generator(self):
+        """Cached bytes are the generator's script, encoded."""
+        generator = IPXEScriptGenerator(
+            server_address="192.168.1.10:8080", timeout=3, logo_url="/logo.png"
+        )
+
+        script = boot_script_bytes("192.168.1.10:8080", 3, "/logo.png")
+
+        assert script == generator.generate_boot_script().encode()
+
+    def test_reused_per_server(self):
+        """The same arguments return the same buffer; others build anew."""
+        first = boot_script_bytes("10.0.0.5:8080")
+
+        assert boot_script_bytes("10.0.0.5:8080") is first
+        assert b"10.0.0.6:8080" in boot_script_bytes("10.0.0.6:8080")
+
+
 class TestGenerateAutoexecScript:
     """Test autoexec.ipxe script generation."""
 
@@ -179,6 +204,26 @@ class TestUpdateTftpBootScripts:
 
         assert first_mtime == second_mtime
 
+    def test_skips_unchanged_chain_scripts(self, tmp_path):
+        """uefi/ and bios/ boot scripts are not rewritten when unchanged."""
+        (tmp_path / "uefi").mkdir()
+        update_tftp_boot_scripts(tmp_path, "192.168.1.10:8080")
+        uefi_path = tmp_path / "uefi" / "boot.ipxe"
+        first_mtime = uefi_path.stat().st_mtime_ns
+
+        update_tftp_boot_scripts(tmp_path, "192.168.1.10:8080")
+
+        assert uefi_path.stat().st_mtime_ns == first_mtime
+
+    def test_writes_chain_script_for_new_directory(self, tmp_path):
+        """A firmware directory added later gets its script on the next run."""
+        update_tftp_boot_scripts(tmp_path, "192.168.1.10:8080")
+        (tmp_path / "bios").mkdir()
+
+        update_tftp_boot_scripts(tmp_path, "192.168.1.10:8080")
+
+        assert "192.168.1.10:8080" in (tmp_path / "bios" / "boot.ipxe").read_text()
+
     def test_includes_server_address_in_all_scripts(self, tmp_path):
         """All generated scripts include the server address."""
         (tmp_path / "uefi").mkdir()
@@ -0,0 +1,71 @@
+"""Tests for SQLite startup migrations."""
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import CreateTable
+
+from src.db.migrations import rebuild_lun_node_fk
+from src.db.models import Base, IscsiLun, Node, StorageBackend
+
+
+@pytest_asyncio.fixture
+async def conn():
+    """Connection to a database whose iscsi_luns predates ON DELETE SET NULL."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    old_ddl = str(
+        CreateTable(IscsiLun.__table__).compile(dialect=sqlite.dialect())
+    ).replace(" ON DELETE SET NULL", "")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text("DROP TABLE iscsi_luns"))
+        await conn.execute(text(old_ddl))
+        await conn.execute(insert(Node).values(id="n1", mac_address="00:11:22:33:44:55"))
+        await conn.execute(insert(StorageBackend).values(
+            id="b1", name="san", type="iscsi", config_json={}
+        ))
+        await conn.execute(insert(IscsiLun), [
+            {"id": "l1", "name": "disk0", "iqn": "iqn:0", "assigned_node_id": "n1",
+             "size_gb": 10, "backend_id": "b1", "purpose": "boot_from_san"},
+            {"id": "l2", "name": "disk1", "iqn": "iqn:1", "assigned_node_id": "gone",
+             "size_gb": 10, "backend_id": "b1", "purpose": "boot_from_san"},
+        ])
+
+    # Startup migrations run with FK enforcement on, as in production
+    async with engine.connect() as conn:
+        await conn.execute(text("PRAGMA foreign_keys=ON"))
+        yield conn
+
+    await engine.dispose()
+
+
+class TestRebuildLunNodeFk:
+    """Test rebuilding iscsi_luns with the SET NULL node constraint."""
+
+    @pytest.mark.asyncio
+    async def test_constraint_rebuilt(self, conn):
+        """assigned_node_id gets ON DELETE SET NULL and rows survive."""
+        assert await rebuild_lun_node_fk(conn) == 1
+
+        fks = (await conn.execute(text("PRAGMA foreign_key_list(iscsi_luns)"))).fetchall()
+        node_fk = next(row for row in fks if row[3] == "assigned_node_id")
+        assert node_fk[6] == "SET NULL"
+
+        rows = (await conn.execute(text(
+            "SELECT id, assigned_node_id FROM iscsi_luns ORDER BY id"
+        ))).fetchall()
+        assert rows == [("l1", "n1"), ("l2", None)]
+
+        await conn.execute(text("DELETE FROM nodes WHERE id = 'n1'"))
+        assert (await conn.execute(text(
+            "SELECT assigned_node_id FROM iscsi_luns WHERE id = 'l1'"
+        ))).scalar() is None
+
+    @pytest.mark.asyncio
+    async def test_rerun_is_noop(self, conn):
+        """A rebuilt table is left alone."""
+        await rebuild_lun_node_fk(conn)
+
+        assert await rebuild_lun_node_fk(conn) == 0
@@ -1,13 +1,17 @@
 """Tests for database models."""
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine, event, inspect, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.schema import CreateTable
 
 from src.db.models import (
     Base,
     Node,
+    NodeDiagnostics,
+    NodeEvent,
+    NodeStateLog,
     DeviceGroup,
-    NodeTag,
     Template,
     TemplateVersion,
     Workflow,
@@ -19,14 +23,26 @@ from src.db.models import (
     MigrationClaim,
     Approval,
     StorageBackend,
+    IscsiLun,
     FileChecksum,
+    RefreshToken,
+    User,
+    UserGroup,
+    has_tag,
+    tag_append,
+    tag_remove,
 )
+from src.db.queries import approvals_with_votes, user_groups_with_members
 
 
 @pytest.fixture
 def engine():
-    """Create in-memory SQLite engine."""
+    """Create in-memory SQLite engine with FK enforcement, as in production."""
     engine = create_engine("sqlite:///:memory:")
+    event.listen(
+        engine, "connect",
+        lambda conn, _: conn.execute("PRAGMA foreign_keys=ON"),
+    )
     Base.metadata.create_all(engine)
     return engine
 
@@ -80,6 +96,27 @@ class TestNodeModel:
         with pytest.raises(Exception):  # IntegrityError
             session.commit()
 
+    def test_mac_address_stored_as_bytes(self, session):
+        """MAC address is stored as 6 raw bytes and read back as text."""
+        node = Node(mac_address="00:11:22:33:44:55")
+        session.add(node)
+        session.commit()
+
+        raw = session.execute(text("SELECT mac_address FROM nodes")).scalar_one()
+        assert raw == bytes.fromhex("001122334455")
+
+        session.expire_all()
+        assert session.get(Node, node.id).mac_address == "00:11:22:33:44:55"
+
+    def test_pi_placeholder_mac_round_trips(self, session):
+        """Non-MAC placeholder identifiers survive the binary column."""
+        node = Node(mac_address="pi-10000000abcdef01")
+        session.add(node)
+        session.commit()
+
+        session.expire_all()
+        assert session.get(Node, node.id).mac_address == "pi-10000000abcdef01"
+
     def test_create_pi_node(self, session):
         """Create Raspberry Pi node with pi_model field."""
         node = Node(
@@ -139,6 +176,107 @@ class TestNodeModel:
         assert node.home_site.name == "us-east"
 
 
+class TestRelationshipLoading:
+    """Test model-level relationship loading strategies."""
+
+    def test_node_group_loaded_with_node(self, session):
+        """Node.group is selectin-loaded alongside the node."""
+        group = DeviceGroup(name="servers")
+        session.add(Node(mac_address="00:11:22:33:44:55", group=group))
+        session.commit()
+        session.expunge_all()
+
+        node = session.scalars(select(Node)).one()
+
+        assert "group" not in inspect(node).unloaded
+        assert node.group.name == "servers"
+
+    def test_event_node_not_loaded_by_default(self, session):
+        """Event queries do not pull in the parent node."""
+        node = Node(mac_address="00:11:22:33:44:55")
+        session.add(node)
+        session.flush()
+        session.add(NodeEvent(node_id=node.id, event_type="boot_started"))
+        session.commit()
+        session.expunge_all()
+
+        event = session.scalars(select(NodeEvent)).one()
+
+        assert "node" in inspect(event).unloaded
+
+    def test_query_helpers_load_collections(self, session):
+        """approvals_with_votes / user_groups_with_members eager-load."""
+        from datetime import datetime, timedelta
+
+        session.add(Approval(
+            action_type="bulk_retire",
+            action_data_json={},
+            operation_type="node.retire",
+            requester_name="alice",
+            expires_at=datetime.now() + timedelta(hours=1),
+        ))
+        session.add(UserGroup(name="ops"))
+        session.commit()
+        session.expunge_all()
+
+        approval = session.scalars(approvals_with_votes()).one()
+        group = session.scalars(user_groups_with_members()).one()
+
+        assert "votes" not in inspect(approval).unloaded
+        assert not {"members", "roles"} & inspect(group).unloaded
+
+
+class TestPassiveDeletes:
+    """Test child rows are removed by the database's FK actions."""
+
+    def test_node_delete_is_single_statement(self, session):
+        """Deleting a node doesn't load or delete its logs one by one."""
+        node = Node(mac_address="00:11:22:33:44:55")
+        session.add(node)
+        session.flush()
+        session.add_all(
+            [NodeEvent(node_id=node.id, event_type="heartbeat") for _ in range(3)]
+            + [NodeStateLog(node_id=node.id, from_state="discovered",
+                            to_state="pending", triggered_by="admin")]
+        )
+        session.commit()
+        node_id = node.id
+        session.expunge_all()
+
+        statements = []
+        event.listen(
+            session.get_bind(), "before_cursor_execute",
+            lambda conn, cursor, stmt, *args: statements.append(stmt),
+        )
+        session.delete(session.get(Node, node_id))
+        session.commit()
+
+        deletes = [s for s in statements if s.startswith("DELETE")]
+        assert deletes == ["DELETE FROM nodes WHERE nodes.id = ?"]
+        assert session.scalar(select(NodeEvent)) is None
+        assert session.scalar(select(NodeStateLog)) is None
+
+    def test_lun_unassigned_when_node_deleted(self, session):
+        """iscsi_luns.assigned_node_id is cleared, keeping the LUN."""
+        node = Node(mac_address="00:11:22:33:44:55")
+        backend = StorageBackend(name="san", type="iscsi", config_json={})
+        session.add_all([node, backend])
+        session.flush()
+        session.add(IscsiLun(
+            name="disk0", size_gb=10, backend_id=backend.id,
+            purpose="boot_from_san", iqn="iqn.2026-10.local:disk0",
+            assigned_node_id=node.id,
+        ))
+        session.commit()
+
+        session.delete(node)
+        session.commit()
+        session.expunge_all()
+
+        lun = session.scalars(select(IscsiLun)).one()
+        assert lun.assigned_node_id is None
+
+
 class TestDeviceGroupModel:
     """Test DeviceGroup model."""
 
@@ -171,55 +309,135 @@ class TestDeviceGroupModel:
         session.commit()
 
         assert node.group_id == group.id
+        session.refresh(group, ["nodes"])
         assert node in group.nodes
 
+    def test_group_nodes_not_lazy_loaded(self, session):
+        """DeviceGroup.nodes must be loaded explicitly."""
+        from sqlalchemy.exc import InvalidRequestError
+
+        session.add(DeviceGroup(name="webservers"))
+        session.commit()
+        session.expunge_all()
 
-class TestNodeTagModel:
-    """Test NodeTag model."""
+        group = session.scalars(select(DeviceGroup)).one()
+        with pytest.raises(InvalidRequestError):
+            group.nodes
 
-    def test_add_tag_to_node(self, session):
-        """Add tag to node."""
+        group = session.scalars(
+            select(DeviceGroup).options(selectinload(DeviceGroup.nodes))
+            .execution_options(populate_existing=True)
+        ).one()
+        assert group.nodes == []
+
+
+class TestNodeTags:
+    """Test Node.tags list column."""
+
+    def test_tags_default_empty(self, session):
+        """New nodes have no tags."""
         node = Node(mac_address="00:11:22:33:44:55")
-        tag = NodeTag(node=node, tag="production")
-        session.add(tag)
+        session.add(node)
         session.commit()
 
-        assert tag.id is not None
-        assert tag.tag == "production"
-        assert tag in node.tags
+        assert node.tags == []
 
     def test_node_can_have_multiple_tags(self, session):
-        """Node can have multiple tags."""
-        node = Node(mac_address="00:11:22:33:44:55")
-        tag1 = NodeTag(node=node, tag="production")
-        tag2 = NodeTag(node=node, tag="webserver")
-        session.add_all([tag1, tag2])
+        """Node tags round-trip as a list."""
+        node = Node(mac_address="00:11:22:33:44:55", tags=["production", "webserver"])
+        session.add(node)
         session.commit()
 
-        assert len(node.tags) == 2
+        session.expire_all()
+        assert session.get(Node, node.id).tags == ["production", "webserver"]
 
-    def test_same_tag_same_node_not_allowed(self, session):
-        """Same tag on same node not allowed."""
-        node = Node(mac_address="00:11:22:33:44:55")
-        tag1 = NodeTag(node=node, tag="production")
-        tag2 = NodeTag(node=node, tag="production")
-        session.add_all([tag1, tag2])
+    def test_reassigning_tags_persists(self, session):
+        """Assigning a new list updates the stored tags."""
+        node = Node(mac_address="00:11:22:33:44:55", tags=["production"])
+        session.add(node)
+        session.commit()
 
-        with pytest.raises(Exception):  # IntegrityError
-            session.commit()
+        node.tags = [*node.tags, "webserver"]
+        session.commit()
+
+        session.expire_all()
+        assert session.get(Node, node.id).tags == ["production", "webserver"]
 
-    def test_tags_deleted_with_node(self, session):
-        """Tags are deleted when node is deleted."""
+    def test_filter_by_tag(self, session):
+        """has_tag matches nodes whose tag list contains the tag."""
+        tagged = Node(mac_address="00:11:22:33:44:55", tags=["production", "web"])
+        other = Node(mac_address="00:11:22:33:44:66", tags=["staging"])
+        session.add_all([tagged, other])
+        session.commit()
+
+        matches = session.scalars(
+            select(Node).where(has_tag(Node.tags, "production"))
+        ).all()
+        misses = session.scalars(
+            select(Node).where(~has_tag(Node.tags, "production"))
+        ).all()
+
+        assert matches == [tagged]
+        assert misses == [other]
+
+    @pytest.mark.parametrize("dialect, default", [
+        (sqlite.dialect(), "tags JSON DEFAULT '[]' NOT NULL"),
+        (postgresql.dialect(), "tags TEXT[] DEFAULT '{}' NOT NULL"),
+    ])
+    def test_tags_server_default(self, dialect, default):
+        """Tag lists default to empty in the database, as in migration 009."""
+        for model in (Node, UserGroup):
+            ddl = str(CreateTable(model.__table__).compile(dialect=dialect))
+            assert default in ddl
+
+    def test_tag_append_and_remove_in_update(self, session):
+        """tag_append/tag_remove change the list inside the UPDATE."""
+        node = Node(mac_address="00:11:22:33:44:55", tags=["production"])
+        session.add(node)
+        session.commit()
+
+        session.execute(
+            update(Node).where(Node.id == node.id)
+            .values(tags=tag_append(Node.tags, "web"))
+        )
+        session.expire_all()
+        assert session.get(Node, node.id).tags == ["production", "web"]
+
+        session.execute(
+            update(Node).where(Node.id == node.id)
+            .values(tags=tag_remove(Node.tags, "production"))
+        )
+        session.expire_all()
+        assert session.get(Node, node.id).tags == ["web"]
+
+
+class TestNodeDiagnostics:
+    """Test NodeDiagnostics split from Node."""
+
+    def test_diagnostics_loaded_on_request(self, session):
+        """Install error text is stored separately and loaded explicitly."""
         node = Node(mac_address="00:11:22:33:44:55")
-        tag = NodeTag(node=node, tag="production")
-        session.add(tag)
+        session.add(node)
+        session.flush()
+        session.add(NodeDiagnostics(node_id=node.id, last_install_error="disk full"))
         session.commit()
+        session.expunge_all()
 
-        tag_id = tag.id
-        session.delete(node)
+        node = session.scalars(
+            select(Node).options(selectinload(Node.diagnostics))
+        ).one()
+        assert node.diagnostics.last_install_error == "disk full"
+
+    def test_diagnostics_not_lazy_loaded(self, session):
+        """Plain node fetches never touch node_diagnostics."""
+        node = Node(mac_address="00:11:22:33:44:55")
+        session.add(node)
         session.commit()
+        session.expunge_all()
 
-        assert session.get(NodeTag, tag_id) is None
+        node = session.scalars(select(Node)).one()
+        with pytest.raises(Exception):  # InvalidRequestError (lazy="raise")
+            node.diagnostics
 
 
 class TestDeviceGroupHierarchy:
@@ -602,7 +820,9 @@ class TestTemplateVersion:
         session.delete(template)
         session.flush()
 
-        assert session.get(TemplateVersion, version_id) is None
+        assert session.scalar(
+            select(TemplateVersion).where(TemplateVersion.id == version_id)
+        ) is None
 
     def test_template_version_optional_fields(self, session):
         """TemplateVersion optional fields work correctly."""
@@ -723,7 +943,7 @@ class TestWorkflowStep:
             sequence=1,
             name="Install OS",
             type="boot",
-            config_json='{"kernel": "/vmlinuz", "initrd": "/initrd"}',
+            config_json={"kernel": "/vmlinuz", "initrd": "/initrd"},
         )
         session.add(step)
         session.flush()
@@ -764,7 +984,7 @@ class TestWorkflowStep:
         session.add(step)
         session.flush()
 
-        assert step.config_json == "{}"
+        assert step.config_json == {}
         assert step.timeout_seconds == 3600
         assert step.on_failure == "fail"
         assert step.max_retries == 3
@@ -802,7 +1022,9 @@ class TestWorkflowStep:
         session.delete(workflow)
         session.flush()
 
-        assert session.get(WorkflowStep, step_id) is None
+        assert session.scalar(
+            select(WorkflowStep).where(WorkflowStep.id == step_id)
+        ) is None
 
     def test_workflow_step_relationship(self, session):
         """WorkflowStep has relationship to Workflow."""
@@ -1048,7 +1270,7 @@ class TestFileChecksumModel:
         backend = StorageBackend(
             name="test-nfs",
             type="nfs",
-            config_json='{"server": "nfs.local", "path": "/export"}',
+            config_json={"server": "nfs.local", "path": "/export"},
         )
         session.add(backend)
         session.flush()
@@ -1075,7 +1297,7 @@ class TestFileChecksumModel:
         backend = StorageBackend(
             name="test-nfs",
             type="nfs",
-            config_json='{"server": "nfs.local", "path": "/export"}',
+            config_json={"server": "nfs.local", "path": "/export"},
         )
         session.add(backend)
         session.flush()
@@ -1099,3 +1321,96 @@ class TestFileChecksumModel:
 
         with pytest.raises(Exception):  # IntegrityError
             session.commit()
+
+class TestPartialIndexes:
+    """Test partial indexes on live rows."""
+
+    def test_pending_approvals_index_used(self, session):
+        """Pending-approval expiry scans use the partial index."""
+        plan = session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT id FROM approvals "
+            "WHERE status = 'pending' AND expires_at < CURRENT_TIMESTAMP"
+        )).fetchall()
+
+        assert "ix_approvals_pending" in " ".join(row[-1] for row in plan)
+
+    def test_no_full_status_indexes(self, session):
+        """Status columns are no longer indexed over every value."""
+        names = {
+            row[0] for row in session.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            )
+        }
+
+        assert "ix_approvals_status" not in names
+        assert "ix_iscsi_luns_status" not in names
+
+    @pytest.mark.parametrize("column, index_name", [
+        ("state", "ix_nodes_state"),
+        ("group_id", "ix_nodes_group_id"),
+    ])
+    def test_node_filters_use_index(self, session, column, index_name):
+        """Node state and group filters are index lookups, not scans."""
+        plan = session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN SELECT id FROM nodes WHERE {column} = ?",
+            ("x",),
+        ).fetchall()
+
+        assert index_name in " ".join(row[-1] for row in plan)
+
+
+class TestAssociationTables:
+    """Test association table keys and reverse-direction indexes."""
+
+    def test_group_nodes_keyed_by_group(self):
+        """user_group_nodes is clustered by group, the UserGroup.nodes side."""
+        table = Base.metadata.tables["user_group_nodes"]
+
+        assert [c.name for c in table.primary_key.columns] == [
+            "user_group_id", "node_id"
+        ]
+
+    @pytest.mark.parametrize("table_name, column_name", [
+        ("role_permissions", "permission_id"),
+        ("user_group_members", "user_group_id"),
+        ("user_group_roles", "role_id"),
+        ("user_group_device_groups", "device_group_id"),
+        ("user_group_nodes", "node_id"),
+    ])
+    def test_reverse_lookup_uses_index(self, session, table_name, column_name):
+        """Lookups on the non-leading key column don't scan the table."""
+        plan = session.execute(text(
+            f"EXPLAIN QUERY PLAN SELECT * FROM {table_name} "
+            f"WHERE {column_name} = 'x'"
+        )).fetchall()
+
+        assert f"ix_{table_name}_{column_name}" in " ".join(row[-1] for row in plan)
+
+
+class TestRefreshTokenModel:
+    """Test RefreshToken hash storage."""
+
+    def test_token_hash_stored_as_digest(self, session):
+        """Refresh tokens are looked up by their 32-byte SHA-256 digest."""
+        from datetime import datetime, timedelta
+
+        from src.api.routes.auth import hash_refresh_token
+
+        user = User(username="alice", password_hash="x")
+        session.add(user)
+        session.flush()
+        token_hash = hash_refresh_token("opaque-token")
+        session.add(RefreshToken(
+            user_id=user.id,
+            token_hash=token_hash,
+            expires_at=datetime.now() + timedelta(days=1),
+        ))
+        session.commit()
+
+        assert len(token_hash) == 32
+        found = session.scalars(
+            select(RefreshToken).where(
+                RefreshToken.token_hash == hash_refresh_token("opaque-token")
+            )
+        ).one()
+        assert found.user_id == user.id
@@ -0,0 +1,30 @@
+"""Tests for the log partition maintenance job."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core import partition_job
+
+
+class TestEnsureLogPartitions:
+    """Test ensure_log_partitions dialect handling."""
+
+    @pytest.mark.asyncio
+    async def test_noop_on_sqlite(self):
+        """SQLite has no partitions, so nothing is executed."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        factory = async_sessionmaker(engine, class_=AsyncSession)
+
+        with patch.object(partition_job, "async_session_factory", factory), \
+                patch.object(AsyncSession, "execute", AsyncMock()) as execute:
+            await partition_job.ensure_log_partitions()
+
+        await engine.dispose()
+        execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_skips_without_session_factory(self):
+        """Job is a no-op before the database is initialized."""
+        with patch.object(partition_job, "async_session_factory", None):
+            await partition_job.ensure_log_partitions()
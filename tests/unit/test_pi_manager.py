@@ -67,6 +67,28 @@ class TestPiBootFileDetection:
         assert is_pi_boot_file("CONFIG.TXT")
 
 
+class TestValidateSerial:
+    """Tests for serial number validation."""
+
+    def test_valid_serials(self):
+        """Eight hex characters pass, in either case."""
+        from src.pxe.pi_manager import validate_serial
+
+        assert validate_serial("d83add36")
+        assert validate_serial("D83ADD36")
+        assert validate_serial("12345678")
+
+    def test_invalid_serials(self):
+        """Wrong length, non-hex and trailing newlines are rejected."""
+        from src.pxe.pi_manager import validate_serial
+
+        assert not validate_serial("d83add3")
+        assert not validate_serial("d83add369")
+        assert not validate_serial("d83addgg")
+        assert not validate_serial("d83add36\n")
+        assert not validate_serial("")
+
+
 class TestPiSerialRequestDetection:
     """Tests for Pi serial request detection."""
 
@@ -439,6 +461,22 @@ class TestPiManager:
         with pytest.raises(ValueError, match="Invalid serial"):
             manager.create_node_directory("ghijklmn", pi_model="pi4")
 
+    def test_unknown_model_lists_valid_models(self, temp_tftp_root):
+        """Unknown models are rejected by create and generate alike."""
+        from src.pxe.pi_manager import PiManager
+
+        manager = PiManager(
+            firmware_dir=temp_tftp_root / "rpi-firmware",
+            deploy_dir=temp_tftp_root / "deploy-arm64",
+            nodes_dir=temp_tftp_root / "pi-nodes",
+        )
+
+        with pytest.raises(ValueError, match="Valid models: pi3, pi3b\\+"):
+            manager.create_node_directory("d83add36", pi_model="pi2")
+        with pytest.raises(ValueError, match="Unknown Pi model: 'pi2'"):
+            manager.generate_config_txt("d83add36", pi_model="pi2")
+        assert not (temp_tftp_root / "pi-nodes" / "d83add36").exists()
+
     def test_symlinks_point_to_correct_files(self, temp_tftp_root):
         """Verify symlinks resolve to the correct firmware files."""
         from src.pxe.pi_manager import PiManager
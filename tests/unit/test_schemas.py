@@ -201,6 +201,20 @@ class TestNodeReport:
         report = NodeReport(mac_address="00-11-22-AA-BB-CC")
         assert report.mac_address == "00:11:22:aa:bb:cc"
 
+    def test_ipv6_normalized(self):
+        """IPv6 address normalized to canonical form."""
+        report = NodeReport(
+            mac_address="00:11:22:33:44:55",
+            ip_address="2001:0DB8:0000:0000:0000:0000:0000:0001",
+        )
+        assert report.ip_address == "2001:db8::1"
+
+    @pytest.mark.parametrize("ip", ["", "unknown", "not-an-ip"])
+    def test_unparsable_ip_becomes_none(self, ip):
+        """Placeholder or unparsable IP address is dropped, not rejected."""
+        report = NodeReport(mac_address="00:11:22:33:44:55", ip_address=ip)
+        assert report.ip_address is None
+
 
 class TestPiNodeSchemas:
     """Test Pi-specific node schema fields."""
@@ -392,6 +406,15 @@ class TestPiRegisterRequest:
         )
         assert request.ip_address == "192.168.1.100"
 
+    def test_unknown_ip_address(self):
+        """Deploy script's "unknown" fallback registers without an IP."""
+        request = PiRegisterRequest(
+            serial="d83add36",
+            mac="dc:a6:32:12:34:56",
+            ip_address="unknown",
+        )
+        assert request.ip_address is None
+
     def test_serial_required(self):
         """Serial is required."""
         with pytest.raises(ValidationError):
@@ -0,0 +1,142 @@
+"""Tests for database seeding."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.db import seed
+from src.db.models import Base, Permission, Role, UserGroup, role_permissions
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Async SQLite session with all tables created."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        yield session
+
+    await engine.dispose()
+
+
+async def _seed(db: AsyncSession) -> None:
+    perm_map = await seed.seed_permissions(db)
+    role_map = await seed.seed_roles(db, perm_map)
+    await seed.seed_user_groups(db, role_map)
+    await db.commit()
+
+
+async def _count(db: AsyncSession, target) -> int:
+    return await db.scalar(select(func.count()).select_from(target))
+
+
+class TestSeedRbac:
+    """Test permission, role and group seeding."""
+
+    @pytest.mark.asyncio
+    async def test_seeds_defaults(self, db):
+        """A fresh database gets every default permission, role and group."""
+        await _seed(db)
+
+        assert await _count(db, Permission) == len(seed.PERMISSIONS)
+        assert await _count(db, Role) == len(seed.ROLES)
+        assert await _count(db, UserGroup) == len(seed.USER_GROUPS)
+
+        admin = await db.scalar(select(Role).where(Role.name == "admin"))
+        admin_perms = await db.scalar(
+            select(func.count())
+            .select_from(role_permissions)
+            .where(role_permissions.c.role_id == admin.id)
+        )
+        assert admin_perms == len(seed.PERMISSIONS)
+
+    @pytest.mark.asyncio
+    async def test_role_gets_listed_permissions(self, db):
+        """Non-admin roles are linked to exactly their listed permissions."""
+        await _seed(db)
+
+        result = await db.execute(
+            select(Permission.resource, Permission.action)
+            .join(role_permissions)
+            .join(Role)
+            .where(Role.name == "auditor")
+        )
+
+        assert set(result.all()) == seed.ROLES["auditor"]["permissions"]
+
+    @pytest.mark.asyncio
+    async def test_rerun_is_idempotent(self, db):
+        """Seeding twice creates nothing new."""
+        await _seed(db)
+        links = await _count(db, role_permissions)
+
+        await _seed(db)
+
+        assert await _count(db, Permission) == len(seed.PERMISSIONS)
+        assert await _count(db, Role) == len(seed.ROLES)
+        assert await _count(db, role_permissions) == links
+
+    @pytest.mark.asyncio
+    async def test_rerun_grants_new_permissions_to_system_roles(self, db):
+        """Existing system roles pick up permissions they were never granted."""
+        await _seed(db)
+        links = await _count(db, role_permissions)
+        new_perm = await db.scalar(
+            select(Permission).where(
+                Permission.resource == "audit", Permission.action == "export"
+            )
+        )
+        await db.execute(
+            role_permissions.delete().where(
+                role_permissions.c.permission_id == new_perm.id
+            )
+        )
+        await db.commit()
+
+        await _seed(db)
+
+        assert await _count(db, role_permissions) == links
+
+    @pytest.mark.asyncio
+    async def test_fills_in_missing_permissions(self, db):
+        """Permissions added since the last seed are inserted."""
+        db.add(Permission(resource="node", action="read"))
+        await db.commit()
+
+        perm_map = await seed.seed_permissions(db)
+
+        assert set(perm_map) == {(r, a) for r, a, _ in seed.PERMISSIONS}
+
+    @pytest.mark.asyncio
+    async def test_custom_permissions_not_seeded_into_roles(self, db):
+        """Only the default permission set is looked up and granted."""
+        db.add(Permission(resource="plugin", action="run"))
+        await db.commit()
+
+        perm_map = await seed.seed_permissions(db)
+
+        assert ("plugin", "run") not in perm_map
+        assert len(perm_map) == len(seed.PERMISSIONS)
+
+
+class TestSeedDatabase:
+    """Test the seed_database entry point."""
+
+    @pytest.mark.asyncio
+    async def test_skips_when_seed_version_current(self, db):
+        """A second run stops after reading the stored seed version."""
+        factory = async_sessionmaker(db.bind, class_=AsyncSession)
+
+        with patch.object(seed, "init_db", AsyncMock()), \
+                patch.object(seed, "async_session_factory", factory), \
+                patch.object(seed, "hash_password", return_value="x"):
+            await seed.seed_database()
+            with patch.object(seed, "seed_permissions", AsyncMock()) as seed_perms:
+                await seed.seed_database()
+
+        seed_perms.assert_not_called()
+        assert await _count(db, Role) == len(seed.ROLES)
@@ -115,3 +115,28 @@ class TestAgentSettings:
 
         agent = AgentSettings()
         assert agent.registered is False
+
+
+class TestDatabaseSettings:
+    """Test database engine settings."""
+
+    def test_query_cache_size_applied(self):
+        """The engine's compiled statement cache uses the configured size."""
+        from src.config import settings
+        from src.db.database import engine
+
+        assert settings.database.query_cache_size == 1200
+        assert engine.sync_engine._compiled_cache.capacity == 1200
+
+    def test_pool_options_for_server_databases(self):
+        """PostgreSQL gets a sized, pre-pinged pool; SQLite keeps the default."""
+        from src.db.database import _pool_options
+
+        assert _pool_options("sqlite+aiosqlite:///./data/pureboot.db") == {}
+        assert _pool_options("postgresql+asyncpg://pureboot@db/pureboot") == {
+            "pool_size": 20,
+            "max_overflow": 10,
+            "pool_timeout": 30,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+        }
@@ -0,0 +1,135 @@
+"""Tests for serving the built React SPA."""
+import os
+
+import pytest
+from fastapi.responses import FileResponse
+from starlette.requests import Request
+
+import src.main as main
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    return Request({
+        "type": "http",
+        "headers": [
+            (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+        ],
+    })
+
+
+@pytest.fixture
+def assets(tmp_path, monkeypatch):
+    """Point the SPA handlers at a temporary build directory."""
+    root = tmp_path / "assets"
+    root.mkdir()
+    (root / "index.html").write_text("<html></html>")
+    (root / "app.js").write_text("console.log(1)")
+    (tmp_path / "secret.js").write_text("secret")
+
+    monkeypatch.setattr(main, "ASSETS_ROOT", root)
+    monkeypatch.setattr(main, "ASSETS_PREFIX", f"{root}{os.sep}")
+    monkeypatch.setattr(main, "INDEX_FILE", root / "index.html")
+    return root
+
+
+class TestServeSpa:
+    """Test the SPA root and catch-all handlers."""
+
+    @pytest.mark.asyncio
+    async def test_root_serves_index(self, assets):
+        """/ returns index.html."""
+        response = await main.serve_spa_root(_request())
+
+        assert isinstance(response, FileResponse)
+        assert response.path == assets / "index.html"
+
+    @pytest.mark.asyncio
+    async def test_existing_file_served(self, assets):
+        """A file in the build directory is returned as-is."""
+        response = await main.serve_spa_catchall(_request(), "app.js")
+
+        assert response.path == str(assets / "app.js")
+        assert response.stat_result.st_size == len("console.log(1)")
+
+    @pytest.mark.asyncio
+    async def test_directory_falls_back_to_index(self, assets):
+        """A directory in the build output is not served as a file."""
+        (assets / "nodes").mkdir()
+
+        response = await main.serve_spa_catchall(_request(), "nodes")
+
+        assert response.path == assets / "index.html"
+
+    @pytest.mark.asyncio
+    async def test_client_route_falls_back_to_index(self, assets):
+        """Unknown paths get index.html for client-side routing."""
+        response = await main.serve_spa_catchall(_request(), "nodes/abc")
+
+        assert response.path == assets / "index.html"
+
+    @pytest.mark.asyncio
+    async def test_traversal_not_served(self, assets):
+        """Paths escaping the build directory fall back to index.html."""
+        response = await main.serve_spa_catchall(_request(), "../secret.js")
+
+        assert response.path == assets / "index.html"
+
+    @pytest.mark.asyncio
+    async def test_sibling_prefix_not_served(self, assets, tmp_path):
+        """A sibling directory sharing the root's name prefix is outside it."""
+        (tmp_path / "assets-old").mkdir()
+        (tmp_path / "assets-old" / "app.js").write_text("old")
+
+        response = await main.serve_spa_catchall(_request(), "../assets-old/app.js")
+
+        assert response.path == assets / "index.html"
+
+    @pytest.mark.asyncio
+    async def test_api_paths_not_found(self, assets):
+        """Unmatched API paths are not answered with the SPA."""
+        response = await main.serve_spa_catchall(_request(), "api/v1/missing")
+
+        assert response == {"error": "Not found"}
+
+    @pytest.mark.asyncio
+    async def test_frontend_not_built(self, assets):
+        """Without index.html both handlers report the missing build."""
+        (assets / "index.html").unlink()
+
+        assert "error" in await main.serve_spa_root(_request())
+        assert "error" in await main.serve_spa_catchall(_request(), "nodes")
+
+    @pytest.mark.asyncio
+    async def test_index_revalidated_with_etag(self, assets):
+        """index.html carries an ETag and answers a matching revalidation with 304."""
+        response = await main.serve_spa_root(_request())
+        etag = response.headers["etag"]
+
+        assert response.headers["cache-control"] == "no-cache"
+
+        cached = await main.serve_spa_catchall(
+            _request({"If-None-Match": etag}), "nodes"
+        )
+
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
+
+class TestHashedStaticFiles:
+    """Test the /assets mount for Vite's fingerprinted bundles."""
+
+    def test_bundles_cached_immutable(self, tmp_path):
+        """Hashed bundles are served with a one-year immutable lifetime."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        (tmp_path / "index-abc123.js").write_text("console.log(1)")
+        app = FastAPI()
+        app.mount("/assets", main.HashedStaticFiles(directory=str(tmp_path)))
+
+        response = TestClient(app).get("/assets/index-abc123.js")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == (
+            "public, max-age=31536000, immutable"
+        )
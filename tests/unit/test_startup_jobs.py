@@ -0,0 +1,72 @@
+"""Tests for sync job re-registration on startup."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import src.main as main
+from src.db.models import Base, StorageBackend, SyncJob
+
+
+class TestRegisterScheduledJobs:
+    """Test _register_scheduled_jobs."""
+
+    @pytest.mark.asyncio
+    async def test_next_run_written_in_bulk(self, monkeypatch):
+        """Scheduled jobs get next_run_at; manual jobs are not scheduled."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with factory() as db:
+            backend = StorageBackend(name="nfs", type="nfs", config_json={})
+            db.add(backend)
+            await db.flush()
+            jobs = [
+                SyncJob(
+                    name=name,
+                    source_url="http://example.com",
+                    destination_backend_id=backend.id,
+                    destination_path="/",
+                    schedule=schedule,
+                )
+                for name, schedule in (
+                    ("a", "daily"), ("b", "hourly"), ("c", "manual"),
+                )
+            ]
+            db.add_all(jobs)
+            await db.commit()
+
+        next_run = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        scheduled = []
+
+        def schedule_job(job_id, schedule, schedule_day, schedule_time):
+            scheduled.append(job_id)
+            return next_run
+
+        monkeypatch.setattr(main, "async_session_factory", factory)
+        monkeypatch.setattr(main.sync_scheduler, "schedule_job", schedule_job)
+        await main._register_scheduled_jobs()
+
+        async with factory() as db:
+            rows = dict(
+                (await db.execute(select(SyncJob.name, SyncJob.next_run_at))).all()
+            )
+
+        await engine.dispose()
+        assert sorted(scheduled) == sorted(j.id for j in jobs[:2])
+        assert rows["a"] is not None and rows["b"] is not None
+        assert rows["c"] is None
+
+    @pytest.mark.asyncio
+    async def test_background_failure_logged(self, monkeypatch, caplog):
+        """A failing background re-registration is logged, not raised."""
+        async def fail():
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(main, "_register_scheduled_jobs", fail)
+        await main._register_scheduled_jobs_background()
+
+        assert "Failed to re-register scheduled sync jobs" in caplog.text
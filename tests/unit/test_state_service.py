@@ -0,0 +1,132 @@
+"""Tests for StateTransitionService install error handling."""
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.api.routes.nodes import node_install_failed_callback
+from src.api.schemas import NodeResponse
+from src.core.state_service import MAX_INSTALL_ATTEMPTS, StateTransitionService
+from src.db.models import Base, Node, NodeDiagnostics, NodeStateLog
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Async in-memory database session."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def node(db):
+    """Node in the installing state."""
+    node = Node(mac_address="00:11:22:33:44:55", state="installing")
+    db.add(node)
+    await db.flush()
+    return node
+
+
+class TestSetInstallError:
+    """Test set_install_error."""
+
+    @pytest.mark.asyncio
+    async def test_creates_diagnostics_row(self, db, node):
+        """First error creates the NodeDiagnostics row."""
+        await StateTransitionService.set_install_error(db, node, "disk full")
+        await db.flush()
+
+        diagnostics = await db.get(NodeDiagnostics, node.id)
+        assert diagnostics.last_install_error == "disk full"
+        assert NodeResponse.from_node(node).last_install_error == "disk full"
+
+    @pytest.mark.asyncio
+    async def test_updates_existing_row(self, db, node):
+        """Later errors overwrite the stored text."""
+        await StateTransitionService.set_install_error(db, node, "disk full")
+        await StateTransitionService.set_install_error(db, node, "no network")
+        await db.flush()
+
+        rows = (await db.execute(select(NodeDiagnostics))).scalars().all()
+        assert [r.last_install_error for r in rows] == ["no network"]
+
+    @pytest.mark.asyncio
+    async def test_clear_without_row_is_noop(self, db, node):
+        """Clearing an error never recorded does not create a row."""
+        await StateTransitionService.set_install_error(db, node, None)
+        await db.flush()
+
+        assert await db.get(NodeDiagnostics, node.id) is None
+
+    @pytest.mark.asyncio
+    async def test_clear_existing_error(self, db, node):
+        """Clearing keeps the row but drops the text."""
+        await StateTransitionService.set_install_error(db, node, "disk full")
+        await StateTransitionService.set_install_error(db, node, None)
+        await db.flush()
+
+        assert (await db.get(NodeDiagnostics, node.id)).last_install_error is None
+
+
+class TestHandleInstallFailure:
+    """Test handle_install_failure retry logic."""
+
+    @pytest.mark.asyncio
+    async def test_retry_keeps_installing(self, db, node):
+        """Failures below the limit record the error and keep the state."""
+        await StateTransitionService.handle_install_failure(db, node, "disk full")
+
+        assert node.state == "installing"
+        assert node.install_attempts == 1
+        assert node.diagnostics.last_install_error == "disk full"
+
+    @pytest.mark.asyncio
+    async def test_max_attempts_transitions(self, db, node):
+        """Reaching the limit moves the node to install_failed and logs it."""
+        node.install_attempts = MAX_INSTALL_ATTEMPTS - 1
+
+        await StateTransitionService.handle_install_failure(db, node, "disk full")
+        await db.flush()
+
+        assert node.state == "install_failed"
+        log = (await db.execute(select(NodeStateLog))).scalar_one()
+        assert log.to_state == "install_failed"
+        assert log.metadata_json["error"] == "disk full"
+
+    @pytest.mark.asyncio
+    async def test_callback_response_reports_error(self, db, node):
+        """The install-failed callback returns the error it just recorded."""
+        request = AsyncMock()
+        request.json.return_value = {"error": "disk full"}
+
+        response = await node_install_failed_callback(node.id, request, db)
+
+        assert response.data.last_install_error == "disk full"
+
+
+class TestNodeResponseDiagnostics:
+    """Test NodeResponse reading Node.diagnostics."""
+
+    @pytest.mark.asyncio
+    async def test_unloaded_diagnostics_raise(self, db, node):
+        """A node fetched without diagnostics fails instead of reporting none."""
+        with pytest.raises(InvalidRequestError):
+            NodeResponse.from_node(node)
+
+    @pytest.mark.asyncio
+    async def test_get_with_diagnostics(self, db, node):
+        """get_with_diagnostics loads the stored error for the response."""
+        db.add(NodeDiagnostics(node_id=node.id, last_install_error="disk full"))
+        await db.flush()
+
+        loaded = await Node.get_with_diagnostics(db, node.id)
+
+        assert NodeResponse.from_node(loaded).last_install_error == "disk full"